@@ -3,8 +3,9 @@
 
 import sys
 try:
-    from src import config_parser, output_maze, MazeView, user_input_choice
-    from mazegen import MazeGenerator
+    # 描画とメニュー（MazeView, user_input_choice）は対話モードでだけ読み込む
+    from src import config_parser, output_maze
+    from mazegen import MazeGenerator, MazeCache
 except ImportError as e:
     print(f"ImportError: {e}")
     sys.exit(1)
@@ -12,14 +13,41 @@ except Exception as e:
     print(f"Error: {e}")
     sys.exit(1)
 
+# 迷路を出力したところで終了するオプション
+NO_INTERACTIVE = "--no-interactive"
+# 複数の迷路を一括で生成するオプション（最初の引数にだけ指定できる）
+BATCH = "--batch"
+
 
 def a_maze_ing() -> None:
-    """迷路を生成し、最短経路と共にテキストファイルで出力する."""
-    conf = config_parser(sys.argv)
-    generator = MazeGenerator(conf)
+    """迷路を生成し、最短経路と共にテキストファイルで出力する.
+
+    `--no-interactive` を付けると、出力したところで終了する
+    （描画やメニューのモジュールは読み込まない）。
+    `--batch` で始めると、複数の設定やシードの迷路を一括で生成する
+    （src/batch.py を参照）。
+    """
+    if sys.argv[1:2] == [BATCH]:
+        from src import batch_main
+        batch_main(sys.argv[2:])
+        return
+
+    interactive = NO_INTERACTIVE not in sys.argv[1:]
+    conf = config_parser([arg for arg in sys.argv if arg != NO_INTERACTIVE])
+    if not interactive:
+        generator = MazeGenerator(conf)
+        generator.generate()
+        output_maze(generator)
+        return
+
+    from src import MazeView, user_input_choice
+    # 同じ設定の迷路（PERFECTの切り替えなど）は再生成せずに復元する
+    generator = MazeGenerator(conf, cache=MazeCache())
     generator.generate()
 
     view = MazeView(generator)
+    # 端末に収まらない大きな迷路は縮小した全体図で表示する
+    view.fit_to_terminal()
     output_maze(generator)
     user_input_choice(generator, view)
 
@@ -27,5 +55,9 @@ def a_maze_ing() -> None:
 if __name__ == "__main__":
     try:
         a_maze_ing()
+    except ValueError as e:
+        # ENTRY/EXITが'42'と重なる場合など、設定を直す必要がある
+        print(f"ValueError: {e}")
+        sys.exit(1)
     except Exception as e:
         print(f"Error: {e}")
@@ -0,0 +1 @@
+"""A-Maze-ing benchmarks package."""
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""設定（MazeConfig）と生成器の作成にかかる時間を計測するベンチマーク.
+
+実行方法: python -m benchmarks.bench_config
+"""
+
+import contextlib
+import io
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from mazegen import MazeGenerator
+from mazegen.generator import MazeConfig
+
+COUNT = 2000
+
+
+def _per_call(func: Callable[[int], object]) -> float:
+    """COUNT回実行して1回あたりの時間（マイクロ秒）を返します."""
+    start = time.perf_counter()
+    for i in range(COUNT):
+        func(i)
+    return (time.perf_counter() - start) / COUNT * 1e6
+
+
+def main() -> None:
+    """通常の検証 / DEFER_FILE_CHECK / 凍結した設定の使い回し を比較します."""
+    with tempfile.TemporaryDirectory() as tmp:
+        conf: dict[str, Any] = {"WIDTH": 20, "HEIGHT": 15, "EXIT": (19, 14),
+                                "OUTPUT_FILE": Path(tmp) / "maze.txt"}
+        deferred = {**conf, "DEFER_FILE_CHECK": True}
+        frozen = MazeConfig(**conf).freeze()
+
+        def generator(i: int) -> MazeGenerator:
+            # 設定の表示はベンチマークの出力から除く
+            with contextlib.redirect_stdout(io.StringIO()):
+                return MazeGenerator({**conf, "SEED": i % 1000})
+
+        results = [
+            ("MazeConfig", _per_call(
+                lambda i: MazeConfig(**conf, SEED=i % 1000))),
+            ("deferred", _per_call(
+                lambda i: MazeConfig(**deferred, SEED=i % 1000))),
+            ("with_seed", _per_call(lambda i: frozen.with_seed(i % 1000))),
+            ("MazeGenerator", _per_call(generator)),
+            ("from_config", _per_call(
+                lambda i: MazeGenerator.from_config(
+                    frozen.with_seed(i % 1000)))),
+        ]
+
+    print(f"{'constructor':>14} {'time':>10}")
+    for name, elapsed in results:
+        print(f"{name:>14} {elapsed:>8.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""起動時のモジュール読み込み時間を `python -X importtime` で計測するベンチマーク.
+
+実行方法: python -m benchmarks.bench_import
+"""
+
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+RUNS = 5
+# 読み込み時間の内訳として表示するモジュールの数
+TOP = 5
+
+
+def _importtime(args: list[str]) -> tuple[float, float, dict[str, int]]:
+    """Pythonを新しいプロセスで実行し、読み込み時間を集計します.
+
+    Args:
+        args (list[str]): python に渡す引数.
+
+    Returns:
+        tuple: (プロセス全体の時間[ms], 読み込みの合計[ms],
+            モジュールごとの読み込み時間[us]（子モジュールを含む）).
+    """
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", *args],
+                            cwd=ROOT, capture_output=True, text=True,
+                            check=True)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    total = 0
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # 字下げのない行が、直接読み込まれたモジュール
+        if not name.startswith("  "):
+            total += int(cumulative)
+        modules[name.strip()] = int(cumulative)
+    return elapsed, total / 1000, modules
+
+
+def main() -> None:
+    """読み込むモジュールの組み合わせごとに、読み込み時間の中央値を表示します."""
+    with tempfile.TemporaryDirectory() as tmp:
+        config = Path(tmp) / "config.txt"
+        config.write_text("WIDTH=20\nHEIGHT=15\nENTRY=0,0\nEXIT=19,14\n"
+                          f"OUTPUT_FILE={Path(tmp) / 'maze.txt'}\n"
+                          "PERFECT=True\n")
+        scenarios = [
+            ("mazegen", ["-c", "import mazegen"]),
+            ("headless", ["-c", "from src import config_parser, "
+                                "output_maze"]),
+            ("interactive", ["-c", "from src import MazeView, "
+                                   "user_input_choice"]),
+            ("--no-interactive", ["a_maze_ing.py", "--no-interactive",
+                                  str(config)]),
+        ]
+
+        print(f"{'scenario':>18} {'process':>10} {'imports':>10}")
+        heaviest: dict[str, int] = {}
+        for name, args in scenarios:
+            runs = [_importtime(args) for _ in range(RUNS)]
+            process = statistics.median(run[0] for run in runs)
+            imports = statistics.median(run[1] for run in runs)
+            print(f"{name:>18} {process:>8.1f}ms {imports:>8.1f}ms")
+            if name == "--no-interactive":
+                heaviest = runs[-1][2]
+
+    print(f"\nheaviest imports of --no-interactive (top {TOP}):")
+    # 親パッケージと重複しないよう、最上位のパッケージ名ごとに最大値を取る
+    packages: dict[str, int] = {}
+    for module, cumulative in heaviest.items():
+        package = module.split(".")[0]
+        packages[package] = max(packages.get(package, 0), cumulative)
+    ranking = sorted(packages.items(), key=lambda item: -item[1])
+    for package, cumulative in ranking[:TOP]:
+        print(f"{package:>18} {cumulative / 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""迷路ファイルの読み込みと再生成の速度を比較するベンチマーク.
+
+実行方法: python -m benchmarks.bench_load
+"""
+
+import contextlib
+import io
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from mazegen import MazeGenerator
+from src import load_maze, output_maze
+
+SIZES = [42, 200, 500, 1000]
+REPEAT = 3
+
+
+def _best_of(func: Callable[[], object]) -> float:
+    """REPEAT回実行して最も速かった時間（秒）を返します."""
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """サイズごとに 再生成 / 読み込み(経路検証) / 読み込み(経路再探索) を計測します."""
+    print(f"{'size':>10} {'generate':>10} {'load':>10} {'load+BFS':>10}"
+          f" {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in SIZES:
+            path = Path(tmp) / f"maze_{n}.txt"
+            conf = {"WIDTH": n, "HEIGHT": n, "EXIT": (n - 1, n - 1),
+                    "LARGE": True, "PERFECT": False, "OUTPUT_FILE": path}
+            # 設定の表示や警告はベンチマークの出力から除く
+            with contextlib.redirect_stdout(io.StringIO()):
+                generator = MazeGenerator(conf)
+                generator.generate()
+                output_maze(generator)
+
+                gen_time = _best_of(generator.generate)
+                load_time = _best_of(lambda: load_maze(path))
+                bfs_time = _best_of(lambda: load_maze(path, use_way=False))
+
+            print(f"{f'{n}x{n}':>10} {gen_time * 1000:>8.1f}ms"
+                  f" {load_time * 1000:>8.1f}ms {bfs_time * 1000:>8.1f}ms"
+                  f" {gen_time / load_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
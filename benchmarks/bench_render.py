@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""MazeView の描画速度（FPS）を計測するベンチマーク.
+
+実行方法: python -m benchmarks.bench_render
+"""
+
+import contextlib
+import io
+import time
+from collections.abc import Callable
+from mazegen import MazeGenerator
+from src import MazeView
+
+SIZES = [(20, 15), (42, 42), (100, 100), (200, 200)]
+# ビューポート表示の範囲（グリッドのセル数）
+VIEWPORT = (80, 40)
+FRAMES = 20
+
+
+def _fps(func: Callable[[], object]) -> float:
+    """FRAMES回実行して1秒あたりの実行回数を返します."""
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        func()
+    return FRAMES / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """サイズごとに 描画 / 経路切替 / 色替え / ビューポート / 全体図 のFPSを計測します."""
+    print(f"{'size':>10} {'draw':>10} {'toggle':>10} {'recolor':>10}"
+          f" {'viewport':>10} {'overview':>10}")
+    for w, h in SIZES:
+        conf = {"WIDTH": w, "HEIGHT": h, "EXIT": (w - 1, h - 1),
+                "LARGE": True, "PERFECT": False}
+        out = io.StringIO()
+        # 設定の表示や描画結果はベンチマークの出力から除く
+        with contextlib.redirect_stdout(out):
+            generator = MazeGenerator(conf)
+            generator.generate()
+            view = MazeView(generator, diff=False)
+            view.draw()
+
+            def toggle() -> None:
+                view.toggle_path()
+                view.draw()
+
+            colors = iter(range(10 ** 9))
+
+            def recolor() -> None:
+                view.set_wall_color(31 + next(colors) % 7)
+                view.draw()
+
+            draw_fps = _fps(view.draw)
+            toggle_fps = _fps(toggle)
+            recolor_fps = _fps(recolor)
+            view.set_viewport(*VIEWPORT)
+            view.center(w, h)
+            viewport_fps = _fps(view.draw)
+            view.set_overview()
+            overview_fps = _fps(view.draw)
+            out.seek(0)
+            out.truncate()
+
+        print(f"{f'{w}x{h}':>10} {draw_fps:>6.0f}fps"
+              f" {toggle_fps:>6.0f}fps {recolor_fps:>6.0f}fps"
+              f" {viewport_fps:>6.0f}fps {overview_fps:>6.0f}fps")
+
+
+if __name__ == "__main__":
+    main()
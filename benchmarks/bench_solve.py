@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""最短経路の探索方法（BFS / 双方向BFS / A*）を比較するベンチマーク.
+
+実行方法: python -m benchmarks.bench_solve
+"""
+
+import contextlib
+import io
+import time
+from mazegen import MazeGenerator
+from mazegen.generator import SOLVERS
+
+SIZES = [42, 200, 500]
+SEEDS = range(1, 11)
+
+
+def main() -> None:
+    """サイズとPERFECTごとに、各探索方法の時間と展開したセル数の平均を計測します."""
+    print(f"{'size':>10} {'perfect':>8} {'solver':>14} {'time':>9}"
+          f" {'expanded':>10} {'length':>7}")
+    for n in SIZES:
+        for perfect in (True, False):
+            conf = {"WIDTH": n, "HEIGHT": n, "EXIT": (n - 1, n - 1),
+                    "LARGE": True, "PERFECT": perfect}
+            # 設定の表示や警告はベンチマークの出力から除く
+            with contextlib.redirect_stdout(io.StringIO()):
+                generator = MazeGenerator(conf)
+                mazes = []
+                for seed in SEEDS:
+                    generator.seed = seed
+                    generator.generate()
+                    mazes.append(b"".join(generator.maze))
+
+            for solver in SOLVERS:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    generator.solver = solver
+                elapsed = 0.0
+                expanded = 0
+                length = 0
+                for maze in mazes:
+                    generator.load_maze(maze)
+                    start = time.perf_counter()
+                    generator._find_path()
+                    elapsed += time.perf_counter() - start
+                    expanded += generator.expanded
+                    length += len(generator.way)
+                k = len(mazes)
+                print(f"{f'{n}x{n}':>10} {str(perfect):>8} {solver:>14}"
+                      f" {elapsed / k * 1000:>7.2f}ms {expanded // k:>10}"
+                      f" {length // k:>7}")
+
+
+if __name__ == "__main__":
+    main()
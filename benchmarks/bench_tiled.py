@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""タイル分割による並列生成が、コア数に対してどう伸びるかを計測するベンチマーク.
+
+実行方法: python -m benchmarks.bench_tiled
+"""
+
+import contextlib
+import io
+import os
+import time
+from mazegen import MazeGenerator
+
+SIZE = 1000
+TILE = 250
+
+
+def main() -> None:
+    """穴掘り法(generate)と、ワーカー数ごとの generate_tiled の時間を計測します."""
+    cpus = os.cpu_count() or 1
+    workers = sorted({1, 2, 4, cpus} | {n for n in (8, 16) if n <= cpus})
+    conf = {"WIDTH": SIZE, "HEIGHT": SIZE, "EXIT": (SIZE - 1, SIZE - 1),
+            "LARGE": True}
+    # 設定の表示や警告はベンチマークの出力から除く
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator = MazeGenerator(conf)
+
+    start = time.perf_counter()
+    generator.generate()
+    dfs_time = time.perf_counter() - start
+    print(f"{SIZE}x{SIZE}, tile {TILE}, {cpus} CPU(s)")
+    print(f"{'mode':>12} {'time':>9} {'speedup':>8}")
+    print(f"{'generate':>12} {dfs_time:>8.2f}s {1:>7.2f}x")
+
+    for n in workers:
+        start = time.perf_counter()
+        generator.generate_tiled(TILE, workers=n)
+        elapsed = time.perf_counter() - start
+        print(f"{f'tiled x{n}':>12} {elapsed:>8.2f}s"
+              f" {dfs_time / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""迷路生成の各段階を個別に計測し、ベースラインと比較するベンチマーク.
+
+計測する段階:
+    carve   迷路の初期化と穴掘り (_init_maze, _carve -> _generate_maze)
+    break   壁崩し (_break_the_wall, PERFECT=False の場合のみ)
+    grid    描画用グリッドへの展開 (_convert_hex_maze_to_grid)
+    solve   最短経路の探索 (_find_path)
+    draw    端末への描画 (MazeView.draw, 出力はメモリに捨てる)
+    output  ファイルへの書き出し (output_maze)
+
+サイズ x シード x PERFECT の組み合わせごとに、時間（REPEAT回以上の中央値の
+シード平均）、ピークメモリ（tracemalloc）、1秒あたりのセル数を求めて
+JSONに保存する。ベースラインを指定すると、閾値を超えて遅く（または
+メモリを多く使うように）なった段階を表示し、終了コード1で終わる。
+時間は、閾値の割合に加えて MIN_SLOWDOWN 秒以上遅くなった場合だけを
+退行とみなす（1ms未満の段階は揺れだけで数十%変わるため）。
+
+実行方法:
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --baseline baseline.json --threshold 0.2 \
+        --min-slowdown 1.0
+    make bench / make bench-baseline
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from mazegen import MazeGenerator
+from mazegen.generator import MazeConfig
+from mazegen.storage import HAS_NUMPY
+from src import MazeView, output_maze
+
+SIZES = [(20, 15), (42, 42), (100, 100)]
+SEEDS = [1, 2, 3]
+REPEAT = 15
+# 短い段階は、合計がMIN_TIME秒になるまで（最大MAX_REPEAT回）繰り返す
+MIN_TIME = 0.05
+MAX_REPEAT = 200
+# --quick で使う小さな組み合わせ
+QUICK_SIZES = [(20, 15), (42, 42)]
+QUICK_SEEDS = [1]
+# ベースラインより何割遅くなったら退行とみなすか
+THRESHOLD = 0.2
+# 割合が閾値を超えても、遅くなった時間がこれ未満（秒）なら退行とみなさない
+MIN_SLOWDOWN = 0.001
+
+# 計測に使う段階の関数: (準備, 計測対象)
+Stage = tuple[Callable[[], object], Callable[[], object]]
+
+
+def _measure(setup: Callable[[], object],
+             func: Callable[[], object]) -> tuple[float, int]:
+    """準備をしてから計測対象を実行し、時間の中央値とピークメモリを返します.
+
+    1ms未満の段階は揺れが大きいため、REPEAT回に加えて合計がMIN_TIME秒に
+    なるまで繰り返し、その中央値を使う（最小値は1回だけ速かった実行に
+    引きずられ、ベースラインと比べた時の揺れが大きくなる）。
+    timeit と同じく、計測中はガベージコレクションを止める。
+    tracemalloc は実行を遅くするため、時間とは別に1回だけ実行して測る。
+
+    Returns:
+        tuple: (時間の中央値[秒], ピークメモリ[バイト]).
+    """
+    times: list[float] = []
+    spent = 0.0
+    while len(times) < REPEAT or (spent < MIN_TIME
+                                  and len(times) < MAX_REPEAT):
+        setup()
+        gc.disable()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        times.append(elapsed)
+        spent += elapsed
+
+    setup()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(times), peak
+
+
+def _stages(generator: MazeGenerator, seed: int) -> dict[str, Stage]:
+    """1つの迷路について、段階ごとの (準備, 計測対象) を返します."""
+    def carve() -> None:
+        generator._rng.seed(seed)
+        generator._init_maze()
+        generator._carve()
+
+    def solved() -> None:
+        generator.generate()
+        generator.path
+
+    views: list[MazeView] = []
+
+    def new_view() -> None:
+        # 行のキャッシュを持たない新しいビューで毎回描画する
+        solved()
+        views[:] = [MazeView(generator, diff=False)]
+
+    stages: dict[str, Stage] = {
+        "carve": (lambda: None, carve),
+    }
+    if not generator.perfect:
+        # 壁崩しの直前の状態（乱数も穴掘りの後の状態）に戻してから計測する
+        stages["break"] = (carve, generator._break_the_wall)
+    stages.update({
+        "grid": (solved, generator._convert_hex_maze_to_grid),
+        "solve": (generator.generate, generator._find_path),
+        "draw": (new_view, lambda: views[0].draw()),
+        "output": (solved, lambda: output_maze(generator)),
+    })
+    return stages
+
+
+def run(sizes: list[tuple[int, int]], seeds: list[int]) -> dict[str, Any]:
+    """すべての組み合わせを計測し、JSONに保存する形の結果を返します."""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for width, height in sizes:
+            for perfect in (True, False):
+                conf = MazeConfig(WIDTH=width, HEIGHT=height,
+                                  EXIT=(width - 1, height - 1), LARGE=True,
+                                  PERFECT=perfect, DEFER_FILE_CHECK=True,
+                                  OUTPUT_FILE=Path(tmp) / "maze.txt").freeze()
+                totals: dict[str, list[float]] = {}
+                peaks: dict[str, int] = {}
+                for seed in seeds:
+                    generator = MazeGenerator.from_config(
+                        conf.with_seed(seed))
+                    # 警告や描画の出力は捨てる
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        for name, (setup, func) in _stages(
+                                generator, seed).items():
+                            elapsed, peak = _measure(setup, func)
+                            totals.setdefault(name, []).append(elapsed)
+                            peaks[name] = max(peaks.get(name, 0), peak)
+
+                for name, times in totals.items():
+                    elapsed = sum(times) / len(times)
+                    results.append({
+                        "stage": name, "width": width, "height": height,
+                        "perfect": perfect, "time": elapsed,
+                        "peak": peaks[name],
+                        "cells_per_sec": width * height / elapsed,
+                    })
+                    _print_row(results[-1])
+    return {
+        "meta": {"python": platform.python_version(),
+                 "platform": platform.platform(), "numpy": HAS_NUMPY,
+                 "repeat": REPEAT, "seeds": seeds},
+        "results": results,
+    }
+
+
+def _key(row: dict[str, Any]) -> tuple[str, int, int, bool]:
+    """ベースラインと対応させるためのキーを返します."""
+    return row["stage"], row["width"], row["height"], row["perfect"]
+
+
+def _print_row(row: dict[str, Any], note: str = "") -> None:
+    """1つの計測結果を表示します."""
+    size = f"{row['width']}x{row['height']}"
+    print(f"{row['stage']:>7} {size:>9} {str(row['perfect']):>7}"
+          f" {row['time'] * 1000:>9.3f}ms {row['peak'] / 1024:>9.1f}KiB"
+          f" {row['cells_per_sec'] / 1e6:>8.2f}M/s {note}".rstrip())
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any],
+            threshold: float,
+            min_slowdown: float = MIN_SLOWDOWN) -> list[str]:
+    """ベースラインと比べて、閾値を超えて悪化した項目の説明を返します.
+
+    Args:
+        current (dict): 今回の結果.
+        baseline (dict): 保存されていたベースライン.
+        threshold (float): 許容する悪化の割合（0.2なら20%まで）.
+        min_slowdown (float): 時間の退行とみなす、遅くなった時間の
+            最小値（秒）. 短い段階の揺れを退行と報告しないためのもの.
+
+    Returns:
+        list[str]: 退行した項目の説明（なければ空のリスト）.
+    """
+    base = {_key(row): row for row in baseline["results"]}
+    regressions = []
+    print(f"\ncompared with baseline (threshold {threshold:.0%}, "
+          f"at least {min_slowdown * 1000:g}ms slower):")
+    for row in current["results"]:
+        old = base.get(_key(row))
+        if old is None:
+            continue
+        time_ratio = row["time"] / old["time"]
+        peak_ratio = row["peak"] / old["peak"] if old["peak"] else 1.0
+        slower = min_slowdown <= row["time"] - old["time"]
+        worse = [f"{label} {ratio - 1:+.0%}"
+                 for label, ratio, enough in (("time", time_ratio, slower),
+                                              ("memory", peak_ratio, True))
+                 if enough and 1 + threshold < ratio]
+        _print_row(row, f"time {time_ratio - 1:+.0%}, memory "
+                   f"{peak_ratio - 1:+.0%}"
+                   + ("  <-- REGRESSION" if worse else ""))
+        if worse:
+            size = f"{row['width']}x{row['height']}"
+            regressions.append(f"{row['stage']} {size} perfect="
+                               f"{row['perfect']}: {', '.join(worse)}")
+    return regressions
+
+
+def main() -> None:
+    """引数に従って計測し、結果の保存とベースラインとの比較を行います."""
+    parser = argparse.ArgumentParser(
+        description="迷路生成の各段階を計測し、ベースラインと比較します")
+    parser.add_argument("--output", type=Path,
+                        help="結果を保存するJSONファイル")
+    parser.add_argument("--baseline", type=Path,
+                        help="比較するベースラインのJSONファイル")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="退行とみなす悪化の割合 (デフォルト: 0.2)")
+    parser.add_argument("--min-slowdown", type=float,
+                        default=MIN_SLOWDOWN * 1000,
+                        help="時間の退行とみなす、遅くなった時間の最小値"
+                        "[ms] (デフォルト: 1.0)")
+    parser.add_argument("--quick", action="store_true",
+                        help="小さな組み合わせだけを計測する")
+    args = parser.parse_args()
+
+    print(f"{'stage':>7} {'size':>9} {'perfect':>7} {'time':>11}"
+          f" {'peak':>12} {'cells':>10}")
+    if args.quick:
+        current = run(QUICK_SIZES, QUICK_SEEDS)
+    else:
+        current = run(SIZES, SEEDS)
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(current, indent=2) + "\n")
+        print(f"\nresults saved to {args.output}")
+
+    if args.baseline is None:
+        return
+    if not args.baseline.exists():
+        print(f"\nbaseline {args.baseline} not found "
+              "(create it with 'make bench-baseline')")
+        return
+    regressions = compare(current, json.loads(args.baseline.read_text()),
+                          args.threshold, args.min_slowdown / 1000)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s):")
+        for line in regressions:
+            print(f"    - {line}")
+        sys.exit(1)
+    print("\nno regressions")
+
+
+if __name__ == "__main__":
+    main()
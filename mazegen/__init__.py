@@ -1,5 +1,11 @@
 """Maze generator package."""
 
 from .generator import MazeGenerator as MazeGenerator
+from .generator import MazeResult as MazeResult
+from .generator import MazeEvent as MazeEvent
+from .cache import MazeCache as MazeCache
+from .oracle import DistanceOracle as DistanceOracle
+from .stats import GenerationStats as GenerationStats
 
-__all__ = ["MazeGenerator"]
+__all__ = ["MazeGenerator", "MazeResult", "MazeEvent", "MazeCache",
+           "DistanceOracle", "GenerationStats"]
@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+"""穴掘り法（DFS）以外の迷路生成アルゴリズムを集めたモジュール.
+
+Eller / Sidewinder - 1行ずつ迷路を確定させる（状態は O(width)）
+Kruskal / Wilson / Prim - 迷路全体のバッファを直接掘る
+
+どのアルゴリズムも '42' ロゴのマスク（1のセル）には立ち入らず、
+ロゴ以外のすべてのセルを1本の木（完全迷路）としてつなぐ。
+壁ビットは MazeGenerator と同じく 1:北, 2:東, 4:南, 8:西。
+"""
+
+import random
+from array import array
+from collections.abc import Callable, Iterator
+
+# 選択できる生成アルゴリズム（dfsは MazeGenerator._generate_maze）
+ALGORITHMS = ("dfs", "eller", "sidewinder", "kruskal", "wilson", "prim")
+# 1行ずつ迷路を確定させるアルゴリズム
+STREAMING = ("eller", "sidewinder")
+
+# 42のビットマップ (1:壁, 0:通路)
+LOGO = ((1, 0, 0, 0, 1, 1, 1),
+        (1, 0, 0, 0, 0, 0, 1),
+        (1, 1, 1, 0, 1, 1, 1),
+        (0, 0, 1, 0, 1, 0, 0),
+        (0, 0, 1, 0, 1, 1, 1))
+
+# 掘った通路 (x, y, nx, ny)
+Carve = tuple[int, int, int, int]
+# y行目のマスク（1のセルには立ち入らない）を返す関数
+RowMask = Callable[[int], bytes]
+
+
+def logo_origin(width: int, height: int) -> tuple[int, int] | None:
+    """'42'ロゴの左上のセル座標を返します（迷路が小さすぎる場合はNone）."""
+    if 8 < width and 6 < height:
+        return (width - len(LOGO[0])) // 2, (height - len(LOGO)) // 2
+    return None
+
+
+def logo_mask(width: int, height: int) -> RowMask:
+    """'42'ロゴのセルを1とする、行ごとのマスクを返す関数を作成します.
+
+    迷路全体のマスクは作らず、行ごとに width バイトだけを作る。
+
+    Args:
+        width (int): 迷路の幅.
+        height (int): 迷路の高さ.
+
+    Returns:
+        RowMask: y を受け取り、その行のマスクを返す関数。
+    """
+    empty = bytes(width)
+    origin = logo_origin(width, height)
+    if origin is None:
+        return lambda y: empty
+    ox, oy = origin
+    rows = [empty[:ox] + bytes(bits) + empty[ox + len(bits):]
+            for bits in LOGO]
+
+    def mask(y: int) -> bytes:
+        if oy <= y < oy + len(rows):
+            return rows[y - oy]
+        return empty
+
+    return mask
+
+
+def stream_rows(width: int, height: int, seed: int = 42,
+                algorithm: str = "eller") -> Iterator[bytearray]:
+    """迷路全体を保持せずに、完成した行を上から1行ずつ返します.
+
+    同じ設定（PERFECT=True）の MazeGenerator と同じ迷路になるため、
+    write_maze_rows などに渡せば、巨大な迷路も O(width) のメモリで
+    ファイルに書き出せる。
+
+    Args:
+        width (int): 迷路の幅.
+        height (int): 迷路の高さ.
+        seed (int): 乱数シード（0の場合は42）.
+        algorithm (str): "eller" または "sidewinder".
+
+    Returns:
+        Iterator[bytearray]: 各行の壁ビット。
+
+    Raises:
+        ValueError: 1行ずつ生成できないアルゴリズムが指定された場合。
+    """
+    if algorithm not in STREAMING:
+        raise ValueError(f"Algorithm {algorithm!r} cannot stream rows "
+                         f"(choose from {', '.join(STREAMING)})")
+    rng = random.Random(seed if seed > 0 else 42)
+    rows = eller_rows if algorithm == "eller" else sidewinder_rows
+    return rows(width, height, rng, logo_mask(width, height))
+
+
+def eller_rows(width: int, height: int, rng: random.Random,
+               mask: RowMask) -> Iterator[bytearray]:
+    """Ellerのアルゴリズムで、完成した行を1行ずつ返します.
+
+    各行のセルがどの集合（つながっている部分）に属するかだけを保持する。
+    1. 隣り合う別の集合をランダムにつなぐ（最終行はすべてつなぐ）
+    2. 各集合から少なくとも1つ、下の行へ通路を掘る
+    ロゴに阻まれて下へ掘れない集合は、掘れる集合と横につないでおく。
+
+    Args:
+        width (int): 迷路の幅.
+        height (int): 迷路の高さ.
+        rng (random.Random): 使用する乱数生成器.
+        mask (RowMask): 行ごとのマスク.
+
+    Returns:
+        Iterator[bytearray]: 各行の壁ビット。
+
+    Raises:
+        ValueError: マスクによって迷路が分断されてしまう場合。
+    """
+    sets = list(range(width))
+    next_id = width
+    row = bytearray(b"\x0f") * width
+    m = mask(0)
+
+    for y in range(height):
+        last = y == height - 1
+        # 集合ごとのセル（マスクのセルはどの集合にも属さない）
+        members: dict[int, list[int]] = {}
+        for x in range(width):
+            if not m[x]:
+                members.setdefault(sets[x], []).append(x)
+
+        def join(x: int) -> int:
+            """x と x+1 の間の壁を壊し、2つの集合を1つにまとめます."""
+            a, b = sets[x], sets[x + 1]
+            if len(members[a]) < len(members[b]):
+                a, b = b, a
+            for c in members[b]:
+                sets[c] = a
+            members[a].extend(members.pop(b))
+            row[x] &= ~2
+            row[x + 1] &= ~8
+            return a
+
+        for x in range(width - 1):
+            if m[x] or m[x + 1] or sets[x] == sets[x + 1]:
+                continue
+            if last or rng.random() < 0.5:
+                join(x)
+        if last:
+            yield row
+            return
+
+        nm = mask(y + 1)
+        # 下へ掘れない集合は、隣の別の集合とつないでから掘る
+        for sid in list(members) if 1 in nm else ():
+            while sid in members and all(nm[x] for x in members[sid]):
+                for x in members[sid]:
+                    if 0 < x and not m[x - 1] and sets[x - 1] != sid:
+                        sid = join(x - 1)
+                        break
+                    if (x + 1 < width and not m[x + 1]
+                            and sets[x + 1] != sid):
+                        sid = join(x)
+                        break
+                else:
+                    raise ValueError(f"Row {y} is cut off by the mask")
+
+        below = [-1] * width
+        for sid, xs in members.items():
+            exits = [x for x in xs if not nm[x]]
+            rng.shuffle(exits)
+            for x in exits[:1 + rng.randrange(len(exits))]:
+                row[x] &= ~4
+                below[x] = sid
+        yield row
+
+        row = bytearray(b"\x0f") * width
+        m = nm
+        for x in range(width):
+            if below[x] != -1:
+                row[x] &= ~1
+                sets[x] = below[x]
+            else:
+                sets[x] = next_id
+                next_id += 1
+
+
+def sidewinder_rows(width: int, height: int, rng: random.Random,
+                    mask: RowMask) -> Iterator[bytearray]:
+    """Sidewinderのアルゴリズムで、完成した行を1行ずつ返します.
+
+    最上段は東西に1本の通路とし、以降の行は東へ伸ばした「ラン」を
+    ランダムな長さで区切り、各ランから1か所だけ北へ通路を掘る。
+    ロゴで東へ進めなくなる手前の部分に北へ掘れるセルがない場合は、
+    そこまでランを区切らずに伸ばす。
+    北へ掘ると1つ上の行の南の壁も壊れるため、行は1行遅れで返す。
+
+    Args:
+        width (int): 迷路の幅.
+        height (int): 迷路の高さ.
+        rng (random.Random): 使用する乱数生成器.
+        mask (RowMask): 行ごとのマスク.
+
+    Returns:
+        Iterator[bytearray]: 各行の壁ビット。
+
+    Raises:
+        ValueError: マスクによって迷路が分断されてしまう場合。
+    """
+    prev = bytearray()
+    pm = b""
+    for y in range(height):
+        m = mask(y)
+        row = bytearray(b"\x0f") * width
+        if y == 0:
+            for x in range(width - 1):
+                if not m[x] and not m[x + 1]:
+                    row[x] &= ~2
+                    row[x + 1] &= ~8
+            prev, pm = row, m
+            continue
+
+        # ahead[x]: x から東へ進める範囲に、北へ掘れるセルがあるか
+        ahead = bytearray(width + 1)
+        for x in range(width - 1, -1, -1):
+            if not m[x]:
+                ahead[x] = not pm[x] or ahead[x + 1]
+
+        exits: list[int] = []
+        for x in range(width):
+            if m[x]:
+                continue
+            if not pm[x]:
+                exits.append(x)
+            can_east = x + 1 < width and not m[x + 1]
+            # 北へ掘れるセルがあり、残りの部分も北へ掘れるときだけランを区切れる
+            if can_east and (not exits or not ahead[x + 1]
+                             or rng.random() < 0.5):
+                row[x] &= ~2
+                row[x + 1] &= ~8
+                continue
+            if not exits:
+                raise ValueError(f"Row {y} is cut off by the mask")
+            c = rng.choice(exits)
+            row[c] &= ~1
+            prev[c] &= ~4
+            exits = []
+        yield prev
+        prev, pm = row, m
+    if height:
+        yield prev
+
+
+def kruskal(maze: bytearray, width: int, height: int, mask: bytearray,
+            rng: random.Random) -> Iterator[Carve]:
+    """Kruskalのアルゴリズム（ランダムな順の壁を、別の木をつなぐ場合だけ壊す）.
+
+    Args:
+        maze (bytearray): すべて壁(15)で初期化された迷路（直接書き換える）.
+        width (int): 迷路の幅.
+        height (int): 迷路の高さ.
+        mask (bytearray): 1のセルには立ち入らないマスク（行優先）.
+        rng (random.Random): 使用する乱数生成器.
+
+    Returns:
+        Iterator[Carve]: 壊した壁ごとに、つないだ2つのセル。
+    """
+    edges = []
+    for i in range(width * height):
+        if mask[i]:
+            continue
+        if (i + 1) % width and not mask[i + 1]:
+            edges.append((i, i + 1, 2, 8))
+        if i + width < width * height and not mask[i + width]:
+            edges.append((i, i + width, 4, 1))
+    rng.shuffle(edges)
+
+    parent = array('i', range(width * height))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j, mw, yw in edges:
+        ri, rj = find(i), find(j)
+        if ri == rj:
+            continue
+        parent[ri] = rj
+        maze[i] &= ~mw
+        maze[j] &= ~yw
+        yield i % width, i // width, j % width, j // width
+
+
+def wilson(maze: bytearray, width: int, height: int, mask: bytearray,
+           rng: random.Random) -> Iterator[Carve]:
+    """Wilsonのアルゴリズム（ループを消したランダムウォークで木を広げる）.
+
+    すべての全域木を等確率で生成する。引数と戻り値は kruskal と同じ。
+    """
+    cells = [i for i in range(width * height) if not mask[i]]
+    if not cells:
+        return
+    rng.shuffle(cells)
+    in_tree = bytearray(width * height)
+    in_tree[cells[0]] = 1
+    # ランダムウォーク中に各セルから最後に進んだ先
+    step = array('i', [-1]) * (width * height)
+
+    for start in cells[1:]:
+        if in_tree[start]:
+            continue
+        # 木に当たるまで歩く（同じセルに戻れば上書きされ、ループが消える）
+        cur = start
+        while not in_tree[cur]:
+            nxt = rng.choice(_neighbors(cur, width, height, mask))
+            step[cur] = nxt
+            cur = nxt
+        cur = start
+        while not in_tree[cur]:
+            nxt = step[cur]
+            _open(maze, cur, nxt, width)
+            in_tree[cur] = 1
+            yield cur % width, cur // width, nxt % width, nxt // width
+            cur = nxt
+
+
+def prim(maze: bytearray, width: int, height: int, mask: bytearray,
+         rng: random.Random) -> Iterator[Carve]:
+    """Primのアルゴリズム（迷路に隣接するセルをランダムに1つずつ取り込む）.
+
+    引数と戻り値は kruskal と同じ。
+    """
+    cells = [i for i in range(width * height) if not mask[i]]
+    if not cells:
+        return
+    # 0: 未到達, 1: 迷路に隣接（候補）, 2: 迷路に取り込み済み
+    state = bytearray(width * height)
+    frontier: list[int] = []
+
+    def add(i: int) -> None:
+        state[i] = 2
+        for j in _neighbors(i, width, height, mask):
+            if state[j] == 0:
+                state[j] = 1
+                frontier.append(j)
+
+    add(rng.choice(cells))
+    while frontier:
+        k = rng.randrange(len(frontier))
+        frontier[k], frontier[-1] = frontier[-1], frontier[k]
+        cur = frontier.pop()
+        links = [j for j in _neighbors(cur, width, height, mask)
+                 if state[j] == 2]
+        nxt = rng.choice(links)
+        _open(maze, cur, nxt, width)
+        add(cur)
+        yield nxt % width, nxt // width, cur % width, cur // width
+
+
+def dfs_forest(maze: bytearray, width: int, height: int, mask: bytearray,
+               rng: random.Random) -> "array[int]":
+    """マスク以外のセルを穴掘り法で掘り、つながった部分ごとの番号を返します.
+
+    マスクで分断された部分があれば、それぞれを別の木として掘る。
+
+    Args:
+        maze (bytearray): すべて壁(15)で初期化された迷路（直接書き換える）.
+        width (int): 迷路の幅.
+        height (int): 迷路の高さ.
+        mask (bytearray): 1のセルには立ち入らないマスク（行優先）.
+        rng (random.Random): 使用する乱数生成器.
+
+    Returns:
+        array: 各セルが属する木の番号（0から順に, マスクのセルは-1）。
+    """
+    label = array('i', [-1]) * (width * height)
+    count = 0
+    for root in range(width * height):
+        if mask[root] or label[root] != -1:
+            continue
+        label[root] = count
+        dirs = _neighbors(root, width, height, mask)
+        rng.shuffle(dirs)
+        stack = [(root, dirs)]
+        while stack:
+            cur, dirs = stack[-1]
+            if not dirs:
+                stack.pop()
+                continue
+            nxt = dirs.pop()
+            if label[nxt] == -1:
+                label[nxt] = count
+                _open(maze, cur, nxt, width)
+                next_dirs = _neighbors(nxt, width, height, mask)
+                rng.shuffle(next_dirs)
+                stack.append((nxt, next_dirs))
+        count += 1
+    return label
+
+
+def carve_tile(tile: tuple[int, int, int, int, int, int, int]
+               ) -> tuple[bytes, "array[int]", "array[int]",
+                          "array[int]", "array[int]", int]:
+    """巨大迷路の1タイルを、タイル専用のシードで完全迷路として掘ります.
+
+    プロセスプールから呼べるようにモジュールの関数としている。
+    '42'のマスクはタイルの範囲の行だけを作る。
+
+    Args:
+        tile (tuple): (迷路の幅, 迷路の高さ, タイルの左端x, 上端y,
+            タイルの幅, タイルの高さ, シード).
+
+    Returns:
+        tuple: タイルの壁ビット（行優先）, 上端/下端/左端/右端のセルが
+            属する木の番号, タイル内の木の数。
+    """
+    width, height, x0, y0, tw, th, seed = tile
+    rows = logo_mask(width, height)
+    mask = bytearray().join(rows(y)[x0:x0 + tw] for y in range(y0, y0 + th))
+    rng = random.Random(f"{seed}:tile:{x0},{y0}")
+    maze = bytearray(b"\x0f") * (tw * th)
+    label = dfs_forest(maze, tw, th, mask, rng)
+    return (bytes(maze), label[:tw], label[(th - 1) * tw:],
+            label[::tw], label[tw - 1::tw], max(label, default=-1) + 1)
+
+
+def _neighbors(i: int, width: int, height: int,
+               mask: bytearray) -> list[int]:
+    """マスクされていない上下左右のセルを返します."""
+    x, y = i % width, i // width
+    result = []
+    if 0 < x and not mask[i - 1]:
+        result.append(i - 1)
+    if x + 1 < width and not mask[i + 1]:
+        result.append(i + 1)
+    if 0 < y and not mask[i - width]:
+        result.append(i - width)
+    if y + 1 < height and not mask[i + width]:
+        result.append(i + width)
+    return result
+
+
+def _open(maze: bytearray, i: int, j: int, width: int) -> None:
+    """隣り合うセル i, j の間の壁を壊します.
+
+    幅が1の迷路では上下の差分も±1になるため、上下を先に判定する。
+    """
+    if j == i + width:
+        maze[i] &= ~4
+        maze[j] &= ~1
+    elif j == i - width:
+        maze[i] &= ~1
+        maze[j] &= ~4
+    elif j == i + 1:
+        maze[i] &= ~2
+        maze[j] &= ~8
+    else:
+        maze[i] &= ~8
+        maze[j] &= ~2
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""生成済み迷路をLRU方式でキャッシュするモジュール.
+
+同じ設定（サイズ, ENTRY, EXIT, SEED, PERFECT）の迷路は同じ結果になるため、
+一度生成した迷路・最短経路を保持しておき、再生成を省略する。
+"""
+
+import sys
+from collections import OrderedDict
+from typing import Hashable, NamedTuple
+
+
+class CacheEntry(NamedTuple):
+    """キャッシュに保存される1つの迷路.
+
+    Attributes:
+        maze (bytes): 行優先の壁データ（1セル1バイト）.
+        path (tuple): 最短経路の座標（拡張グリッド上の座標）.
+        way (tuple): 最短経路の方角（N, E, S, W）.
+    """
+
+    maze: bytes
+    path: tuple[tuple[int, int], ...]
+    way: tuple[str, ...]
+
+
+class MazeCache:
+    """件数とメモリ量の上限を持つ、迷路のLRUキャッシュ.
+
+    上限を超えた場合は最も長く参照されていない迷路から破棄する。
+
+    Attributes:
+        _entries (OrderedDict): キーと迷路の対応（末尾ほど最近参照された）.
+        _sizes (dict): キーごとの推定メモリ量（バイト）.
+        _max_entries (int): 保持する迷路の最大件数.
+        _max_bytes (int): 保持する迷路の合計メモリ量の上限（バイト）.
+        _nbytes (int): 現在の合計メモリ量（推定, バイト）.
+        _hits (int): キャッシュヒット回数.
+        _misses (int): キャッシュミス回数.
+    """
+
+    def __init__(self, max_entries: int = 128,
+                 max_bytes: int = 64 * 1024 * 1024) -> None:
+        """MazeCacheを初期化します.
+
+        Args:
+            max_entries (int): 保持する迷路の最大件数.
+            max_bytes (int): 保持する迷路の合計メモリ量の上限（バイト）.
+
+        Raises:
+            ValueError: 上限に負の値が指定された場合。
+        """
+        if max_entries < 0 or max_bytes < 0:
+            raise ValueError("Cache limits must be non-negative")
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._sizes: dict[Hashable, int] = {}
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """キャッシュヒット回数を返します."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """キャッシュミス回数を返します."""
+        return self._misses
+
+    @property
+    def nbytes(self) -> int:
+        """保持している迷路の合計メモリ量（推定, バイト）を返します."""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        """保持している迷路の件数を返します."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> CacheEntry | None:
+        """キーに対応する迷路を返し、最近参照されたものとして記録します.
+
+        Args:
+            key (Hashable): 迷路の設定を表すキー.
+
+        Returns:
+            CacheEntry | None: 見つかった迷路。なければNone。
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry
+
+    def put(self, key: Hashable, entry: CacheEntry) -> None:
+        """迷路を保存し、上限を超えた分を古いものから破棄します.
+
+        1件だけで上限を超える迷路は保存しない。
+
+        Args:
+            key (Hashable): 迷路の設定を表すキー.
+            entry (CacheEntry): 保存する迷路.
+        """
+        size = _entry_size(entry)
+        if key in self._entries:
+            self._remove(key)
+        if self._max_entries == 0 or self._max_bytes < size:
+            return
+
+        self._entries[key] = entry
+        self._sizes[key] = size
+        self._nbytes += size
+
+        while (self._max_entries < len(self._entries)
+               or self._max_bytes < self._nbytes):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def clear(self) -> None:
+        """保持している迷路と統計をすべて破棄します."""
+        self._entries.clear()
+        self._sizes.clear()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def report_status(self) -> str:
+        """キャッシュの利用状況を文字列で返します."""
+        return (f"Cache: {len(self)}/{self._max_entries} entries, "
+                f"{self._nbytes}/{self._max_bytes} bytes, "
+                f"hits={self._hits}, misses={self._misses}")
+
+    def _remove(self, key: Hashable) -> None:
+        """キーに対応する迷路を破棄します."""
+        del self._entries[key]
+        self._nbytes -= self._sizes.pop(key)
+
+
+def _entry_size(entry: CacheEntry) -> int:
+    """迷路1件の推定メモリ量（バイト）を返します.
+
+    経路の座標タプルはすべて同じ大きさなので、1つ分で代表する。
+    方角は1文字のインターン済み文字列なので、参照の分だけ数える。
+    """
+    size = sys.getsizeof(entry.maze) + sys.getsizeof(entry.path)
+    size += sys.getsizeof(entry.way)
+    if entry.path:
+        size += len(entry.path) * sys.getsizeof(entry.path[0])
+    return size
+
+
+if __name__ == "__main__":
+    pass
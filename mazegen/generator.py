@@ -2,21 +2,56 @@
 """迷路生成のコアロジックおよび設定管理を行うモジュール.
 
 設定値の検証 - Pydantic
-迷路生成 - 穴掘り法（DFS）
+迷路生成 - 穴掘り法（DFS）, ALGORITHMで Eller/Sidewinder/Kruskal/Wilson/Prim
 最短経路算出 - 幅優先探索（BFS）
 """
 
 import random
 import sys
 import ast
+import tempfile
 from pathlib import Path
 from pydantic import BaseModel, Field, model_validator, \
-                     field_validator, ValidationError, ConfigDict
-from typing import Annotated, Any
+                     field_validator, ValidationError, ConfigDict, \
+                     ValidationInfo
+from typing import Annotated, Any, NamedTuple
+from array import array
 from collections import deque
+from heapq import heappop, heappush
+from collections.abc import Iterable, Iterator
+from . import algorithms
+from .algorithms import ALGORITHMS, LOGO, Carve, logo_origin
+from .cache import CacheEntry, MazeCache
+from .oracle import DistanceOracle
+from .stats import GenerationStats, PeakQueue, StageHook, count_passages
+from .storage import GridView, expand_grid, expand_window
 
 PositiveInt = Annotated[int, Field(ge=0, description="正の整数型")]
 
+# LARGEフラグが無効な場合の迷路サイズの上限
+MAX_SIZE = 42
+# 乱数シードの上限
+MAX_SEED = 1000
+# 到達できないセルの距離
+INF_DIST = 2**31 - 1
+# 選択できる最短経路の探索方法
+SOLVERS = ("bfs", "bidirectional", "astar")
+
+# 穴掘りと壁崩しで調べる方角:
+# (x軸移動, y軸移動, 自身から見た破壊すべき壁ビット, 移動先から見た破壊すべき壁ビット, 方角)
+# 乱数で並べ替える元の順番なので、変えると同じシードでも迷路が変わる
+# generate() と generate_events() が同じ迷路になるよう、必ずここから作る
+_WASD = ((-1, 0, 8, 2, 'W'), (0, -1, 1, 4, 'S'),
+         (1, 0, 2, 8, 'E'), (0, 1, 4, 1, 'N'))
+
+
+def _moves(width: int) -> tuple[tuple[int, int], ...]:
+    """BFSで調べる (自身から見た壁ビット, 移動先のインデックス差分) を返します.
+
+    東・西・南・北の順に調べることで、どの探索でも同じ最短経路になる。
+    """
+    return ((2, 1), (8, -1), (4, width), (1, -width))
+
 
 class MazeConfig(BaseModel):
     """MazeGeneratorの設定値を保持・検証するデータクラス.
@@ -24,24 +59,30 @@ class MazeConfig(BaseModel):
     Pydanticを使用して、型チェックと値の範囲を検証する。
 
     Attributes:
-        width (int): 迷路の幅（0〜42）。デフォルト(20)
-        height (int): 迷路の高さ（0〜42）。デフォルト(15)
+        width (int): 迷路の幅（0〜42, LARGE時は上限なし）。デフォルト(20)
+        height (int): 迷路の高さ（0〜42, LARGE時は上限なし）。デフォルト(15)
         entry (tuple): スタート地点の座標 (x, y)。デフォルト(0, 0)
         exit (tuple): ゴール地点の座標 (x, y)。デフォルト(19, 14)
+        defer_file_check (bool): 出力ファイルへの書き込みテストを省き、
+            実際の書き込み時のエラーに任せるフラグ。デフォルト(False)
         output_file (Path): 出力ファイルのパス。デフォルト('maze.txt')
         seed (int): 乱数シード値（0〜1000）。デフォルト(42)
         perfect (bool): 完全迷路のフラグ。デフォルト(True)
+        large (bool): 42を超えるサイズを許可するフラグ。デフォルト(False)
+        incremental (bool): PERFECTの切り替えを差分で反映するフラグ。デフォルト(False)
+        algorithm (str): 迷路の生成アルゴリズム（dfs, eller, sidewinder,
+            kruskal, wilson, prim）。デフォルト('dfs')
+        solver (str): 最短経路の探索方法（bfs, bidirectional, astar）。
+            INCREMENTAL時は使わない。デフォルト('bfs')
     """
     model_config = ConfigDict(validate_assignment=True)
     # .[弾くもの]intと数字以外のstr
     width: int = Field(alias='WIDTH',
                        ge=0,
-                       le=42,
                        default=20,
                        description="迷路の横幅")
     height: int = Field(alias='HEIGHT',
                         ge=0,
-                        le=42,
                         default=15,
                         description="迷路の縦幅")
     # .[弾くもの]tuple以外
@@ -51,32 +92,57 @@ class MazeConfig(BaseModel):
     exit: tuple[PositiveInt, PositiveInt] = Field(alias="EXIT",
                                                   default=(19, 14),
                                                   description="迷路のゴール地点")
+    # .output_fileより前に置くことで、output_fileの検証時に参照できる
+    defer_file_check: bool = Field(alias="DEFER_FILE_CHECK",
+                                   default=False,
+                                   description="出力ファイル確認の延期フラグ")
     # .[弾くもの]数字、リスト、dict、Noneなど
     output_file: Path = Field(alias="OUTPUT_FILE",
                               default=Path("maze.txt"),
                               description="出力ファイル名")
     seed: int = Field(alias="SEED",
                       ge=0,
-                      le=1000,
+                      le=MAX_SEED,
                       default=42,
                       description="迷路の乱数種")
     # .[弾くもの]boolと文字のboll以外
     perfect: bool = Field(alias="PERFECT",
                           default=True,
                           description="PERFECTフラグ")
+    # .Falseの場合はWIDTH/HEIGHTをMAX_SIZE以下に制限する
+    large: bool = Field(alias="LARGE",
+                        default=False,
+                        description="巨大迷路の許可フラグ")
+    # .Trueの場合は壁崩しを専用のサブシードで行うため、非PERFECTの迷路は通常と異なる
+    incremental: bool = Field(alias="INCREMENTAL",
+                              default=False,
+                              description="PERFECT切り替えの差分更新フラグ")
+    # .大文字/小文字は区別しない（"ELLER"でも可）
+    algorithm: str = Field(alias="ALGORITHM",
+                           default="dfs",
+                           description="迷路の生成アルゴリズム")
+    # .大文字/小文字は区別しない（"ASTAR"でも可）
+    solver: str = Field(alias="SOLVER",
+                        default="bfs",
+                        description="最短経路の探索方法")
 
     # .インスタンス作成前に実行されるためclassmethodが必要
     @field_validator('output_file')  # .何も書かないとafterになる
     @classmethod
-    def _validate_file_name(cls, v: Any) -> Any:
+    def _validate_file_name(cls, v: Any, info: ValidationInfo) -> Any:
         """出力ファイル名の妥当性を検証/修正する.
 
         - 拡張子 '.txt' がなければ付与
         - 同名のディレクトリが存在しないか確認
         - ファイルへの書き込み権限があるかテスト
 
+        DEFER_FILE_CHECKが有効な場合や、検証済みの設定から作り直す場合
+        （freeze/thaw）は拡張子の付与だけを行い、ファイルシステムには
+        触れない（問題は実際の書き込み時にOSErrorとして分かる）。
+
         Args:
             v (Any): 入力されたファイルパス。
+            info (ValidationInfo): 先に検証されたフィールドの値と検証の文脈。
 
         Returns:
             Any: 検証・修正済みのPathオブジェクト。
@@ -87,19 +153,39 @@ class MazeConfig(BaseModel):
         if v.suffix != '.txt':
             v = v.with_suffix('.txt')
 
-        if v.exists() and v.is_dir():
-            raise ValueError(f"A directory named {v.name} already exists.")
+        if info.data.get("defer_file_check") or info.context is _TRUSTED:
+            return v
+        check_output_file(v)
+        return v
 
-        try:
-            if v.exists():
-                with open(v, 'a'):
-                    pass
-            else:
-                with open(v, 'x'):
-                    pass
-                v.unlink()
-        except OSError as e:
-            raise ValueError(f"File_NameError: {e}")
+    @field_validator('algorithm', mode='before')
+    @classmethod
+    def _validate_algorithm(cls, v: Any) -> Any:
+        """アルゴリズム名を小文字にそろえ、選択できるものか検証します.
+
+        Raises:
+            ValueError: 存在しないアルゴリズム名の場合。
+        """
+        if isinstance(v, str):
+            v = v.strip().lower()
+            if v not in ALGORITHMS:
+                raise ValueError(f"Unknown algorithm '{v}' "
+                                 f"(choose from {', '.join(ALGORITHMS)})")
+        return v
+
+    @field_validator('solver', mode='before')
+    @classmethod
+    def _validate_solver(cls, v: Any) -> Any:
+        """探索方法の名前を小文字にそろえ、選択できるものか検証します.
+
+        Raises:
+            ValueError: 存在しない探索方法の場合。
+        """
+        if isinstance(v, str):
+            v = v.strip().lower()
+            if v not in SOLVERS:
+                raise ValueError(f"Unknown solver '{v}' "
+                                 f"(choose from {', '.join(SOLVERS)})")
         return v
 
     @field_validator('entry', 'exit', mode='before')
@@ -130,6 +216,7 @@ class MazeConfig(BaseModel):
     def _after_valid_mazeconfig(self) -> "MazeConfig":
         """複数のフィールドにまたがる整合性を検証します.
 
+        - LARGEでない場合、WIDTH/HEIGHTがMAX_SIZE以下か
         - ENTRY/EXITが迷路の範囲内に収まっているか
         - ENTRYとEXITが同じ座標でないか
 
@@ -143,6 +230,9 @@ class MazeConfig(BaseModel):
         ex, ey = self.entry
         gx, gy = self.exit
 
+        if not self.large and (MAX_SIZE < w or MAX_SIZE < h):
+            raise ValueError(f"Maze size {w, h} exceeds {MAX_SIZE} "
+                             "(set LARGE=True to allow it)")
         if w <= ex or h <= ey:
             raise ValueError(f"ENTRY {ex, ey} exceeds maze size {w, h}")
         if w <= gx or h <= gy:
@@ -166,46 +256,122 @@ class MazeConfig(BaseModel):
 
         return "\n".join(line for line in report_lines)
 
+    def freeze(self) -> "FrozenMazeConfig":
+        """この設定を、ファイルを確認し直さずに変更不可の設定に変換します.
+
+        Returns:
+            FrozenMazeConfig: 同じ値を持つ、変更不可でハッシュ可能な設定。
+        """
+        return FrozenMazeConfig.model_validate(_explicit_values(self),
+                                               context=_TRUSTED)
+
+
+class FrozenMazeConfig(MazeConfig):
+    """検証済みの値だけを持つ、変更不可でハッシュ可能なMazeConfig.
+
+    MazeConfig.freeze() で作り、シードだけを変えながら使い回す。
+    辞書のキーや複数プロセスで共有する設定として使える。
+    MazeGenerator.from_config() に渡すと、出力ファイルの確認を
+    行わずに生成器を作る。
+    """
+    model_config = ConfigDict(frozen=True)
+
+    def with_seed(self, seed: int) -> "FrozenMazeConfig":
+        """SEEDだけを変えた設定を、他の値を再検証せずに返します.
+
+        Raises:
+            ValueError: シードが範囲外の場合。
+        """
+        if not 0 <= seed <= MAX_SEED:
+            raise ValueError(f"SEED {seed} is out of range (0-{MAX_SEED})")
+        # model_copyは検証を行わず、明示されたフィールドにseedを加える
+        return self.model_copy(update={"seed": seed})
+
+    def thaw(self) -> MazeConfig:
+        """ファイルを確認し直さずに、変更可能なMazeConfigに戻します."""
+        return MazeConfig.model_validate(_explicit_values(self),
+                                         context=_TRUSTED)
+
+
+# 検証済みの設定から作り直す時の検証の文脈（出力ファイルの確認を省く）
+_TRUSTED = {"trusted": True}
+# フィールド名からエイリアス（WIDTHなど）への対応
+_ALIASES = {name: field.alias or name
+            for name, field in MazeConfig.model_fields.items()}
+
+
+def _explicit_values(conf: MazeConfig) -> dict[str, Any]:
+    """明示的に設定された値だけを、エイリアスをキーにした辞書で返します.
+
+    省略された値はデフォルトのままになるため、report_statusの
+    "(Default)" の表示も元の設定と同じになる。
+    """
+    values = conf.__dict__
+    return {_ALIASES[name]: values[name] for name in conf.model_fields_set}
+
+
+def check_output_file(path: Path) -> None:
+    """出力ファイルに書き込めるかを、既存のファイルを変えずに確かめます.
+
+    ファイルがあれば追記モードで開くだけにし、なければ同じディレクトリに
+    一意な名前の一時ファイルを作って確かめる（出力ファイル自体は作らないため、
+    同じ名前を同時に確認する他のプロセスと衝突しない）。
+
+    Args:
+        path (Path): 出力ファイルのパス.
+
+    Raises:
+        ValueError: ディレクトリと同名の場合や書き込み権限がない場合。
+    """
+    if path.is_dir():
+        raise ValueError(f"A directory named {path.name} already exists.")
+
+    try:
+        if path.exists():
+            with open(path, 'a'):
+                pass
+        else:
+            with tempfile.TemporaryFile(dir=path.parent):
+                pass
+    except OSError as e:
+        raise ValueError(f"File_NameError: {e}")
+
 
 class MazeGenerator:
     """迷路の生成と経路探索を行うメインクラス.
 
     Attributes:
         _conf (MazeConfig): 検証済みの設定オブジェクト。
-        _maze (list): 生成された迷路データ（壁情報）。
+        _maze (bytearray): 生成された迷路データ（壁情報, 行優先で1セル1バイト）。
         _path (list): スタートからゴールへの最短経路（座標リスト）。
         _way (list): 最短経路の方角リスト（N, E, S, W）。
-        _grid (list): 描画・探索用に拡張されたグリッドデータ。
-        _visited (list): 迷路生成時の訪問済み管理フラグ。
-        _report (str): 現在迷路の設定
+        _grid (bytearray): 描画用に拡張されたグリッドデータ（行優先, 遅延生成）。
+        _visited (bytearray): 迷路生成時の訪問済み管理フラグ（行優先）。
+        _solved (bool): _path/_way が現在の迷路の最短経路になっているか
+            （Falseなら path, way, grid が参照された時に探索する）。
+        _report (str | None): 現在迷路の設定（Noneなら参照された時に作る）
+        _rng (random.Random): このインスタンス専用の乱数生成器。
+        _cache (MazeCache | None): 生成済み迷路のキャッシュ。
     """
 
-    def __init__(self, confdict: dict[str, Any] | None = None):
+    def __init__(self, confdict: dict[str, Any] | None = None,
+                 rng: random.Random | None = None,
+                 cache: MazeCache | None = None):
         """MazeGeneratorを初期化します.
 
         Args:
             confdict (dict, optional): 設定値の辞書。指定がない場合はデフォルト値が使用されます。
+            rng (random.Random, optional): 使用する乱数生成器。指定がない場合は
+                インスタンス専用のrandom.Randomが作成されます。
+                generate()のたびにSEEDで初期化し直されます。
+            cache (MazeCache, optional): 生成済み迷路のキャッシュ。指定すると
+                同じ設定の迷路はgenerate()で再生成せずキャッシュから復元されます。
         """
         try:
             if confdict is None:
                 confdict = {}
-            self._conf = MazeConfig(**confdict)
-
-            self._maze: list[list[int]] = []
-            self._path: list[tuple[int, int]] = []
-            self._way: list[str] = []
-            self._grid: list[list[int]] = []
-            self._visited: list[list[int]] = []
-            self._report: str
-
-            # ショートカットの初期化
-            self._width = self._conf.width
-            self._height = self._conf.height
-            self._entry = self._conf.entry
-            self._exit = self._conf.exit
-            self._output_file = self._conf.output_file
-            self._seed = self._conf.seed
-            self._perfect = self._conf.perfect
+            self._setup(MazeConfig(**confdict), rng)
+            self._cache = cache
 
         except ValidationError as e:
             print("Validation error:")
@@ -215,6 +381,85 @@ class MazeGenerator:
                 print(f"      input:({err['input']})")
             sys.exit(1)
 
+    @classmethod
+    def from_config(cls, conf: MazeConfig,
+                    rng: random.Random | None = None,
+                    cache: MazeCache | None = None) -> "MazeGenerator":
+        """検証済みのMazeConfigから、再検証せずにインスタンスを作成します.
+
+        FrozenMazeConfigを渡した場合は、変更可能なコピーを使います
+        （setterで設定を変えても元の設定は変わりません）。
+
+        Args:
+            conf (MazeConfig): 検証済みの設定オブジェクト.
+            rng (random.Random, optional): 使用する乱数生成器.
+            cache (MazeCache, optional): 生成済み迷路のキャッシュ.
+
+        Returns:
+            MazeGenerator: 未生成状態のインスタンス。
+        """
+        if isinstance(conf, FrozenMazeConfig):
+            conf = conf.thaw()
+        generator = cls.__new__(cls)
+        generator._setup(conf, rng)
+        generator._cache = cache
+        return generator
+
+    def _setup(self, conf: MazeConfig,
+               rng: random.Random | None = None) -> None:
+        """設定オブジェクトと内部データを初期化します.
+
+        Args:
+            conf (MazeConfig): 検証済みの設定オブジェクト.
+            rng (random.Random, optional): 使用する乱数生成器.
+        """
+        self._conf = conf
+        # モジュール共通のrandomを使わないことで、スレッド間で干渉しない
+        # generate()で必ずSEEDから初期化し直すため、ここではOSの乱数
+        # (os.urandom) を読まずにSEEDで初期化しておく
+        self._rng = rng if rng is not None else random.Random(conf.seed)
+
+        self._maze = bytearray()
+        self._path: list[tuple[int, int]] = []
+        self._way: list[str] = []
+        self._grid = bytearray()
+        self._visited = bytearray()
+        self._maze_view = GridView(self._maze, 0, 0)
+        self._grid_view: GridView | None = GridView(self._grid, 0, 0)
+        self._solved = True
+        self._report: str | None = None
+
+        # ショートカットの初期化
+        self._width = self._conf.width
+        self._height = self._conf.height
+        self._entry = self._conf.entry
+        self._exit = self._conf.exit
+        self._defer_file_check = self._conf.defer_file_check
+        self._output_file = self._conf.output_file
+        self._seed = self._conf.seed
+        self._perfect = self._conf.perfect
+        self._large = self._conf.large
+        self._incremental = self._conf.incremental
+        self._algorithm = self._conf.algorithm
+        self._solver = self._conf.solver
+        # 直前の最短経路探索で展開（キューから取り出）したセルの数
+        self._expanded = 0
+        # 距離の問い合わせ用の索引（最初の問い合わせで作る）
+        self._oracle: DistanceOracle | None = None
+        # 計測の設定 (cProfileを使うか, コールバック). Noneなら計測しない
+        self._stats_options: tuple[bool, StageHook | None] | None = None
+        # 直前のgenerate()の計測結果
+        self._stats: GenerationStats | None = None
+
+        # INCREMENTALモードで使う層の情報
+        self._base_key: tuple[Any, ...] | None = None
+        self._dead_ends: list[int] = []
+        self._layer: list[tuple[int, int, int, int]] | None = None
+        self._layer_applied = False
+        self._tree_prev = array('i')
+        self._tree_dist = array('i')
+        self._loop_prev: array[int] | None = None
+
     # --- Properties (Getters & Setters) ---
 
     @property  # getter
@@ -223,28 +468,66 @@ class MazeGenerator:
         return self._conf
 
     @property  # getter
-    def maze(self) -> list[list[int]]:
-        """迷路の壁データ（2次元配列）を返します."""
-        return self._maze
+    def rng(self) -> random.Random:
+        """このインスタンスが使用する乱数生成器を返します."""
+        return self._rng
+
+    @property  # getter
+    def cache(self) -> MazeCache | None:
+        """生成済み迷路のキャッシュを返します."""
+        return self._cache
+
+    @property  # getter
+    def maze(self) -> GridView:
+        """迷路の壁データ（2次元配列の読み取り専用ビュー）を返します."""
+        return self._maze_view
 
     @property  # getter
     def path(self) -> list[tuple[int, int]]:
-        """最短経路の座標リストを返します."""
+        """最短経路の座標リストを返します.
+
+        最短経路は初めて参照された時に探索します。
+
+        Raises:
+            ValueError: ゴールに到達できない場合。
+        """
+        if not self._solved:
+            self._find_path()
         return self._path
 
     @property  # getter
     def way(self) -> list[str]:
-        """最短経路の方角リストを返します."""
+        """最短経路の方角リストを返します.
+
+        Raises:
+            ValueError: ゴールに到達できない場合。
+        """
+        if not self._solved:
+            self._find_path()
         return self._way
 
     @property  # getter
-    def grid(self) -> list[list[int]]:
-        """描画用の拡張グリッドデータを返します."""
-        return self._grid
+    def grid(self) -> GridView:
+        """描画用の拡張グリッドデータ（読み取り専用ビュー）を返します.
+
+        グリッドは初めて参照された時に_mazeから展開します。
+        スタート/ゴールを書き込むため、最短経路が未探索なら探索します。
+        """
+        if self._grid_view is None:
+            self._convert_hex_maze_to_grid()
+            assert self._grid_view is not None
+        return self._grid_view
 
     @property  # getter
     def report(self) -> str:
-        """現在迷路の設定を返します."""
+        """現在迷路の設定を返します（設定が変わった後は作り直します）.
+
+        計測が有効な場合は、直前の generate() の計測結果も続けて返します。
+        """
+        if self._report is None:
+            self._report = self._conf.report_status()
+            if self._stats is not None:
+                self._report += "\n" + self._stats.report()
         return self._report
 
     @property  # getter
@@ -255,8 +538,10 @@ class MazeGenerator:
     @width.setter  # setter
     def width(self, value: int) -> None:
         """迷路の幅を更新します."""
+        self._solve_before_resize()
         self._conf.width = value
         self._width = value
+        self._report = None
         print(f"WIDTH has been changed to {value}")
 
     @property  # getter
@@ -267,8 +552,10 @@ class MazeGenerator:
     @height.setter  # setter
     def height(self, value: int) -> None:
         """迷路の高さを更新します."""
+        self._solve_before_resize()
         self._conf.height = value
         self._height = value
+        self._report = None
         print(f"HEIGHT has been changed to {value}")
 
     @property  # getter
@@ -281,6 +568,7 @@ class MazeGenerator:
         """スタート地点の座標を更新します."""
         self._conf.entry = value
         self._entry = value
+        self._invalidate_solution()
         print(f"ENTRY has been changed to {value}")
 
     @property  # getter
@@ -293,8 +581,22 @@ class MazeGenerator:
         """ゴール地点の座標を更新します."""
         self._conf.exit = value
         self._exit = value
+        self._invalidate_solution()
         print(f"EXIT has been changed to {value}")
 
+    @property  # getter
+    def defer_file_check(self) -> bool:
+        """出力ファイルの確認を書き込み時まで延期するかを返します."""
+        return self._defer_file_check
+
+    @defer_file_check.setter  # setter
+    def defer_file_check(self, value: bool) -> None:
+        """出力ファイルの確認を延期するフラグを更新します."""
+        self._conf.defer_file_check = value
+        self._defer_file_check = value
+        self._report = None
+        print(f"DEFER_FILE_CHECK has been changed to {value}")
+
     @property  # getter
     def output_file(self) -> Path:
         """出力ファイルのパスを返します."""
@@ -305,6 +607,7 @@ class MazeGenerator:
         """出力ファイルのパスを更新します."""
         self._conf.output_file = value
         self._output_file = value
+        self._report = None
         print(f"EXIT has been changed to {value}")
 
     @property  # getter
@@ -317,6 +620,7 @@ class MazeGenerator:
         """乱数シード値を更新します."""
         self._conf.seed = value
         self._seed = value
+        self._report = None
         print(f"SEED has been changed to {value}")
 
     @property  # getter
@@ -329,8 +633,111 @@ class MazeGenerator:
         """Perfectフラグを更新します."""
         self._conf.perfect = value
         self._perfect = value
+        self._report = None
         print(f"PEFECT has been changed to {value}")
 
+    @property  # getter
+    def large(self) -> bool:
+        """LARGEフラグの状態を返します."""
+        return self._large
+
+    @large.setter  # setter
+    def large(self, value: bool) -> None:
+        """LARGEフラグを更新します."""
+        self._conf.large = value
+        self._large = value
+        self._report = None
+        print(f"LARGE has been changed to {value}")
+
+    @property  # getter
+    def incremental(self) -> bool:
+        """INCREMENTALフラグの状態を返します."""
+        return self._incremental
+
+    @incremental.setter  # setter
+    def incremental(self, value: bool) -> None:
+        """INCREMENTALフラグを更新します."""
+        self._conf.incremental = value
+        self._incremental = value
+        self._report = None
+        print(f"INCREMENTAL has been changed to {value}")
+
+    @property  # getter
+    def algorithm(self) -> str:
+        """迷路の生成アルゴリズムを返します."""
+        return self._algorithm
+
+    @algorithm.setter  # setter
+    def algorithm(self, value: str) -> None:
+        """迷路の生成アルゴリズムを更新します."""
+        self._conf.algorithm = value
+        self._algorithm = self._conf.algorithm
+        self._report = None
+        print(f"ALGORITHM has been changed to {self._algorithm}")
+
+    @property  # getter
+    def solver(self) -> str:
+        """最短経路の探索方法を返します."""
+        return self._solver
+
+    @solver.setter  # setter
+    def solver(self, value: str) -> None:
+        """最短経路の探索方法を更新します."""
+        self._conf.solver = value
+        self._solver = self._conf.solver
+        self._invalidate_solution()
+        print(f"SOLVER has been changed to {self._solver}")
+
+    @property  # getter
+    def expanded(self) -> int:
+        """直前の最短経路探索で展開したセルの数を返します（探索しなかった場合は0）."""
+        return self._expanded
+
+    @property  # getter
+    def stats(self) -> GenerationStats | None:
+        """直前の generate() の計測結果を返します（計測が無効ならNone）."""
+        return self._stats
+
+    @property  # getter
+    def oracle(self) -> DistanceOracle:
+        """現在の迷路の距離の索引を返します（迷路が変わったら作り直します）.
+
+        Raises:
+            ValueError: 迷路がまだ生成されていない場合。
+        """
+        if self._oracle is None:
+            if not self._maze:
+                raise ValueError("Maze has not been generated yet")
+            # WIDTH/HEIGHTが変わっても、迷路は次の生成まで元の大きさのまま
+            width = self._maze_view.width
+            height = self._maze_view.height
+            ex, ey = self._entry
+            root = ey * width + ex if ex < width and ey < height else 0
+            self._oracle = DistanceOracle(self._maze, width, height,
+                                          root=root)
+        return self._oracle
+
+    def _solve_before_resize(self) -> None:
+        """WIDTH/HEIGHTを変える前に、今の迷路の最短経路を探索しておきます.
+
+        探索は現在の幅と高さで迷路を読むため、大きさを変えた後に
+        遅延して探索すると、古い迷路を新しい大きさで読んでしまう。
+        """
+        if not self._solved:
+            self._find_path()
+
+    def _invalidate_solution(self) -> None:
+        """ENTRY/EXIT/SOLVERの変更に合わせて、設定と最短経路を作り直させます.
+
+        迷路が現在のサイズのまま残っていれば、最短経路とグリッドは
+        次に参照された時に新しい設定で探索し直します。
+        """
+        self._report = None
+        if self._maze and self._maze_view.width == self._width \
+                and self._maze_view.height == self._height:
+            self._solved = False
+            self._grid_view = None
+
     # --- Core Methods ---
 
     def generate(self) -> None:
@@ -338,99 +745,526 @@ class MazeGenerator:
 
         1. シード値の設定
         2. 迷路の初期化（'42'ロゴの配置など）
-        3. 穴掘り法による迷路構築
+        3. ALGORITHMによる迷路構築（デフォルトは穴掘り法）
         4. 壁崩し（Not Perfectの場合）
-        5. 最短経路の探索
-        6. ステータスのレポート
+        5. 最短経路の探索（path, way, grid が参照された時）
+        6. ステータスのレポート（report が参照された時）
+
+        5と6は遅延して行うため、壁データ（maze）だけを使う場合は
+        探索もグリッドの展開も行いません。
+        キャッシュが設定されていて同じ設定の迷路が保存されていれば、
+        2〜5を省略してキャッシュから復元します（保存のために5は生成時に行います）。
+        INCREMENTALが有効な場合は _generate_incremental で2〜5を行います。
+
+        enable_stats() で計測を有効にすると、段階ごとの時間と件数を
+        stats に記録します（この場合は5と6も生成時に行います）。
+
+        Raises:
+            ValueError: ENTRYまたはEXITが'42'のセルと重なる場合。
         """
-        seed = self._seed
-        random.seed(seed) if seed > 0 else random.seed(42)
+        if self._stats_options is None:
+            self._stats = None
+            self._generate(None)
+            return
 
-        self._init_maze()
-        self._generate_maze(*self._entry)
+        profile, on_stage = self._stats_options
+        stats = GenerationStats(on_stage)
+        self._stats = stats
+        if not profile:
+            self._generate(stats)
+            return
+        # cProfile と pstats は読み込みに時間がかかるため、使う時にだけ読み込む
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            self._generate(stats)
+        finally:
+            profiler.disable()
+            stats.profile = pstats.Stats(profiler)
+
+    def enable_stats(self, profile: bool = False,
+                     on_stage: StageHook | None = None) -> None:
+        """次の generate() から、段階ごとの時間と件数を記録します.
+
+        記録する段階は seed, init, carve, break（Not Perfectの場合）,
+        solve, report の順です（キャッシュから復元した場合は restore、
+        INCREMENTALの場合は incremental が2〜5の代わりになります）。
+        INCREMENTALの場合、carved と broken は土台の通路と壁崩しの層の
+        通路の数、expanded は今回行った土台のBFSと経路更新で展開した
+        セルの数です。結果は stats と report で参照できます。
 
+        Args:
+            profile (bool, optional): Trueなら generate() 全体を cProfile で
+                計測し、stats.profile に pstats.Stats を保存する.
+            on_stage (StageHook, optional): 段階が終わるたびに
+                (段階の名前, 時間[秒]) で呼ぶコールバック.
+        """
+        self._stats_options = (profile, on_stage)
+
+    def disable_stats(self) -> None:
+        """計測をやめ、記録した結果を消します."""
+        self._stats_options = None
+        self._stats = None
+        self._report = None
+
+    def _generate(self, stats: GenerationStats | None) -> None:
+        """generate() の本体です. statsがNoneでなければ段階ごとに記録します.
+
+        Args:
+            stats (GenerationStats | None): 計測結果を記録するオブジェクト.
+        """
+        key = self._cache_key()
+        self._oracle = None
+        if self._cache is not None:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._restore(entry)
+                self._report = None
+                if stats is not None:
+                    stats.lap("restore")
+                    self._finish_stats(stats)
+                return
+
+        if self._incremental:
+            self._generate_incremental()
+            if stats is not None:
+                stats.lap("incremental")
+                # 土台の通路と、適用中の壁崩しの層の通路を分けて数える
+                layer = self._layer if self._layer_applied else None
+                stats.broken = len(layer) if layer else 0
+                stats.carved = count_passages(self._maze) - stats.broken
+                stats.skip()
+        else:
+            seed = self._seed
+            self._rng.seed(seed) if seed > 0 else self._rng.seed(42)
+            if stats is not None:
+                stats.lap("seed")
+
+            self._init_maze()
+            if stats is not None:
+                stats.lap("init")
+            self._carve()
+            # 描画用グリッドは参照された時に作り直す
+            self._grid_view = None
+            if stats is not None:
+                stats.lap("carve")
+                stats.carved = count_passages(self._maze)
+                stats.skip()
+
+            if not self._perfect:
+                self._break_the_wall()
+                if stats is not None:
+                    stats.lap("break")
+                    stats.broken = count_passages(self._maze) - stats.carved
+                    stats.skip()
+
+            # 最短経路は参照された時に探索する
+            self._solved = False
+        self._report = None
+
+        if stats is not None:
+            self._finish_stats(stats)
+
+        if self._cache is not None:
+            if not self._solved:
+                self._find_path()
+            self._cache.put(key, CacheEntry(bytes(self._maze),
+                                            tuple(self._path),
+                                            tuple(self._way)))
+
+    def _cache_key(self) -> tuple[Any, ...]:
+        """迷路の内容を決める設定値をまとめたキャッシュキーを返します."""
+        return (self._width, self._height, self._entry, self._exit,
+                self._seed, self._perfect, self._incremental,
+                self._algorithm, self._solver)
+
+    def _restore(self, entry: CacheEntry) -> None:
+        """キャッシュに保存された迷路を内部データに復元します.
+
+        Args:
+            entry (CacheEntry): 復元する迷路.
+        """
+        self._set_maze(bytearray(entry.maze), self._width, self._height)
+        self._path = list(entry.path)
+        self._way = list(entry.way)
+        self._solved = True
+        self._grid_view = None
+        self._expanded = 0
+
+    def load_maze(self, maze: bytes | bytearray,
+                  way: str | None = None) -> None:
+        """保存済みの壁データを読み込み、生成済みの状態にします.
+
+        サイズ・ENTRY・EXITは現在の設定と一致している必要がある。
+        wayが渡された場合は、ENTRYから壁を通らずにEXITへ着くかを
+        検証したうえでそのまま使い、渡されなければBFSで求める。
+
+        Args:
+            maze (bytes): 行優先の壁データ（1セル1バイト, 0〜15）.
+            way (str, optional): 保存されていた最短経路（N, E, S, W）.
+
+        Raises:
+            ValueError: サイズが合わない場合、外周の壁が開いている場合、
+                wayが迷路と矛盾する場合。
+        """
+        width = self._width
+        height = self._height
+        if len(maze) != width * height:
+            raise ValueError(f"Maze data has {len(maze)} cells, expected "
+                             f"{width} x {height}")
+        if maze and 15 < max(maze):
+            raise ValueError("Maze data must be 4-bit wall masks (0-15)")
+
+        # 探索は外周の壁が閉じていることを前提にしているため先に確認する
+        top = maze[:width]
+        bottom = maze[(height - 1) * width:]
+        left = maze[::width]
+        right = maze[width - 1::width]
+        for cells, wall, side in ((top, 1, "north"), (bottom, 4, "south"),
+                                  (left, 8, "west"), (right, 2, "east")):
+            if any(not cell & wall for cell in cells):
+                raise ValueError(f"The {side} border of the maze is open")
+
+        self._set_maze(bytearray(maze), width, self._height)
+        self._grid_view = None
+        self._oracle = None
+
+        if way is None:
+            # 最短経路は参照された時に探索する
+            self._solved = False
+        else:
+            self._path_to_way(self._walk_way(way))
+        self._report = None
+
+    def _walk_way(self, way: str) -> list[int]:
+        """方角文字列をENTRYからたどり、通過したセル番号を返します.
+
+        Args:
+            way (str): 最短経路（N, E, S, W）.
+
+        Returns:
+            list[int]: ENTRYからEXITまでのセル番号.
+
+        Raises:
+            ValueError: 壁を通り抜ける場合や、EXITで終わらない場合。
+        """
+        width = self._width
+        maze = self._maze
+        # 方角: (自身から見た壁ビット, 移動先のインデックス差分)
+        moves = {"N": (1, -width), "E": (2, 1), "S": (4, width), "W": (8, -1)}
+
+        cur = self._entry[1] * width + self._entry[0]
+        cells = [cur]
+        for step, char in enumerate(way):
+            if char not in moves:
+                raise ValueError(f"Invalid direction {char!r} in way")
+            wall, delta = moves[char]
+            if maze[cur] & wall:
+                raise ValueError(f"Way step {step} ({char}) hits a wall at "
+                                 f"{(cur % width, cur // width)}")
+            cur += delta
+            cells.append(cur)
+
+        if cur != self._exit[1] * width + self._exit[0]:
+            raise ValueError(f"Way ends at {(cur % width, cur // width)}, "
+                             f"not at EXIT {self._exit}")
+        return cells
+
+    def generate_many(self, seeds: Iterable[int],
+                      workers: int | None = None,
+                      chunksize: int = 16) -> list["MazeResult"]:
+        """現在の設定のままシードだけを変えて、複数の迷路を一括生成します.
+
+        設定の検証は一度だけ行い、各シードの生成ではPydanticの検証や
+        出力ファイルの確認を行わない。生成はプロセスプールに
+        chunksize個ずつまとめて分配され、結果はseedsの順に返る。
+        結果は各シードで generate() を呼んだ場合と一致する。
+
+        Args:
+            seeds (Iterable[int]): 生成する迷路の乱数シード（0〜MAX_SEED）.
+            workers (int, optional): ワーカープロセス数。1ならプロセスを
+                使わずにこのプロセス内で順に生成する。デフォルトはCPU数。
+            chunksize (int): 1回でワーカーに渡すシードの数.
+
+        Returns:
+            list[MazeResult]: seedsと同じ順序の生成結果。
+
+        Raises:
+            ValueError: シードが範囲外の場合や、ENTRYまたはEXITが
+                '42'のセルと重なる場合。
+        """
+        seed_list = list(seeds)
+        for seed in seed_list:
+            if not 0 <= seed <= MAX_SEED:
+                raise ValueError(f"SEED {seed} is out of range "
+                                 f"(0-{MAX_SEED})")
+
+        if workers == 1:
+            generator = MazeGenerator.from_config(self._conf)
+            return [_generate_seed(generator, seed) for seed in seed_list]
+
+        # multiprocessing は読み込みに時間がかかるため、使う時にだけ読み込む
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_worker,
+                                 initargs=(self._conf,)) as executor:
+            return list(executor.map(_generate_one, seed_list,
+                                     chunksize=chunksize))
+
+    def generate_tiled(self, tile: int = 256,
+                       workers: int | None = None) -> None:
+        """迷路をタイルに分け、複数のプロセスで並列に生成します.
+
+        1. 各タイルを、SEEDとタイルの位置から決まるシードで完全迷路として掘る
+           （'42'で分断された部分はそれぞれ別の木になる）
+        2. タイルの境界の壁をランダムな順に調べ、別の木をつなぐ場合だけ壊す
+           （Kruskal法による木どうしの全域木）
+        結果は workers の数によらず同じで、'42'以外のすべてのセルが
+        1本の木（完全迷路）としてつながる。ENTRY/EXITの検証は generate()
+        と同じく _init_maze で行い、PERFECTがFalseなら壁崩しも行う。
+        タイルは常に穴掘り法で掘るため ALGORITHM は使わず、キャッシュと
+        INCREMENTAL、enable_stats() の計測も使わない（stats はNoneになる）。
+
+        Args:
+            tile (int): タイルの一辺のセル数.
+            workers (int, optional): ワーカープロセス数。1ならプロセスを
+                使わずにこのプロセス内で順に生成する。デフォルトはCPU数。
+
+        Raises:
+            ValueError: tile が正の値でない場合。
+        """
+        if tile < 1:
+            raise ValueError("tile must be positive")
+        width = self._width
+        height = self._height
+        seed = self._seed if self._seed > 0 else 42
+
+        self._init_maze()
+        self._stats = None
+        self._expanded = 0
+        maze = self._maze
+        tiles = [(width, height, x0, y0, min(tile, width - x0),
+                  min(tile, height - y0), seed)
+                 for y0 in range(0, height, tile)
+                 for x0 in range(0, width, tile)]
+
+        if workers == 1:
+            results = list(map(algorithms.carve_tile, tiles))
+        else:
+            # multiprocessing は読み込みに時間がかかるため、使う時にだけ読み込む
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(algorithms.carve_tile, tiles))
+
+        # タイルを迷路に書き込み、木の番号を迷路全体で通し番号にする
+        bases = []
+        total = 0
+        for (_, _, x0, y0, tw, th, _), result in zip(tiles, results):
+            cells = result[0]
+            for r in range(th):
+                i = (y0 + r) * width + x0
+                maze[i:i + tw] = cells[r * tw:(r + 1) * tw]
+            bases.append(total)
+            total += result[5]
+
+        # タイル境界の壁: (木a, 木b, セルi, セルj, iの壁ビット, jの壁ビット)
+        ntx = -(-width // tile)
+        edges = []
+        for k, (_, _, x0, y0, tw, th, _) in enumerate(tiles):
+            _, _, bottom, _, right, _ = results[k]
+            if x0 + tw < width:
+                left = results[k + 1][3]
+                for r in range(th):
+                    if right[r] != -1 and left[r] != -1:
+                        i = (y0 + r) * width + x0 + tw - 1
+                        edges.append((bases[k] + right[r],
+                                      bases[k + 1] + left[r], i, i + 1, 2, 8))
+            if y0 + th < height:
+                top = results[k + ntx][1]
+                for c in range(tw):
+                    if bottom[c] != -1 and top[c] != -1:
+                        i = (y0 + th - 1) * width + x0 + c
+                        edges.append((bases[k] + bottom[c],
+                                      bases[k + ntx] + top[c],
+                                      i, i + width, 4, 1))
+
+        random.Random(f"{seed}:join").shuffle(edges)
+        parent = array('i', range(total))
+
+        def find(a: int) -> int:
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            return a
+
+        for a, b, i, j, mw, yw in edges:
+            ra, rb = find(a), find(b)
+            if ra != rb:
+                parent[ra] = rb
+                maze[i] &= ~mw
+                maze[j] &= ~yw
+
+        # 描画用グリッドと距離の索引は参照された時に作り直す
+        self._grid_view = None
+        self._oracle = None
         if not self._perfect:
+            self._rng.seed(seed)
             self._break_the_wall()
-
-        self._find_path()
-        self._report = self.conf.report_status()
+        self._solved = False
+        self._report = None
 
     def _init_maze(self) -> None:
         """迷路配列を初期化し、可能であれば中央に'42'のロゴを配置します.
 
         すべてのセルを壁（15 = 1111）で埋め、visited配列をリセットします。
         迷路サイズが十分大きい場合、中央に'42'の形に通路を掘ります。
+
+        Raises:
+            ValueError: ENTRYまたはEXITが'42'のセルと重なる場合。
         """
-        # 42のビットマップ (1:壁, 0:通路)
-        ft = [[1, 0, 0, 0, 1, 1, 1],
-              [1, 0, 0, 0, 0, 0, 1],
-              [1, 1, 1, 0, 1, 1, 1],
-              [0, 0, 1, 0, 1, 0, 0],
-              [0, 0, 1, 0, 1, 1, 1]]
-
-        self._maze = [[15 for _ in range(self._width)]
-                      for _ in range(self._height)]
-        self._visited = [[0 for _ in range(self._width)]
-                         for _ in range(self._height)]
-
-        if 8 < self._width and 6 < self._height:
-            start_x = (self._width - len(ft[0])) // 2
-            start_y = (self._height - len(ft)) // 2
-            for y in range(len(ft)):
-                for x in range(len(ft[0])):
-                    if ft[y][x]:  # ビットマップが１なら
+        width = self._width
+        height = self._height
+
+        # 行優先の一次元バッファ (index = y * width + x)
+        self._set_maze(bytearray(b"\x0f") * (width * height), width, height)
+        self._visited = bytearray(width * height)
+
+        origin = logo_origin(width, height)
+        if origin is not None:
+            start_x, start_y = origin
+            for y in range(len(LOGO)):
+                for x in range(len(LOGO[0])):
+                    if LOGO[y][x]:  # ビットマップが１なら
                         # 一度訪れたフラグを立てて、後の迷路生成アルゴリズムから浮かす
-                        self._visited[start_y + y][start_x + x] = 1
+                        self._visited[(start_y + y) * width
+                                      + start_x + x] = 1
             self._validate_maze()
             return
         print("MazeGenerator Warning: maze is too small to add '42' in it")
         print("It must be at least (9, 7).")
 
+    def _set_maze(self, maze: bytearray, width: int, height: int) -> None:
+        """迷路のバッファを置き換えます.
+
+        INCREMENTALの層は置き換える前のバッファに対するものなので、
+        次のINCREMENTALの生成で作り直させます。
+
+        Args:
+            maze (bytearray): 新しい迷路の壁データ（行優先）.
+            width (int): 迷路の幅.
+            height (int): 迷路の高さ.
+        """
+        self._maze = maze
+        self._visited = bytearray()
+        self._maze_view = GridView(maze, width, height)
+        self._base_key = None
+
     def _validate_maze(self) -> None:
-        """42内にENTRYやEXITが含まれていないかを検証する."""
-        try:
-            for y, line in enumerate(self._visited):
-                for x, cell in enumerate(line):
-                    if (x, y) == self._entry and cell:
-                        raise ValueError(f"42 and ENTRY {self._entry} overlap")
-                    if (x, y) == self._exit and cell:
-                        raise ValueError(f"42 and EXIT {self._entry} overlap")
-        except ValueError as e:
-            print(f"ValueError: {e}")
-            sys.exit(1)
+        """42内にENTRYやEXITが含まれていないかを検証する.
+
+        Raises:
+            ValueError: ENTRYまたはEXITが'42'のセルと重なる場合。
+        """
+        width = self._width
+        ex, ey = self._entry
+        gx, gy = self._exit
+        if self._visited[ey * width + ex]:
+            raise ValueError(f"42 and ENTRY {self._entry} overlap")
+        if self._visited[gy * width + gx]:
+            raise ValueError(f"42 and EXIT {self._exit} overlap")
+
+    def _carve(self) -> None:
+        """ALGORITHMで選ばれた方法で、初期化済みの迷路に通路を掘ります."""
+        if self._algorithm == "dfs":
+            self._generate_maze(*self._entry)
+            return
+        for _ in self._carve_steps():
+            pass
+
+    def _carve_steps(self) -> Iterator[Carve]:
+        """dfs以外のアルゴリズムで通路を掘り、掘るたびに掘った通路を返します.
+
+        どのアルゴリズムも _init_maze で訪問済みにした '42' のセルには掘り進まない。
+        Eller/Sidewinderは1行ずつ確定した行を迷路に書き込み、
+        その行で開いた北と東の通路を返す。
+        """
+        width = self._width
+        height = self._height
+        maze = self._maze
+        # _visitedはこの時点で '42' のセルだけが1になっている
+        mask = self._visited
+        rng = self._rng
+
+        if self._algorithm in algorithms.STREAMING:
+            rows = (algorithms.eller_rows if self._algorithm == "eller"
+                    else algorithms.sidewinder_rows)
+            for y, row in enumerate(rows(
+                    width, height, rng,
+                    lambda y: bytes(mask[y * width:(y + 1) * width]))):
+                maze[y * width:(y + 1) * width] = row
+                for x, cell in enumerate(row):
+                    if 0 < y and not cell & 1:
+                        yield x, y, x, y - 1
+                    if not cell & 2:
+                        yield x, y, x + 1, y
+            return
+
+        carve = getattr(algorithms, self._algorithm)
+        yield from carve(maze, width, height, bytearray(mask), rng)
 
     def _generate_maze(self, x: int, y: int) -> None:
-        """再帰的な穴掘り法（DFS）を用いて迷路を生成します.
+        """明示的なスタックを用いた穴掘り法（DFS）で迷路を生成します.
+
+        再帰版と同じ順序で乱数を消費するため、同じシードからは
+        同じ迷路が生成されます。再帰を使わないので、Pythonの
+        再帰上限に関係なく大きな迷路を生成できます。
 
         Args:
-            x (int): 現在のx座標.
-            y (int): 現在のy座標.
+            x (int): 開始地点のx座標.
+            y (int): 開始地点のy座標.
         """
+        width = self._width
+        height = self._height
+        maze = self._maze
+        visited = self._visited
+        shuffle = self._rng.shuffle
+
         # 一度訪れたことがあるなら足を止める
-        if self._visited[y][x] == 1:
+        if visited[y * width + x] == 1:
             return
 
-        # (x軸移動, y軸移動, 自身から見た破壊すべき壁ビット, 移動先から見た破壊すべき壁ビット)
-        wasd = [(-1, 0, 8, 2, 'W'), (0, -1, 1, 4, 'S'),
-                (1, 0, 2, 8, 'E'), (0, 1, 4, 1, 'N')]
-
-        random.shuffle(wasd)
-        self._visited[y][x] = 1
+        # スタックの要素: (x座標, y座標, シャッフル済みの方角, 次に調べる方角の番号)
+        dirs = list(_WASD)
+        shuffle(dirs)
+        visited[y * width + x] = 1
+        stack = [(x, y, dirs, 0)]
+
+        while stack:
+            x, y, dirs, i = stack[-1]
+            # 全方角を調べ終えたら一つ前のマスに戻る
+            if i == 4:
+                stack.pop()
+                continue
+            stack[-1] = (x, y, dirs, i + 1)
 
-        for d in wasd:
+            d = dirs[i]
             nx = x + d[0]   # .次に進むx座標 next_x
             ny = y + d[1]   # .次に進むy座標 next_y
-            mw = d[2]       # .自分から見た壁ビット my_wall
-            yw = d[3]       # .相手から見た壁ビット your_wall
 
             # マップ外に出ないように
-            if not (0 <= nx < self._width and 0 <= ny < self._height):
+            if not (0 <= nx < width and 0 <= ny < height):
                 continue
             # その先に訪れていなければ壁を破壊して進む
-            if self._visited[ny][nx] == 0:
-                self._maze[y][x] -= mw
-                self._maze[ny][nx] -= yw
-                self._generate_maze(nx, ny)
+            ni = ny * width + nx
+            if visited[ni] == 0:
+                maze[y * width + x] -= d[2]     # .自分から見た壁ビット my_wall
+                maze[ni] -= d[3]                # .相手から見た壁ビット your_wall
+                next_dirs = list(_WASD)
+                shuffle(next_dirs)
+                visited[ni] = 1
+                stack.append((nx, ny, next_dirs, 0))
 
     def _break_the_wall(self) -> None:
         """3つ壁があるマスの壁をランダムに1枚破壊する.
@@ -438,16 +1272,19 @@ class MazeGenerator:
         Perfect迷路（分岐のみでループがない）を崩し、
         複数のルートが存在する迷路にします。
         """
-        # (x軸移動, y軸移動, 自身から見た破壊すべき壁ビット, 移動先から見た破壊すべき壁ビット)
-        wasd = [(-1, 0, 8, 2, 'W'), (0, -1, 1, 4, 'S'),
-                (1, 0, 2, 8, 'E'), (0, 1, 4, 1, 'N')]
+        wasd = list(_WASD)
+
+        width = self._width
+        height = self._height
+        maze = self._maze
 
-        for y, line in enumerate(self._maze):
-            for x, cell in enumerate(line):
+        for y in range(height):
+            for x in range(width):
+                cell = maze[y * width + x]
 
                 # 3つの壁に囲われたcellなら
                 if cell in (14, 13, 11, 7):
-                    random.shuffle(wasd)
+                    self._rng.shuffle(wasd)
 
                     # 方角をランダムに選択
                     for d in wasd:
@@ -457,128 +1294,785 @@ class MazeGenerator:
                         yw = d[3]       # .相手から見た壁ビット your_wall
 
                         # マップ外に出ないように
-                        if not (0 <= nx < self._width and
-                                0 <= ny < self._height):
+                        if not (0 <= nx < width and 0 <= ny < height):
                             continue
                         # 入口/出口なら
                         if (x, y) in (self._entry, self._exit):
                             continue
                         # 42だったら
-                        if self._maze[ny][nx] == 15:
+                        if maze[ny * width + nx] == 15:
                             continue
                         # 選ばれた方角に壁があれば破壊
                         if cell & mw:
-                            self._maze[y][x] -= mw
-                            self._maze[ny][nx] -= yw
+                            maze[y * width + x] -= mw
+                            maze[ny * width + nx] -= yw
                             break
 
     def _convert_hex_maze_to_grid(self) -> None:
-        """16進数(ビット)表現の迷路を、探索用のグリッド形式に展開します.
+        """16進数(ビット)表現の迷路を、描画用のグリッド形式に展開します.
 
         壁と通路を明確にするため、1セルを 2x+1 のサイズに拡張します。
-        0: 通路, 1: 壁, 5: 42ロゴ
+        0: 通路, 1: 壁, 2: スタート, 3: ゴール, 5: 42ロゴ
+
+        サイズやスタート/ゴールは生成時の値（_maze_view, _path）を使うため、
+        生成後にセッターで設定が変わっても迷路と食い違わない。
         """
-        width = self._width
-        height = self._height
+        width = self._maze_view.width
+        height = self._maze_view.height
+        gw = 2 * width + 1
 
-        self._grid = [[1 for _ in range(2 * width + 1)]
-                      for _ in range(2 * height + 1)]
+        # NumPyがあればベクトル化版、なければ純Python版で展開される
+        grid = expand_grid(self._maze, width, height)
 
-        for y in range(height):
-            gy = 2*y + 1
-            for x in range(width):
-                gx = 2*x + 1
-                info = self._maze[y][x]
-                bits = bin(info)[2:].zfill(4)
-
-                self._grid[gy][gx] = 0  # セル
-
-                # cellから見た壁情報をgridに書き込む
-                if bits[0] == "0":  # 左
-                    self._grid[gy][gx-1] = 0
-                if bits[1] == "0":  # 下
-                    self._grid[gy+1][gx] = 0
-                if bits[2] == "0":  # 右
-                    self._grid[gy][gx+1] = 0
-                if bits[3] == "0":  # 上
-                    self._grid[gy-1][gx] = 0
-                if info == 15:
-                    self._grid[gy][gx] = 5
+        path = self.path
+        if path:
+            (sx, sy), (gx, gy) = path[0], path[-1]
+            grid[sy * gw + sx] = 2
+            grid[gy * gw + gx] = 3
+
+        self._grid = grid
+        self._grid_view = GridView(grid, gw, 2 * height + 1)
+
+    def grid_window(self, left: int, top: int,
+                    cols: int, rows: int) -> GridView:
+        """描画用グリッドのうち、指定した範囲だけを展開して返します.
+
+        grid と同じ値（0: 通路, 1: 壁, 2: スタート, 3: ゴール, 5: 42ロゴ）
+        になりますが、グリッド全体は作らないため、端末に収まらない
+        大きな迷路の一部だけを描画する場合に使います。
+
+        Args:
+            left (int): 範囲の左端（グリッド座標）.
+            top (int): 範囲の上端（グリッド座標）.
+            cols (int): 範囲の幅.
+            rows (int): 範囲の高さ.
+
+        Returns:
+            GridView: rows x cols の読み取り専用ビュー。
+
+        Raises:
+            ValueError: 範囲がグリッドからはみ出している場合。
+        """
+        grid = expand_window(self._maze, self._maze_view.width,
+                             self._maze_view.height, left, top, cols, rows)
+        path = self.path
+        if path:
+            for (x, y), value in ((path[0], 2), (path[-1], 3)):
+                if left <= x < left + cols and top <= y < top + rows:
+                    grid[(y - top) * cols + x - left] = value
+        return GridView(grid, cols, rows)
+
+    def distance(self, a: tuple[int, int], b: tuple[int, int]) -> int:
+        """迷路上の2つのセルの間の最短距離（移動回数）を返します.
+
+        完全迷路では前計算したLCAの索引で O(1) で答え、そうでなければ
+        セルごとのBFSの結果をキャッシュして使い回します。
+
+        Args:
+            a (tuple[int, int]): 始点のセル (x, y).
+            b (tuple[int, int]): 終点のセル (x, y).
+
+        Raises:
+            ValueError: 迷路が未生成の場合や、セルに到達できない場合。
+        """
+        return self.oracle.distance(self._cell_index(a), self._cell_index(b))
+
+    def shortest_path(self, a: tuple[int, int],
+                      b: tuple[int, int]) -> list[tuple[int, int]]:
+        """迷路上の2つのセルの間の最短経路を、通るセル (x, y) の列で返します.
+
+        Args:
+            a (tuple[int, int]): 始点のセル (x, y).
+            b (tuple[int, int]): 終点のセル (x, y).
+
+        Returns:
+            list[tuple[int, int]]: 始点と終点を含むセルの列。
+
+        Raises:
+            ValueError: 迷路が未生成の場合や、セルに到達できない場合。
+        """
+        width = self._maze_view.width
+        cells = self.oracle.path(self._cell_index(a), self._cell_index(b))
+        return [(cell % width, cell // width) for cell in cells]
+
+    def _cell_index(self, cell: tuple[int, int]) -> int:
+        """セル (x, y) を行優先のインデックスに変換します.
+
+        Raises:
+            ValueError: セルが迷路の外にある場合。
+        """
+        x, y = cell
+        width = self._maze_view.width
+        if not (0 <= x < width and 0 <= y < self._maze_view.height):
+            raise ValueError(f"Cell {cell} is out of the maze")
+        return y * width + x
 
     def _find_path(self) -> None:
-        """幅優先探索（BFS）を用いてスタートからゴールへの最短経路を探索します."""
-        self._convert_hex_maze_to_grid()
+        """SOLVERで選ばれた方法で、スタートからゴールへの最短経路を探索します.
 
-        start = (self._entry[0] * 2 + 1, self._entry[1] * 2 + 1)
-        goal = (self._exit[0] * 2 + 1, self._exit[1] * 2 + 1)
+        どの方法でも最短経路（path, way）が求まり、展開したセルの数を
+        expanded に記録します。完全迷路では経路は1本しかないため
+        すべて同じ経路になり、非完全迷路でも長さは同じになります。
+        """
+        if self._solver == "bidirectional":
+            self._find_path_bidirectional()
+        elif self._solver == "astar":
+            self._find_path_astar()
+        else:
+            self._find_path_bfs()
 
-        sx, sy = start
-        gx, gy = goal
+    def _find_path_bfs(self, queue: "deque[int] | None" = None) -> None:
+        """幅優先探索（BFS）を用いてスタートからゴールへの最短経路を探索します.
 
-        height = len(self._grid)
-        width = len(self._grid[0])
+        拡張グリッドは作らず、_mazeの壁ビットを直接見てセル単位で探索します。
+        直前のセルは一次元のint配列（prev）に記録します。
 
-        queue = deque([start])
-        visited = {start}
-        prev: dict[tuple[int, int], tuple[int, int] | None] = {start: None}
+        Args:
+            queue (deque, optional): 探索に使う空のキュー。計測する場合は
+                長さの最大値を記録する PeakQueue を渡す。
+        """
+        width = self._width
+        maze = self._maze
+        start = self._entry[1] * width + self._entry[0]
+        goal = self._exit[1] * width + self._exit[0]
+
+        # (自身から見た壁ビット, 移動先のインデックス差分)
+        # グリッド版と同じ 東・西・南・北 の順に調べることで同じ経路になる
+        moves = _moves(width)
+
+        # prev[i] == -1 は未訪問 (外周の壁は必ず閉じているため範囲外には出ない)
+        prev = array('i', [-1]) * len(maze)
+        prev[start] = start
+        if queue is None:
+            queue = deque()
+        queue.append(start)
 
         # 進む経路を頭から取り出す
         while queue:
-            x, y = queue.popleft()
+            cur = queue.popleft()
             # ゴールにたどり着いたら終了
-            if (x, y) == goal:
+            if cur == goal:
                 break
 
             # 進むべき経路を後ろから予約する
-            for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < width and 0 <= ny < height:
-                    if self._grid[ny][nx] != 1 and (nx, ny) not in visited:
-                        visited.add((nx, ny))
-                        prev[(nx, ny)] = (x, y)
-                        queue.append((nx, ny))
-
-        # ゴールからスタートまでの経路座標をprevを手繰り寄せて取得する
-        cur: tuple[int, int] | None = goal
+            cell = maze[cur]
+            for wall, step in moves:
+                if not cell & wall:
+                    nxt = cur + step
+                    if prev[nxt] == -1:
+                        prev[nxt] = cur
+                        queue.append(nxt)
+
+        # 取り出した数 = キューに入れた数 - 残っている数（ループ内では数えない）
+        self._expanded = len(prev) - prev.count(-1) - len(queue)
+        self._path_to_way(self._trace_back(prev))
+
+    def _finish_stats(self, stats: GenerationStats) -> None:
+        """計測する場合に、最短経路の探索とレポートの作成も記録します.
+
+        SOLVERがBFSの場合は、長さの最大値を記録するキューで探索して
+        BFSのキューの最大長も記録します（solve の時間にはその記録の分も
+        含まれます）。他の探索方法やキャッシュからの復元では記録しません。
+
+        Args:
+            stats (GenerationStats): 計測結果を記録するオブジェクト.
+        """
+        if not self._solved:
+            if self._solver == "bfs":
+                queue = PeakQueue()
+                self._find_path_bfs(queue)
+                stats.bfs_queue_peak = queue.peak
+            else:
+                self._find_path()
+            stats.lap("solve")
+        stats.expanded = self._expanded
+
+        report = self._conf.report_status()
+        stats.lap("report")
+        self._report = report + "\n" + stats.report()
+
+    def _find_path_bidirectional(self) -> None:
+        """スタートとゴールの両側から幅優先探索を行い、最短経路を探索します.
+
+        探索範囲（フロンティア）が小さい側を1段ずつ広げ、反対側の
+        探索済みセルに出会った段を調べ終えたところで、その段で見つかった
+        最も短いつなぎ目を採用する。
+        """
+        width = self._width
+        maze = self._maze
+        start = self._entry[1] * width + self._entry[0]
+        goal = self._exit[1] * width + self._exit[0]
+        moves = _moves(width)
+
+        # [0]: スタート側, [1]: ゴール側
+        prevs = (array('i', [-1]) * len(maze), array('i', [-1]) * len(maze))
+        dists = (array('i', [INF_DIST]) * len(maze),
+                 array('i', [INF_DIST]) * len(maze))
+        prevs[0][start] = start
+        prevs[1][goal] = goal
+        dists[0][start] = 0
+        dists[1][goal] = 0
+        frontiers = [[start], [goal]]
+        expanded = 0
+        best = INF_DIST
+        meet = (-1, -1)  # (スタート側のセル, ゴール側のセル)
+
+        while frontiers[0] and frontiers[1] and best == INF_DIST:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            prev, dist = prevs[side], dists[side]
+            other = dists[1 - side]
+            nexts = []
+            for cur in frontiers[side]:
+                expanded += 1
+                d = dist[cur] + 1
+                cell = maze[cur]
+                for wall, step in moves:
+                    if cell & wall:
+                        continue
+                    nxt = cur + step
+                    if other[nxt] != INF_DIST and d + other[nxt] < best:
+                        best = d + other[nxt]
+                        meet = (cur, nxt) if side == 0 else (nxt, cur)
+                    if prev[nxt] == -1:
+                        prev[nxt] = cur
+                        dist[nxt] = d
+                        nexts.append(nxt)
+            frontiers[side] = nexts
+
+        self._expanded = expanded
+        if best == INF_DIST:
+            raise ValueError(f"EXIT {self._exit} is unreachable "
+                             f"from ENTRY {self._entry}")
+
+        # スタート側はprevをたどって逆順に、ゴール側はそのままたどる
+        u, v = meet
+        cells = [u]
+        while cells[-1] != start:
+            cells.append(prevs[0][cells[-1]])
+        cells.reverse()
+        cells.append(v)
+        while cells[-1] != goal:
+            cells.append(prevs[1][cells[-1]])
+        self._path_to_way(cells)
+
+    def _find_path_astar(self) -> None:
+        """マンハッタン距離をヒューリスティックとするA*で最短経路を探索します.
+
+        マンハッタン距離は実際の距離を超えないため、最初にゴールを
+        取り出した時点の経路が最短になる。評価値が同じ場合は
+        ゴールに近いセルを先に展開する。
+        """
+        width = self._width
+        maze = self._maze
+        start = self._entry[1] * width + self._entry[0]
+        goal = self._exit[1] * width + self._exit[0]
+        gx, gy = self._exit
+        moves = _moves(width)
+
+        prev = array('i', [-1]) * len(maze)
+        cost = array('i', [INF_DIST]) * len(maze)
+        prev[start] = start
+        cost[start] = 0
+        h = abs(self._entry[0] - gx) + abs(self._entry[1] - gy)
+        # (評価値, ゴールまでの推定距離, セル)
+        heap = [(h, h, start)]
+        expanded = 0
+
+        while heap:
+            f, h, cur = heappop(heap)
+            # 後からより短い経路で入れ直されたセルは読み飛ばす
+            if f - h != cost[cur]:
+                continue
+            expanded += 1
+            if cur == goal:
+                break
+            d = cost[cur] + 1
+            cell = maze[cur]
+            for wall, step in moves:
+                if not cell & wall:
+                    nxt = cur + step
+                    if d < cost[nxt]:
+                        cost[nxt] = d
+                        prev[nxt] = cur
+                        nh = abs(nxt % width - gx) + abs(nxt // width - gy)
+                        heappush(heap, (d + nh, nh, nxt))
+
+        self._expanded = expanded
+        self._path_to_way(self._trace_back(prev))
+
+    def _trace_back(self, prev: "array[int]") -> list[int]:
+        """prev配列をゴールからたどり、スタートからゴールまでのセル番号を返します.
+
+        Args:
+            prev (array): 各セルの直前のセル番号（-1は未到達）.
+
+        Returns:
+            list[int]: スタートからゴールまでのセル番号.
+
+        Raises:
+            ValueError: ゴールに到達できない場合。
+        """
+        width = self._width
+        start = self._entry[1] * width + self._entry[0]
+        goal = self._exit[1] * width + self._exit[0]
+
+        if prev[goal] == -1:
+            raise ValueError(f"EXIT {self._exit} is unreachable "
+                             f"from ENTRY {self._entry}")
+
+        # ゴールからスタートまでのセルをprevを手繰り寄せて取得する
+        cells = [goal]
+        while cells[-1] != start:
+            cells.append(prev[cells[-1]])
+        # 最後に逆転されることでスタートからゴールまでの経路が完成する
+        cells.reverse()
+        return cells
+
+    # --- Event stream (animation) ---
+
+    def generate_events(self) -> Iterator["MazeEvent"]:
+        """迷路を生成しながら、途中経過をイベントとして1つずつ返します.
+
+        generate() と同じ順序で乱数を消費するため、最後まで進めると
+        同じ迷路・最短経路になります（INCREMENTALとキャッシュは使わず、
+        常に最初から生成します）。イベントを返すたびに内部の迷路は
+        更新済みなので、受け取った側は maze や grid をそのまま描画できます。
+        generate() 本体は、このためのチェックを一切行いません。
+
+        Yields:
+            MazeEvent: "carve"（穴掘り）, "break"（壁崩し）,
+                "expand"（BFSの探索）のいずれかのイベント。
+        """
+        seed = self._seed
+        self._rng.seed(seed) if seed > 0 else self._rng.seed(42)
+
+        self._init_maze()
+        # 生成途中はスタート/ゴールを描かないよう、前回の経路を消しておく
         self._path = []
-        while cur is not None:
-            self._path.append(cur)
-            cur = prev[cur]
-        # 最後に逆転されることでスタートからゴールまでのPathが完成する
-        self._path.reverse()
+        self._way = []
+        self._solved = True
+        self._grid_view = None
+        self._oracle = None
+
+        if self._algorithm == "dfs":
+            yield from self._carve_events(*self._entry)
+        else:
+            for step in self._carve_steps():
+                self._grid_view = None
+                yield MazeEvent("carve", *step)
+        if not self._perfect:
+            yield from self._break_events()
+        yield from self._search_events()
+
+        self._grid_view = None
+        self._report = None
+
+    def _carve_events(self, x: int, y: int) -> Iterator["MazeEvent"]:
+        """_generate_maze と同じ穴掘りを行い、通路を掘るたびにイベントを返します.
+
+        Args:
+            x (int): 開始地点のx座標.
+            y (int): 開始地点のy座標.
+        """
+        width = self._width
+        height = self._height
+        maze = self._maze
+        visited = self._visited
+        shuffle = self._rng.shuffle
+
+        if visited[y * width + x] == 1:
+            return
 
-        self._grid[sy][sx] = 2
-        self._grid[gy][gx] = 3
-        self._path_to_way()
+        dirs = list(_WASD)
+        shuffle(dirs)
+        visited[y * width + x] = 1
+        stack = [(x, y, dirs, 0)]
 
-    def _path_to_way(self) -> None:
-        """座標リスト形式の経路を、方角リスト（N, E, S, W）に変換します.
+        while stack:
+            x, y, dirs, i = stack[-1]
+            if i == 4:
+                stack.pop()
+                continue
+            stack[-1] = (x, y, dirs, i + 1)
+
+            d = dirs[i]
+            nx = x + d[0]
+            ny = y + d[1]
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            ni = ny * width + nx
+            if visited[ni] == 0:
+                maze[y * width + x] -= d[2]
+                maze[ni] -= d[3]
+                next_dirs = list(_WASD)
+                shuffle(next_dirs)
+                visited[ni] = 1
+                stack.append((nx, ny, next_dirs, 0))
+                self._grid_view = None
+                yield MazeEvent("carve", x, y, nx, ny)
+
+    def _break_events(self) -> Iterator["MazeEvent"]:
+        """_break_the_wall と同じ壁崩しを行い、壁を壊すたびにイベントを返します."""
+        wasd = list(_WASD)
+
+        width = self._width
+        height = self._height
+        maze = self._maze
+
+        for y in range(height):
+            for x in range(width):
+                cell = maze[y * width + x]
+                if cell not in (14, 13, 11, 7):
+                    continue
+                self._rng.shuffle(wasd)
+                for d in wasd:
+                    nx = x + d[0]
+                    ny = y + d[1]
+                    mw = d[2]
+                    yw = d[3]
+                    if not (0 <= nx < width and 0 <= ny < height):
+                        continue
+                    if (x, y) in (self._entry, self._exit):
+                        continue
+                    if maze[ny * width + nx] == 15:
+                        continue
+                    if cell & mw:
+                        maze[y * width + x] -= mw
+                        maze[ny * width + nx] -= yw
+                        self._grid_view = None
+                        yield MazeEvent("break", x, y, nx, ny)
+                        break
+
+    def _search_events(self) -> Iterator["MazeEvent"]:
+        """_find_path と同じBFSを行い、新しいセルに到達するたびにイベントを返します.
+
+        探索が終わると最短経路（path, way）を設定します。
+        """
+        width = self._width
+        maze = self._maze
+        start = self._entry[1] * width + self._entry[0]
+        goal = self._exit[1] * width + self._exit[0]
+        moves = _moves(width)
+
+        prev = array('i', [-1]) * len(maze)
+        prev[start] = start
+        queue = deque([start])
+
+        while queue:
+            cur = queue.popleft()
+            if cur == goal:
+                break
+            cell = maze[cur]
+            for wall, step in moves:
+                if not cell & wall:
+                    nxt = cur + step
+                    if prev[nxt] == -1:
+                        prev[nxt] = cur
+                        queue.append(nxt)
+                        yield MazeEvent("expand", cur % width, cur // width,
+                                        nxt % width, nxt // width)
+
+        self._path_to_way(self._trace_back(prev))
+
+    # --- Incremental (PERFECT toggle) ---
+
+    def _generate_incremental(self) -> None:
+        """PERFECTの切り替えを差分で反映しながら迷路を生成します.
+
+        穴掘りで作った完全迷路を土台とし、壁崩しはその上に重ねる
+        取り外し可能な層として扱う。サイズ・ENTRY・EXIT・SEEDが前回と
+        同じなら穴掘りはやり直さず、層の適用/解除（行き止まりの数に比例）と、
+        BFS木に壁崩しで増えた通路だけを反映する経路更新で済ませる。
+        expanded には、今回の土台のBFSと経路更新で展開したセルの数を記録する
+        （どちらも前回の結果を使い回した場合は0）。
+        """
+        self._expanded = 0
+        base_key = (self._width, self._height, self._entry, self._exit,
+                    self._seed, self._algorithm)
+        if self._base_key != base_key:
+            self._build_base()
+            self._base_key = base_key
+
+        if self._perfect:
+            self._unapply_layer()
+            prev = self._tree_prev
+        else:
+            self._apply_layer()
+            if self._loop_prev is None:
+                self._loop_prev = self._repair_tree()
+            prev = self._loop_prev
+
+        # 描画用グリッドは参照された時に作り直す
+        self._grid_view = None
+        self._path_to_way(self._trace_back(prev))
+
+    def _build_base(self) -> None:
+        """土台となる完全迷路と、ENTRYからのBFS木を作成します."""
+        seed = self._seed
+        self._rng.seed(seed) if seed > 0 else self._rng.seed(42)
+
+        self._init_maze()
+        self._carve()
+
+        self._dead_ends = [i for i, cell in enumerate(self._maze)
+                           if cell in (14, 13, 11, 7)]
+        self._layer = None
+        self._layer_applied = False
+        self._loop_prev = None
+
+        # 完全迷路は木なので、全セルへの経路と距離を一度のBFSで求めておく
+        width = self._width
+        maze = self._maze
+        start = self._entry[1] * width + self._entry[0]
+        moves = _moves(width)
+
+        prev = array('i', [-1]) * len(maze)
+        dist = array('i', [INF_DIST]) * len(maze)
+        prev[start] = start
+        dist[start] = 0
+        queue = deque([start])
+        while queue:
+            cur = queue.popleft()
+            d = dist[cur] + 1
+            cell = maze[cur]
+            for wall, step in moves:
+                if not cell & wall:
+                    nxt = cur + step
+                    if prev[nxt] == -1:
+                        prev[nxt] = cur
+                        dist[nxt] = d
+                        queue.append(nxt)
+        self._tree_prev = prev
+        self._tree_dist = dist
+        # キューが空になるまで探索したので、届いたセルはすべて展開済み
+        self._expanded += len(prev) - prev.count(-1)
+
+    def _apply_layer(self) -> None:
+        """壁崩しの層を迷路に適用します（初回は層を作成します）.
+
+        層は SEED から作った専用のサブシードで決まるため、何度作っても同じになる。
+        壊す対象は土台の行き止まりだけなので、処理量は行き止まりの数に比例する。
+        """
+        if self._layer_applied:
+            return
+        maze = self._maze
+
+        if self._layer is not None:
+            for i, j, mw, yw in self._layer:
+                maze[i] &= ~mw
+                maze[j] &= ~yw
+            self._layer_applied = True
+            return
+
+        seed = self._seed if self._seed > 0 else 42
+        self._rng.seed(f"{seed}:break")
+        shuffle = self._rng.shuffle
+
+        wasd = list(_WASD)
+
+        width = self._width
+        height = self._height
+        ends = (self._entry[1] * width + self._entry[0],
+                self._exit[1] * width + self._exit[0])
+        layer = []
+
+        for i in self._dead_ends:
+            cell = maze[i]
+            # 先に壊した壁で行き止まりでなくなったcellや、入口/出口は対象外
+            if cell not in (14, 13, 11, 7) or i in ends:
+                continue
+            x, y = i % width, i // width
+            shuffle(wasd)
+            for d in wasd:
+                nx = x + d[0]
+                ny = y + d[1]
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                j = ny * width + nx
+                # 42だったら
+                if maze[j] == 15:
+                    continue
+                # 選ばれた方角に壁があれば破壊
+                if cell & d[2]:
+                    maze[i] &= ~d[2]
+                    maze[j] &= ~d[3]
+                    layer.append((i, j, d[2], d[3]))
+                    break
+
+        self._layer = layer
+        self._layer_applied = True
+
+    def _unapply_layer(self) -> None:
+        """適用中の壁崩しの層を取り外し、土台の完全迷路に戻します."""
+        if not self._layer_applied or self._layer is None:
+            return
+        maze = self._maze
+        for i, j, mw, yw in self._layer:
+            maze[i] |= mw
+            maze[j] |= yw
+        self._layer_applied = False
+
+    def _repair_tree(self) -> "array[int]":
+        """BFS木に壁崩しで増えた通路を反映し、新しい最短経路木を返します.
+
+        通路が増えると距離は縮む一方なので、縮んだセルだけを
+        距離の小さい順に処理して周囲へ伝播させる。
+        土台の木（_tree_prev, _tree_dist）は書き換えない。
+        処理したセルの数を expanded に加える。
+
+        Returns:
+            array: 壁崩し後の各セルの直前のセル番号。
+        """
+        assert self._layer is not None
+        width = self._width
+        maze = self._maze
+        moves = _moves(width)
+
+        prev = array('i', self._tree_prev)
+        dist = array('i', self._tree_dist)
+        heap: list[tuple[int, int]] = []
+
+        # 新しい通路の両端で距離が縮むものを起点にする
+        for i, j, _, _ in self._layer:
+            for a, b in ((i, j), (j, i)):
+                if dist[a] + 1 < dist[b]:
+                    dist[b] = dist[a] + 1
+                    prev[b] = a
+                    heappush(heap, (dist[b], b))
+
+        expanded = 0
+        while heap:
+            d, cur = heappop(heap)
+            # すでにより短い距離で処理済みなら飛ばす
+            if d != dist[cur]:
+                continue
+            expanded += 1
+            cell = maze[cur]
+            for wall, step in moves:
+                if not cell & wall:
+                    nxt = cur + step
+                    if d + 1 < dist[nxt]:
+                        dist[nxt] = d + 1
+                        prev[nxt] = cur
+                        heappush(heap, (d + 1, nxt))
+        self._expanded += expanded
+        return prev
+
+    def _path_to_way(self, cells: list[int]) -> None:
+        """セル番号の経路を、座標リストと方角リスト（N, E, S, W）に変換します.
+
+        座標リスト（_path）は描画用の拡張グリッド上の座標で、
+        セル間の通路も含みます。
+
+        Args:
+            cells (list): スタートからゴールまでのセル番号 (y * width + x).
 
         Raises:
             ValueError: 隣接していないセルへの移動が検出された場合。
         """
+        width = self._width
+        self._path = []
         self._way = []
 
-        # グリッド拡張されているため、2つ飛ばしで元のセルの動きを取得
-        just_cell_path = self.path[::2]
+        x1, y1 = cells[0] % width, cells[0] // width
+        self._path.append((2 * x1 + 1, 2 * y1 + 1))
 
         # zipは引数が取り出せない時に処理が終了する
         # 最後のマス（EXIT）だった時にそこから向かうルートがないため処理が終了する
-        for (x1, y1), (x2, y2) in zip(just_cell_path, just_cell_path[1:]):
+        for c1, c2 in zip(cells, cells[1:]):
+            x1, y1 = c1 % width, c1 // width
+            x2, y2 = c2 % width, c2 // width
             dx = x2 - x1
             dy = y2 - y1
 
-            if dx == 2 and dy == 0:
+            if dx == 1 and dy == 0:
                 self._way.append("E")
-            elif dx == -2 and dy == 0:
+            elif dx == -1 and dy == 0:
                 self._way.append("W")
-            elif dx == 0 and dy == 2:
+            elif dx == 0 and dy == 1:
                 self._way.append("S")
-            elif dx == 0 and dy == -2:
+            elif dx == 0 and dy == -1:
                 self._way.append("N")
             else:
                 raise ValueError(f"Invalid move: {(x1, y1)} -> {(x2, y2)}")
 
+            # セル間の通路と移動先のセルをグリッド座標で追加
+            self._path.append((x1 + x2 + 1, y1 + y2 + 1))
+            self._path.append((2 * x2 + 1, 2 * y2 + 1))
+        self._solved = True
+
+
+class MazeEvent(NamedTuple):
+    """generate_eventsで返される、生成途中の1つの出来事.
+
+    (x, y) と (nx, ny) は隣り合うセルで、どちらも迷路上の座標。
+
+    Attributes:
+        kind (str): "carve"（穴掘りで通路を掘った）,
+            "break"（壁崩しで壁を壊した）, "expand"（BFSが新しいセルに到達した）.
+        x (int): 元のセルのx座標.
+        y (int): 元のセルのy座標.
+        nx (int): 通路でつながった先のセルのx座標.
+        ny (int): 通路でつながった先のセルのy座標.
+    """
+
+    kind: str
+    x: int
+    y: int
+    nx: int
+    ny: int
+
+
+class MazeResult(NamedTuple):
+    """generate_manyで返される1つの迷路の生成結果.
+
+    Attributes:
+        seed (int): 生成に使った乱数シード.
+        maze (bytes): 行優先の壁データ（1セル1バイト）.
+        way (str): 最短経路の方角文字列（N, E, S, W）.
+    """
+
+    seed: int
+    maze: bytes
+    way: str
+
+
+# ワーカープロセスごとに1つだけ作られる生成器
+_worker_generator: MazeGenerator | None = None
+
+
+def _init_worker(conf: MazeConfig) -> None:
+    """ワーカープロセスの生成器を検証済みの設定から作成します.
+
+    Args:
+        conf (MazeConfig): 検証済みの設定オブジェクト.
+    """
+    global _worker_generator
+    _worker_generator = MazeGenerator.from_config(conf)
+
+
+def _generate_one(seed: int) -> MazeResult:
+    """ワーカープロセスの生成器で1つの迷路を生成します."""
+    assert _worker_generator is not None
+    return _generate_seed(_worker_generator, seed)
+
+
+def _generate_seed(generator: MazeGenerator, seed: int) -> MazeResult:
+    """生成器のシードだけを差し替えて1つの迷路を生成します.
+
+    Args:
+        generator (MazeGenerator): 使い回す生成器.
+        seed (int): 乱数シード（範囲は呼び出し元で検証済み）.
+
+    Returns:
+        MazeResult: 生成結果。
+    """
+    # model_copyは再検証しないため、ファイル確認も走らない
+    generator._conf = generator._conf.model_copy(update={"seed": seed})
+    generator._seed = seed
+    generator.generate()
+    return MazeResult(seed, bytes(generator._maze), "".join(generator.way))
+
 
 if __name__ == "__main__":
     pass
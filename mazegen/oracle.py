@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""1つの迷路に対する多数の「AからBまでの距離」の問い合わせに答えるモジュール.
+
+完全迷路（木）の場合は、根からの深さとオイラーツアー + スパーステーブルによる
+最小共通祖先（LCA）を前計算し、距離を O(1)、経路を経路長に比例する時間で返す。
+完全迷路でない場合は、始点ごとのBFSの結果をLRU方式でキャッシュして使い回す。
+"""
+
+from array import array
+from collections import OrderedDict, deque
+from .storage import HAS_NUMPY
+
+# (自身から見た壁ビット, 移動先のインデックス差分) は幅ごとに作る
+_WALLS = (2, 8, 4, 1)
+
+
+class DistanceOracle:
+    """迷路のセル間の最短距離と最短経路を答える索引.
+
+    セルは行優先のインデックス (y * width + x) で指定する。
+    作成時に迷路をコピーするため、元の迷路が変わっても結果は変わらない。
+
+    Attributes:
+        _maze (bytes): 迷路の壁ビットのコピー（行優先）.
+        _width (int): 迷路の幅.
+        _moves (tuple): 壁ビットとインデックス差分の組.
+        _is_tree (bool): 迷路が木（完全迷路）かどうか.
+        _depth (array): 根からの距離（到達できないセルは-1）.
+        _parent (array): 根に向かう親のセル（木の場合）.
+        _first (array): 各セルがオイラーツアーに最初に現れる位置.
+        _table (list): スパーステーブル（区間内で最も浅いツアー上の位置）.
+        _euler (array): オイラーツアーで訪れるセルの列.
+        _level (array): オイラーツアー上の各位置の深さ.
+        _sources (OrderedDict): 始点ごとのBFSの結果 (距離, 直前のセル).
+        _max_sources (int): キャッシュするBFSの結果の最大件数.
+        _bfs_runs (int): 実行したBFSの回数.
+    """
+
+    def __init__(self, maze: bytes | bytearray, width: int, height: int,
+                 root: int = 0, max_sources: int = 16) -> None:
+        """DistanceOracleを初期化し、木であれば索引を前計算します.
+
+        Args:
+            maze (bytes | bytearray): 行優先の壁ビット (1:北, 2:東, 4:南, 8:西).
+            width (int): 迷路の幅.
+            height (int): 迷路の高さ.
+            root (int): 木の根にするセル（通常はENTRY）.
+            max_sources (int): 完全迷路でない場合にキャッシュする
+                BFSの結果の最大件数.
+
+        Raises:
+            ValueError: 迷路の大きさが合わない場合や、根が範囲外の場合。
+        """
+        if len(maze) != width * height:
+            raise ValueError(f"Maze size {len(maze)} does not match "
+                             f"{width} x {height}")
+        if not 0 <= root < len(maze):
+            raise ValueError(f"Root cell {root} is out of the maze")
+        self._maze = bytes(maze)
+        self._width = width
+        self._moves = tuple(zip(_WALLS, (1, -1, width, -width)))
+        self._sources: "OrderedDict[int, tuple[array[int], array[int]]]" = \
+            OrderedDict()
+        self._max_sources = max_sources
+        self._bfs_runs = 0
+
+        dist, prev = self._bfs(root)
+        reached = len(dist) - dist.count(-1)
+        passages = sum(4 - bin(cell & 15).count("1")
+                       for cell in self._maze) // 2
+        # 根から届くすべてのセルが木になっていて、届かないのは'42'のセルだけ
+        self._is_tree = (passages == reached - 1
+                         and reached == len(maze) - self._maze.count(15))
+        self._depth = dist
+        self._parent = prev
+        self._euler = array('i')
+        self._level = array('i')
+        self._first = array('i')
+        self._table: "list[array[int]]" = []
+        if self._is_tree:
+            self._build_lca(root)
+        else:
+            self._remember(root, dist, prev)
+
+    @property
+    def is_tree(self) -> bool:
+        """迷路が木（完全迷路）で、LCAの索引を使っているかを返します."""
+        return self._is_tree
+
+    @property
+    def bfs_runs(self) -> int:
+        """作成時を含め、実行したBFSの回数を返します."""
+        return self._bfs_runs
+
+    def distance(self, a: int, b: int) -> int:
+        """セル a から b までの最短距離（移動回数）を返します.
+
+        Raises:
+            ValueError: どちらかのセルに到達できない場合。
+        """
+        if self._is_tree:
+            self._check(self._depth, a)
+            self._check(self._depth, b)
+            depth = self._depth
+            return depth[a] + depth[b] - 2 * depth[self.lca(a, b)]
+        _, target, dist, _ = self._search(a, b)
+        return dist[target]
+
+    def path(self, a: int, b: int) -> list[int]:
+        """セル a から b までの最短経路のセル（両端を含む）を返します.
+
+        Raises:
+            ValueError: どちらかのセルに到達できない場合。
+        """
+        if self._is_tree:
+            self._check(self._depth, a)
+            self._check(self._depth, b)
+            top = self.lca(a, b)
+            parent = self._parent
+            up = [a]
+            while up[-1] != top:
+                up.append(parent[up[-1]])
+            down = [b]
+            while down[-1] != top:
+                down.append(parent[down[-1]])
+            return up + down[-2::-1]
+
+        # 探索の終点から始点へ直前のセルをたどる
+        source, target, _, prev = self._search(a, b)
+        cells = [target]
+        while cells[-1] != source:
+            cells.append(prev[cells[-1]])
+        if source == a:
+            cells.reverse()
+        return cells
+
+    def lca(self, a: int, b: int) -> int:
+        """木の根から見た、セル a と b の最小共通祖先を O(1) で返します.
+
+        Raises:
+            ValueError: 迷路が木でない場合。
+        """
+        if not self._is_tree:
+            raise ValueError("LCA is only available for perfect mazes")
+        lo, hi = self._first[a], self._first[b]
+        if hi < lo:
+            lo, hi = hi, lo
+        k = (hi - lo + 1).bit_length() - 1
+        row = self._table[k]
+        i, j = row[lo], row[hi - (1 << k) + 1]
+        return self._euler[i if self._level[i] <= self._level[j] else j]
+
+    def _build_lca(self, root: int) -> None:
+        """オイラーツアーと、ツアー上の深さの最小値のスパーステーブルを作ります.
+
+        スパーステーブルのk段目は、ツアー上の位置 i から 2**k 個の範囲で
+        最も浅いセルの位置を持つ（メモリは O(n log n)）。
+        NumPyがインストールされていれば、各段の計算をベクトル化して行う。
+        """
+        if HAS_NUMPY:
+            import numpy as np
+        maze = self._maze
+        moves = self._moves
+        parent = self._parent
+        euler = self._euler
+        first = array('i', [-1]) * len(maze)
+
+        # 明示的なスタックで木をたどり、子から戻るたびに親をもう一度記録する
+        first[root] = 0
+        euler.append(root)
+        stack = [(root, 0)]
+        while stack:
+            cur, i = stack[-1]
+            cell = maze[cur]
+            while i < 4:
+                wall, step = moves[i]
+                i += 1
+                nxt = cur + step
+                # 根の親は自分自身なので、根でも同じ条件で子だけを選べる
+                if not cell & wall and nxt != parent[cur]:
+                    break
+            else:
+                stack.pop()
+                if stack:
+                    euler.append(stack[-1][0])
+                continue
+            stack[-1] = (cur, i)
+            first[nxt] = len(euler)
+            euler.append(nxt)
+            stack.append((nxt, 0))
+        self._first = first
+
+        # ツアー上の位置ごとの深さ
+        depth = self._depth
+        level = array('i', [depth[cell] for cell in euler])
+        size = len(euler)
+        row = array('i', range(size))
+        table = [row]
+        k = 1
+        while 1 << k <= size:
+            half = 1 << (k - 1)
+            count = size - (1 << k) + 1
+            if HAS_NUMPY:
+                lv = np.frombuffer(level, dtype=np.int32)
+                pr = np.frombuffer(row, dtype=np.int32)
+                x, y = pr[:count], pr[half:half + count]
+                row = array('i', np.where(lv[x] <= lv[y], x, y)
+                            .astype(np.int32).tobytes())
+            else:
+                prev_row = row
+                row = array('i', [0]) * count
+                for i in range(count):
+                    x_, y_ = prev_row[i], prev_row[i + half]
+                    row[i] = x_ if level[x_] <= level[y_] else y_
+            table.append(row)
+            k += 1
+        self._level = level
+        self._table = table
+
+    @staticmethod
+    def _check(dist: "array[int]", cell: int) -> None:
+        """探索の結果でセルに到達できているか確認します."""
+        if not 0 <= cell < len(dist) or dist[cell] == -1:
+            raise ValueError(f"Cell {cell} is not reachable")
+
+    def _search(self, a: int, b: int
+                ) -> "tuple[int, int, array[int], array[int]]":
+        """a または b を始点とするBFSの結果を返します.
+
+        距離は対称なので、どちらかの端点の結果がキャッシュにあれば使い回し、
+        なければ a を始点として新しく探索する。
+
+        Returns:
+            tuple: (始点, 終点, 距離, 直前のセル).
+
+        Raises:
+            ValueError: どちらかのセルに到達できない場合。
+        """
+        # 木の場合と同じく、根から届かないセル（'42'のセルなど）は
+        # 自分自身への距離でも到達できないものとして扱う
+        self._check(self._depth, a)
+        self._check(self._depth, b)
+        sources = self._sources
+        source, target = (b, a) if b in sources and a not in sources \
+            else (a, b)
+        if source in sources:
+            sources.move_to_end(source)
+        else:
+            self._remember(source, *self._bfs(source))
+        dist, prev = sources[source]
+        return source, target, dist, prev
+
+    def _remember(self, source: int, dist: "array[int]",
+                  prev: "array[int]") -> None:
+        """BFSの結果をキャッシュし、上限を超えた古いものを破棄します."""
+        self._sources[source] = (dist, prev)
+        while self._max_sources < len(self._sources):
+            self._sources.popitem(last=False)
+
+    def _bfs(self, source: int) -> "tuple[array[int], array[int]]":
+        """source から全セルへの距離と直前のセルを幅優先探索で求めます."""
+        self._bfs_runs += 1
+        maze = self._maze
+        moves = self._moves
+        dist = array('i', [-1]) * len(maze)
+        prev = array('i', [-1]) * len(maze)
+        dist[source] = 0
+        prev[source] = source
+        queue = deque([source])
+        while queue:
+            cur = queue.popleft()
+            d = dist[cur] + 1
+            cell = maze[cur]
+            for wall, step in moves:
+                if not cell & wall:
+                    nxt = cur + step
+                    if dist[nxt] == -1:
+                        dist[nxt] = d
+                        prev[nxt] = cur
+                        queue.append(nxt)
+        return dist, prev
+
+
+if __name__ == "__main__":
+    pass
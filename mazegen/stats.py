@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""迷路生成の段階ごとの時間と件数を記録するモジュール.
+
+MazeGenerator.enable_stats() で有効にした場合だけ generate() が
+GenerationStats を作って記録する。無効の場合は generate() 内の
+None の判定だけで、探索や穴掘りのループには計測を入れない。
+cProfile と pstats は読み込みに時間がかかるため、プロファイルを
+取る時にだけ読み込む。
+"""
+
+import io
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pstats
+
+# 段階ごとに呼ばれるコールバック: (段階の名前, 時間[秒])
+StageHook = Callable[[str, float], None]
+
+# 壁ビット(0〜15)ごとの開いている辺の数（ロゴのセル15は0）
+_OPEN_SIDES = bytes(4 - bin(i & 15).count("1") for i in range(256))
+
+
+def count_passages(maze: bytes | bytearray) -> int:
+    """迷路の中で開いている通路（隣り合うセルの間の壁がない所）の数を返します.
+
+    外周の壁は必ず閉じているため、開いている辺の合計の半分が通路の数になる。
+    """
+    return sum(maze.translate(_OPEN_SIDES)) // 2
+
+
+class PeakQueue(deque[int]):
+    """長さの最大値を記録するBFS用のキュー.
+
+    append のたびに長さを調べるため通常の deque より遅く、計測する時にだけ
+    _find_path_bfs に渡す。
+
+    Attributes:
+        peak (int): これまでのキューの長さの最大値.
+    """
+
+    def __init__(self) -> None:
+        """空のキューを作ります."""
+        super().__init__()
+        self.peak = 0
+
+    def append(self, x: int) -> None:
+        """末尾に追加し、長さの最大値を更新します."""
+        super().append(x)
+        if self.peak < len(self):
+            self.peak = len(self)
+
+
+class GenerationStats:
+    """generate() 1回分の、段階ごとの時間と件数.
+
+    段階の時間は直前の段階の終わり（または作成時）からの経過時間で、
+    コールバックの実行時間は次の段階に含めない。
+
+    Attributes:
+        stages (dict[str, float]): 段階の名前と時間（秒）. 実行した順.
+        carved (int): 穴掘りで作った通路の数.
+        broken (int): 壁崩しで壊した壁の数.
+        expanded (int): 最短経路の探索で展開したセルの数.
+        bfs_queue_peak (int | None): BFSのキューの長さの最大値
+            （SOLVERがBFSで、generate() の中で探索した場合のみ）.
+        profile (pstats.Stats | None): cProfile の結果（有効な場合のみ）.
+        _on_stage (StageHook | None): 段階ごとに呼ぶコールバック.
+        _last (float): 直前の段階の終わりの時刻.
+    """
+
+    def __init__(self, on_stage: StageHook | None = None) -> None:
+        """記録を始めます.
+
+        Args:
+            on_stage (StageHook, optional): 段階が終わるたびに
+                (段階の名前, 時間[秒]) で呼ぶコールバック.
+        """
+        self.stages: dict[str, float] = {}
+        self.carved = 0
+        self.broken = 0
+        self.expanded = 0
+        self.bfs_queue_peak: int | None = None
+        self.profile: "pstats.Stats | None" = None
+        self._on_stage = on_stage
+        self._last = time.perf_counter()
+
+    def lap(self, name: str) -> None:
+        """直前の段階の終わりから今までを、1つの段階として記録します.
+
+        Args:
+            name (str): 段階の名前.
+        """
+        elapsed = time.perf_counter() - self._last
+        self.stages[name] = elapsed
+        if self._on_stage is not None:
+            self._on_stage(name, elapsed)
+        self._last = time.perf_counter()
+
+    def skip(self) -> None:
+        """ここまでの時間をどの段階にも含めないようにします."""
+        self._last = time.perf_counter()
+
+    @property  # getter
+    def total(self) -> float:
+        """記録した段階の時間の合計（秒）を返します."""
+        return sum(self.stages.values())
+
+    def report(self) -> str:
+        """段階ごとの時間と件数を、report_status と同じ形式で返します."""
+        lines = ["===Generation stats==="]
+        for name, elapsed in self.stages.items():
+            lines.append(f"{name.upper()}: {elapsed * 1000:.3f} ms")
+        lines.append(f"TOTAL: {self.total * 1000:.3f} ms")
+        lines.append(f"CARVED: {self.carved}")
+        lines.append(f"BROKEN: {self.broken}")
+        lines.append(f"EXPANDED: {self.expanded}")
+        if self.bfs_queue_peak is not None:
+            lines.append(f"BFS_QUEUE_PEAK: {self.bfs_queue_peak}")
+        return "\n".join(lines)
+
+    def profile_report(self, sort: str = "cumulative",
+                       limit: int = 20) -> str:
+        """cProfile の結果を pstats の表で返します.
+
+        Args:
+            sort (str, optional): 並べ替えの基準（pstats.Stats.sort_stats）.
+            limit (int, optional): 表示する関数の数.
+
+        Raises:
+            ValueError: プロファイルを取っていない場合。
+        """
+        if self.profile is None:
+            raise ValueError("Profiling was not enabled")
+        stream = io.StringIO()
+        self.profile.stream = stream  # type: ignore[attr-defined]
+        self.profile.sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""迷路データを一次元バッファで保持するためのモジュール.
+
+迷路の壁情報（4bit）やグリッドの値は 0〜255 に収まるため、
+list[list[int]] ではなく行優先の bytearray に 1セル1バイトで格納する。
+外部には GridView を通して2次元配列のように読み取り専用で公開する。
+
+NumPyがインストールされていれば、グリッド展開をベクトル化して行う。
+NumPyの読み込みには時間がかかるため、実際に展開する時まで読み込まない。
+"""
+
+from collections.abc import Iterator, Sequence
+from importlib.util import find_spec
+from typing import overload
+
+# インストールされているかだけを確認し、読み込みは使う時に行う
+HAS_NUMPY = find_spec("numpy") is not None
+
+
+class GridView(Sequence[memoryview]):
+    """行優先の一次元バッファを2次元配列として見せる読み取り専用ビュー.
+
+    `view[y][x]` や `for row in view` のように list[list[int]] と
+    同じ感覚で参照できる。各行は読み取り専用の memoryview として返す。
+
+    Attributes:
+        _buf (memoryview): 元バッファの読み取り専用ビュー.
+        _width (int): 1行あたりのセル数.
+        _height (int): 行数.
+    """
+
+    __slots__ = ("_buf", "_width", "_height")
+
+    def __init__(self, buf: bytearray, width: int, height: int) -> None:
+        """GridViewを初期化します.
+
+        Args:
+            buf (bytearray): 行優先で並んだセルのバッファ.
+            width (int): 1行あたりのセル数.
+            height (int): 行数.
+
+        Raises:
+            ValueError: バッファの長さが width * height と一致しない場合。
+        """
+        if len(buf) != width * height:
+            raise ValueError(f"Buffer size {len(buf)} does not match "
+                             f"{width} x {height}")
+        self._buf = memoryview(buf).toreadonly()
+        self._width = width
+        self._height = height
+
+    @property
+    def width(self) -> int:
+        """1行あたりのセル数を返します."""
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """行数を返します."""
+        return self._height
+
+    def __len__(self) -> int:
+        """行数を返します."""
+        return self._height
+
+    @overload
+    def __getitem__(self, index: int) -> memoryview: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[memoryview]: ...
+
+    def __getitem__(self, index: int | slice) -> memoryview | list[memoryview]:
+        """指定した行（またはスライス範囲の行リスト）を返します."""
+        if isinstance(index, slice):
+            return [self[y] for y in range(*index.indices(self._height))]
+        if index < 0:
+            index += self._height
+        if not 0 <= index < self._height:
+            raise IndexError("GridView index out of range")
+        start = index * self._width
+        return self._buf[start:start + self._width]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        """各行を先頭から順に返します."""
+        w = self._width
+        for start in range(0, self._height * w, w):
+            yield self._buf[start:start + w]
+
+    def tolist(self) -> list[list[int]]:
+        """list[list[int]] 形式のコピーを返します."""
+        return [row.tolist() for row in self]
+
+
+def expand_grid(maze: bytearray, width: int, height: int) -> bytearray:
+    """壁ビットの迷路を 2x+1 サイズの描画用グリッドに展開します.
+
+    0: 通路, 1: 壁, 5: 42ロゴ（4方向すべてが壁のセル）
+    NumPyが使える場合はベクトル化版、使えない場合は純Python版で展開する。
+
+    Args:
+        maze (bytearray): 行優先の壁ビット (1:北, 2:東, 4:南, 8:西).
+        width (int): 迷路の幅.
+        height (int): 迷路の高さ.
+
+    Returns:
+        bytearray: 行優先のグリッド ((2 * height + 1) x (2 * width + 1)).
+    """
+    if HAS_NUMPY:
+        return _expand_grid_numpy(maze, width, height)
+    return _expand_grid_python(maze, width, height)
+
+
+def expand_window(maze: bytearray, width: int, height: int,
+                  left: int, top: int, cols: int, rows: int) -> bytearray:
+    """描画用グリッドのうち (left, top) から cols x rows の範囲だけを展開します.
+
+    範囲にかかるセルだけを切り出して expand_grid で展開し、はみ出した
+    1列/1行を切り落とす。隣り合うセルの壁ビットは一致しているため、
+    グリッド全体を展開して切り取った場合と同じ結果になる。
+
+    Args:
+        maze (bytearray): 行優先の壁ビット (1:北, 2:東, 4:南, 8:西).
+        width (int): 迷路の幅.
+        height (int): 迷路の高さ.
+        left (int): 範囲の左端（グリッド座標）.
+        top (int): 範囲の上端（グリッド座標）.
+        cols (int): 範囲の幅（グリッド座標, 1以上）.
+        rows (int): 範囲の高さ（グリッド座標, 1以上）.
+
+    Returns:
+        bytearray: 行優先のグリッド (rows x cols).
+
+    Raises:
+        ValueError: 範囲がグリッドからはみ出している場合。
+    """
+    if (left < 0 or top < 0 or cols < 1 or rows < 1
+            or 2 * width + 1 < left + cols or 2 * height + 1 < top + rows):
+        raise ValueError(f"Window ({left}, {top}, {cols}, {rows}) is out of "
+                         f"the {2 * width + 1} x {2 * height + 1} grid")
+
+    # 範囲にかかるセル [cx0, cx1) x [cy0, cy1)（最低1セルは含める）
+    cx0 = min(left // 2, width - 1)
+    cy0 = min(top // 2, height - 1)
+    cx1 = min(width, max((left + cols) // 2, cx0 + 1))
+    cy1 = min(height, max((top + rows) // 2, cy0 + 1))
+    sub_w = cx1 - cx0
+    sub = bytearray().join(maze[y * width + cx0:y * width + cx1]
+                           for y in range(cy0, cy1))
+    grid = expand_grid(sub, sub_w, cy1 - cy0)
+
+    # 切り出したグリッドから範囲の分だけを取り出す
+    gw = 2 * sub_w + 1
+    ox = left - 2 * cx0
+    oy = top - 2 * cy0
+    return bytearray().join(grid[y * gw + ox:y * gw + ox + cols]
+                            for y in range(oy, oy + rows))
+
+
+def _expand_grid_numpy(maze: bytearray, width: int,
+                       height: int) -> bytearray:
+    """NumPyのビット演算とストライド代入でグリッドを展開します."""
+    import numpy as np
+
+    gw = 2 * width + 1
+    gh = 2 * height + 1
+    grid_buf = bytearray(b"\x01") * (gw * gh)
+    if not width or not height:
+        return grid_buf
+
+    # grid_bufを直接書き換えるビュー（コピーは発生しない）
+    grid = np.frombuffer(grid_buf, dtype=np.uint8).reshape(gh, gw)
+    m = np.frombuffer(maze, dtype=np.uint8).reshape(height, width)
+
+    cells = grid[1::2, 1::2]
+    cells[...] = 0
+    cells[m == 15] = 5
+    # 各セルから見て壁ビットが0の方向の通路を開ける
+    grid[1::2, 0:-1:2][(m & 8) == 0] = 0    # 左
+    grid[2::2, 1::2][(m & 4) == 0] = 0      # 下
+    grid[1::2, 2::2][(m & 2) == 0] = 0      # 右
+    grid[0:-1:2, 1::2][(m & 1) == 0] = 0    # 上
+    return grid_buf
+
+
+def _expand_grid_python(maze: bytearray, width: int,
+                        height: int) -> bytearray:
+    """純Pythonの二重ループでグリッドを展開します."""
+    gw = 2 * width + 1
+
+    grid = bytearray(b"\x01") * (gw * (2 * height + 1))
+
+    for y in range(height):
+        gy = 2*y + 1
+        for x in range(width):
+            gx = 2*x + 1
+            info = maze[y * width + x]
+            bits = bin(info)[2:].zfill(4)
+            gi = gy * gw + gx
+
+            grid[gi] = 0  # セル
+
+            # cellから見た壁情報をgridに書き込む
+            if bits[0] == "0":  # 左
+                grid[gi - 1] = 0
+            if bits[1] == "0":  # 下
+                grid[gi + gw] = 0
+            if bits[2] == "0":  # 右
+                grid[gi + 1] = 0
+            if bits[3] == "0":  # 上
+                grid[gi - gw] = 0
+            if info == 15:
+                grid[gi] = 5
+    return grid
+
+
+if __name__ == "__main__":
+    pass
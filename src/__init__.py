@@ -1,8 +1,53 @@
-"""A-Maze-ing src package."""
+"""A-Maze-ing src package.
 
+描画（MazeView）やメニューのモジュールは読み込みに時間がかかるため、
+各名前は初めて参照された時にそのモジュールから読み込む。
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+# 依存のない小さなモジュールで、サブモジュールと同じ名前のため先に読み込む
 from .config_parser import config_parser as config_parser
-from .visualizer_ascii import MazeView as MazeView
-from .file_output import output_maze as output_maze
-from .user_input import user_input_choice as user_input_choice
 
-__all__ = ["config_parser", "MazeView", "output_maze", "user_input_choice"]
+if TYPE_CHECKING:
+    from .visualizer_ascii import MazeView as MazeView
+    from .file_output import output_maze as output_maze
+    from .file_output import write_maze_rows as write_maze_rows
+    from .file_input import load_maze as load_maze
+    from .file_binary import MazeFileReader as MazeFileReader
+    from .file_binary import output_maze_binary as output_maze_binary
+    from .file_binary import binary_to_text as binary_to_text
+    from .file_binary import text_to_binary as text_to_binary
+    from .user_input import user_input_choice as user_input_choice
+    from .batch import batch_main as batch_main
+    from .batch import run_batch as run_batch
+
+# 公開する名前と、それを定義しているモジュール
+_MODULES = {
+    "MazeView": ".visualizer_ascii",
+    "output_maze": ".file_output",
+    "write_maze_rows": ".file_output",
+    "load_maze": ".file_input",
+    "MazeFileReader": ".file_binary",
+    "output_maze_binary": ".file_binary",
+    "binary_to_text": ".file_binary",
+    "text_to_binary": ".file_binary",
+    "user_input_choice": ".user_input",
+    "batch_main": ".batch",
+    "run_batch": ".batch",
+}
+
+__all__ = ["config_parser", "MazeView", "output_maze", "write_maze_rows",
+           "load_maze", "MazeFileReader", "output_maze_binary",
+           "binary_to_text", "text_to_binary", "user_input_choice",
+           "batch_main", "run_batch"]
+
+
+def __getattr__(name: str) -> Any:
+    """公開する名前を、初めて参照された時にモジュールから読み込みます."""
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_MODULES[name], __name__), name)
+    # 2回目以降はモジュールの属性として直接参照される
+    globals()[name] = value
+    return value
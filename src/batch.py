@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""複数の迷路を、端末の描画やメニューを使わずに一括で生成するモジュール.
+
+対象は次のどちらか。
+    - 設定ファイルのディレクトリ（中の *.txt）、または設定ファイルのパスを
+      1行に1つずつ書いたマニフェストファイル
+    - 1つの設定ファイルと、シードの範囲（--seeds 1-100）
+
+各迷路はワーカープロセスで生成され、output_maze と同じ形式で書き出される。
+最後にジョブごとの時間の一覧を表示する。
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple
+from pydantic import ValidationError
+from mazegen import MazeGenerator
+from mazegen.generator import FrozenMazeConfig, MazeConfig
+from .config_parser import config_parser
+from .file_output import output_maze
+
+USAGE = ("Usage: a_maze_ing.py --batch <config_dir | manifest>"
+         " [--workers N]\n"
+         "       a_maze_ing.py --batch <config_file> --seeds FIRST-LAST"
+         " [--workers N]")
+
+
+class BatchJob(NamedTuple):
+    """一括生成の1つのジョブ.
+
+    Attributes:
+        name (str): 一覧に表示する名前（設定ファイル名）.
+        conf (FrozenMazeConfig | None): 検証済みの設定（検証に失敗したらNone）.
+        error (str): 設定の読み込みや検証のエラー（なければ空文字）.
+    """
+
+    name: str
+    conf: FrozenMazeConfig | None
+    error: str = ""
+
+
+class BatchResult(NamedTuple):
+    """1つのジョブの結果.
+
+    Attributes:
+        name (str): ジョブの名前.
+        seed (int): 生成に使った乱数シード.
+        output_file (Path | None): 書き出したファイル（失敗したらNone）.
+        cells (int): 迷路のセル数.
+        generate_time (float): 生成と最短経路の探索にかかった時間（秒）.
+        write_time (float): ファイルの書き出しにかかった時間（秒）.
+        error (str): 失敗した場合のエラー（成功したら空文字）.
+    """
+
+    name: str
+    seed: int
+    output_file: Path | None
+    cells: int
+    generate_time: float
+    write_time: float
+    error: str = ""
+
+
+def batch_main(arguments: list[str]) -> list[BatchResult]:
+    """コマンドライン引数を解析して一括生成を行い、時間の一覧を表示します.
+
+    Args:
+        arguments (list[str]): --batch より後ろの引数.
+
+    Returns:
+        list[BatchResult]: ジョブごとの結果（引数が不正なら空のリスト）.
+    """
+    target: Path | None = None
+    seeds: range | None = None
+    workers: int | None = None
+    args = iter(arguments)
+    try:
+        for arg in args:
+            if arg == "--seeds":
+                first, _, last = next(args).partition("-")
+                seeds = range(int(first), int(last or first) + 1)
+            elif arg == "--workers":
+                workers = int(next(args))
+            elif target is None:
+                target = Path(arg)
+            else:
+                raise ValueError(f"Unexpected argument '{arg}'")
+        if target is None:
+            raise ValueError("No config directory or manifest given")
+        if workers is not None and workers < 1:
+            raise ValueError("--workers must be positive")
+        if seeds is None:
+            jobs = load_jobs(target)
+        else:
+            jobs = seed_jobs(target, seeds)
+    except (StopIteration, ValueError, OSError) as e:
+        if not isinstance(e, StopIteration):
+            print(f"Error: {e}")
+        print(USAGE)
+        return []
+
+    start = time.perf_counter()
+    results = run_batch(jobs, workers)
+    print_summary(results, time.perf_counter() - start,
+                  workers or os.cpu_count() or 1)
+    return results
+
+
+def load_jobs(target: Path) -> list[BatchJob]:
+    """ディレクトリ内の設定ファイル、またはマニフェストからジョブを作ります.
+
+    マニフェストは1行に1つの設定ファイルのパスを書いたテキストで、
+    空行と # で始まる行は無視する。相対パスはマニフェストの場所から解決する。
+    出力ファイルが前のジョブと同じになるジョブは、並列に書き込んで
+    上書きし合わないよう、エラーのジョブにする。
+
+    Args:
+        target (Path): 設定ファイルのディレクトリ、またはマニフェスト.
+
+    Returns:
+        list[BatchJob]: 設定ファイルごとのジョブ.
+
+    Raises:
+        OSError: ディレクトリやマニフェストが読めない場合。
+    """
+    if target.is_dir():
+        configs = sorted(target.glob("*.txt"))
+    else:
+        configs = []
+        for line in target.read_text().splitlines():
+            line = line.split("#", 1)[0].strip()
+            if line:
+                configs.append(target.parent / line)
+    return _reject_shared_outputs([_load_job(path) for path in configs])
+
+
+def seed_jobs(config: Path, seeds: range) -> list[BatchJob]:
+    """1つの設定ファイルから、シードごとのジョブを作ります.
+
+    出力ファイル名には "_<seed>" を付けて、ジョブどうしで重ならないようにする
+    （例: maze.txt -> maze_7.txt）。
+
+    Args:
+        config (Path): 設定ファイル.
+        seeds (range): 生成するシードの範囲.
+
+    Returns:
+        list[BatchJob]: シードごとのジョブ.
+
+    Raises:
+        ValueError: 設定が不正な場合や、シードが範囲外の場合。
+    """
+    job = _load_job(config)
+    if job.conf is None:
+        raise ValueError(f"{config}: {job.error}")
+    output = job.conf.output_file
+    jobs = []
+    for seed in seeds:
+        conf = job.conf.with_seed(seed).model_copy(update={
+            "output_file": output.with_stem(f"{output.stem}_{seed}")})
+        jobs.append(BatchJob(job.name, conf))
+    return jobs
+
+
+def _reject_shared_outputs(jobs: list[BatchJob]) -> list[BatchJob]:
+    """出力ファイルが前のジョブと同じジョブを、エラーのジョブに置き換えます."""
+    owners: dict[Path, str] = {}
+    checked = []
+    for job in jobs:
+        if job.conf is not None:
+            output = job.conf.output_file.resolve()
+            if output in owners:
+                job = BatchJob(job.name, None, f"OUTPUT_FILE {output} is "
+                               f"already written by {owners[output]}")
+            else:
+                owners[output] = job.name
+        checked.append(job)
+    return checked
+
+
+def _load_job(path: Path) -> BatchJob:
+    """設定ファイルを読み込んで検証し、ジョブを作ります."""
+    conf = config_parser(["batch", str(path)])
+    if not conf:
+        return BatchJob(path.name, None, "Could not read the config")
+    try:
+        # 出力ファイルは実際に書き込む時に確かめる
+        values: dict[str, Any] = {**conf, "DEFER_FILE_CHECK": True}
+        valid = MazeConfig(**values)
+    except ValidationError as e:
+        errors = "; ".join(f"{err['loc'][0] if err['loc'] else 'Model'}: "
+                           f"{err['msg']}" for err in e.errors())
+        return BatchJob(path.name, None, errors)
+    return BatchJob(path.name, valid.freeze())
+
+
+def run_batch(jobs: list[BatchJob],
+              workers: int | None = None) -> list[BatchResult]:
+    """ジョブをワーカープロセスで並列に実行し、jobsと同じ順で結果を返します.
+
+    Args:
+        jobs (list[BatchJob]): 実行するジョブ.
+        workers (int, optional): ワーカープロセス数。1ならプロセスを
+            使わずにこのプロセス内で順に実行する。デフォルトはCPU数。
+
+    Returns:
+        list[BatchResult]: ジョブごとの結果.
+    """
+    if workers == 1:
+        return [_run_job(job) for job in jobs]
+
+    count = workers or os.cpu_count() or 1
+    # 小さな迷路が大量にある場合は、まとめて渡してプロセス間通信を減らす
+    chunksize = max(1, len(jobs) // (count * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_run_job, jobs, chunksize=chunksize))
+
+
+def _run_job(job: BatchJob) -> BatchResult:
+    """1つのジョブで迷路を生成し、ファイルに書き出します."""
+    if job.conf is None:
+        return BatchResult(job.name, 0, None, 0, 0.0, 0.0, job.error)
+    conf = job.conf
+    generate_time = write_time = 0.0
+    try:
+        start = time.perf_counter()
+        generator = MazeGenerator.from_config(conf)
+        generator.generate()
+        # 書き出しに使う最短経路はここで探索される
+        generator.way
+        generate_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        output_maze(generator)
+        write_time = time.perf_counter() - start
+    except Exception as e:
+        return BatchResult(job.name, conf.seed, None,
+                           conf.width * conf.height,
+                           generate_time, write_time, str(e))
+    return BatchResult(job.name, conf.seed, conf.output_file,
+                       conf.width * conf.height, generate_time, write_time)
+
+
+def print_summary(results: list[BatchResult], elapsed: float,
+                  workers: int) -> None:
+    """ジョブごとの時間と、全体の集計を表示します.
+
+    Args:
+        results (list[BatchResult]): ジョブごとの結果.
+        elapsed (float): 一括生成全体にかかった時間（秒）.
+        workers (int): ワーカープロセス数.
+    """
+    print(f"{'job':<24} {'seed':>5} {'cells':>9} {'generate':>10}"
+          f" {'write':>9}  output")
+    for r in results:
+        output = str(r.output_file) if r.error == "" else f"ERROR: {r.error}"
+        print(f"{r.name:<24} {r.seed:>5} {r.cells:>9}"
+              f" {r.generate_time * 1000:>8.2f}ms"
+              f" {r.write_time * 1000:>7.2f}ms  {output}")
+
+    failed = sum(1 for r in results if r.error)
+    busy = sum(r.generate_time + r.write_time for r in results)
+    rate = len(results) / elapsed if elapsed else 0.0
+    print(f"{len(results)} jobs ({failed} failed) in {elapsed:.2f}s"
+          f" with {workers} worker(s): {rate:.1f} jobs/s,"
+          f" {busy:.2f}s of work")
+
+
+if __name__ == "__main__":
+    pass
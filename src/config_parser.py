@@ -3,6 +3,9 @@
 
 VALID_KEYS = {"WIDTH", "HEIGHT", "ENTRY", "EXIT",
               "OUTPUT_FILE", "PERFECT", "SEED"}
+# 省略可能なキー（省略時はMazeConfigのデフォルト値が使われる）
+OPTIONAL_KEYS = {"LARGE", "INCREMENTAL", "ALGORITHM", "SOLVER",
+                 "DEFER_FILE_CHECK"}
 
 
 def validate_format(line: str) -> bool:
@@ -72,7 +75,7 @@ def config_parser(arguments: list[str]) -> dict[str, str]:
                     key = key.strip()
                     value = value.strip()
 
-                    if key not in VALID_KEYS:
+                    if key not in VALID_KEYS | OPTIONAL_KEYS:
                         print(f"Error ({line_num}): Invalid key '{key}'")
                         continue
 
@@ -82,8 +85,8 @@ def config_parser(arguments: list[str]) -> dict[str, str]:
                     print(f"Error ({line_num}): Invalid format '{line}'")
                     continue
 
-        if len(config_dict) != len(VALID_KEYS):
-            missing = VALID_KEYS - config_dict.keys()
+        missing = VALID_KEYS - config_dict.keys()
+        if missing:
             print(f"Error: Missing configuration keys: {missing}")
 
         return config_dict
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""迷路データをバイナリ形式で入出力するためのモジュール.
+
+テキスト形式（file_output）と同じ情報を、より小さく速く読める形で保存する。
+
+ファイルフォーマット:
+    1. ヘッダー (HEADER, リトルエンディアン)
+        magic(b"AMZB"), version, flags(bit0: SEEDあり),
+        width, height, entry_x, entry_y, exit_x, exit_y, seed,
+        最短経路の歩数, 最短経路部のバイト数
+    2. 迷路のマップデータ（行優先, 1バイトに2セル, 上位4bitが先のセル）
+    3. 最短経路（ランレングス: 方角の文字1バイト + 連続数のLEB128）
+"""
+
+import mmap
+import struct
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO
+from mazegen import MazeGenerator
+from .file_input import UNHEX_TABLE, parse_xy
+from .file_output import write_maze_rows
+
+MAGIC = b"AMZB"
+VERSION = 1
+HEADER = struct.Struct("<4sBBxxIIIIIIIQQ")
+# flagsのビット
+FLAG_SEED = 1
+
+# 上位/下位4bitを取り出す表と、4bit左シフトする表 (bytes.translate用)
+_HI_TABLE = bytes(i >> 4 for i in range(256))
+_LO_TABLE = bytes(i & 0x0F for i in range(256))
+_SHL_TABLE = bytes((i << 4) & 0xF0 for i in range(256))
+
+
+def output_maze_binary(generator: MazeGenerator,
+                       output_file: Path | None = None) -> Path:
+    """生成済みの迷路をバイナリ形式で出力します.
+
+    Args:
+        generator (MazeGenerator): 出力対象の迷路データを持つインスタンス.
+        output_file (Path, optional): 出力先。省略時は generator.output_file
+            の拡張子を '.mzb' に変えたパス。
+
+    Returns:
+        Path: 書き出したファイルのパス。
+    """
+    if output_file is None:
+        output_file = generator.output_file.with_suffix(".mzb")
+    write_maze_binary(generator.maze, generator.entry, generator.exit,
+                      generator.way, output_file, seed=generator.seed)
+    return Path(output_file)
+
+
+def write_maze_binary(rows: Iterable[Sequence[int]],
+                      entry: tuple[int, int],
+                      exit: tuple[int, int],
+                      way: Iterable[str],
+                      output_file: Path,
+                      seed: int | None = None) -> None:
+    """迷路を1行ずつ詰めながらバイナリ形式で書き出します.
+
+    行数は書き出した後に分かるため、ヘッダーは最後に先頭へ書き戻す。
+
+    Args:
+        rows (Iterable): 各行の壁ビット(0〜15)の並び.
+        entry (tuple): 入口座標 (x, y).
+        exit (tuple): 出口座標 (x, y).
+        way (Iterable[str]): 最短経路の方角（N, E, S, W）.
+        output_file (Path): 出力ファイルのパス.
+        seed (int, optional): 迷路の乱数シード。不明ならNone.
+    """
+    with open(output_file, 'wb') as f:
+        f.write(bytes(HEADER.size))
+        width, height = _write_cells(f, rows)
+        _write_trailer(f, width, height, entry, exit, way, seed)
+
+
+def text_to_binary(text_file: Path, binary_file: Path,
+                   seed: int | None = None) -> None:
+    """テキスト形式の迷路ファイルをバイナリ形式に変換します.
+
+    テキストは1行ずつ読むため、迷路全体をメモリに載せない。
+    テキスト形式にはSEEDが含まれないため、必要なら引数で渡す。
+
+    Args:
+        text_file (Path): 変換元のテキスト形式のファイル.
+        binary_file (Path): 変換先のバイナリ形式のファイル.
+        seed (int, optional): 迷路の乱数シード.
+
+    Raises:
+        ValueError: テキストのフォーマットが不正な場合。
+    """
+    with open(text_file, 'rb') as src, open(binary_file, 'wb') as f:
+        lines = iter(src)
+        f.write(bytes(HEADER.size))
+        width, height = _write_cells(f, _hex_rows(lines))
+        entry = parse_xy(next(lines, b""))
+        exit = parse_xy(next(lines, b""))
+        way = next(lines, b"").decode("ascii")
+        if next(lines, None) is not None:
+            raise ValueError("Unexpected data after the way line")
+        _write_trailer(f, width, height, entry, exit, way, seed)
+
+
+def binary_to_text(binary_file: Path, text_file: Path) -> None:
+    """バイナリ形式の迷路ファイルをテキスト形式に変換します.
+
+    出力は output_maze と同じフォーマットになる。
+
+    Args:
+        binary_file (Path): 変換元のバイナリ形式のファイル.
+        text_file (Path): 変換先のテキスト形式のファイル.
+    """
+    with MazeFileReader(binary_file) as reader:
+        write_maze_rows(reader, reader.entry, reader.exit, reader.way(),
+                        text_file)
+
+
+class MazeFileReader(Sequence[bytes]):
+    """バイナリ形式の迷路ファイルを mmap で開き、セルを直接参照するクラス.
+
+    ファイル全体を読み込まず、必要なセル・行だけをデコードする。
+    `reader[y]` や `for row in reader` で各行の壁ビットを bytes として得られる。
+
+    Attributes:
+        _file (BinaryIO): 開いているファイル.
+        _mm (mmap.mmap): ファイル全体のメモリマップ.
+        _width (int): 迷路の幅.
+        _height (int): 迷路の高さ.
+        _entry (tuple): 入口座標.
+        _exit (tuple): 出口座標.
+        _seed (int | None): 乱数シード（不明ならNone）.
+        _steps (int): 最短経路の歩数.
+        _way_offset (int): 最短経路部の開始位置.
+        _way_size (int): 最短経路部のバイト数.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """ファイルを開いてヘッダーを検証します.
+
+        Args:
+            path (Path): バイナリ形式の迷路ファイル.
+
+        Raises:
+            ValueError: ヘッダーやファイルサイズが不正な場合。
+        """
+        self._file: BinaryIO = open(path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0,
+                                 access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is empty")
+        try:
+            self._parse_header(path)
+        except ValueError:
+            self.close()
+            raise
+
+    def _parse_header(self, path: Path) -> None:
+        """ヘッダーを読み取り、ファイルサイズと整合しているか検証します."""
+        if len(self._mm) < HEADER.size:
+            raise ValueError(f"{path} is too short for a maze header")
+        (magic, version, flags, width, height, ex, ey, gx, gy, seed,
+         steps, way_size) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a binary maze file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported maze file version {version}")
+
+        self._width: int = width
+        self._height: int = height
+        self._entry: tuple[int, int] = (ex, ey)
+        self._exit: tuple[int, int] = (gx, gy)
+        self._seed: int | None = seed if flags & FLAG_SEED else None
+        self._steps: int = steps
+        self._way_offset = HEADER.size + (width * height + 1) // 2
+        self._way_size = way_size
+        if len(self._mm) != self._way_offset + way_size:
+            raise ValueError(f"{path} has an unexpected size")
+
+    @property
+    def width(self) -> int:
+        """迷路の幅を返します."""
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """迷路の高さを返します."""
+        return self._height
+
+    @property
+    def entry(self) -> tuple[int, int]:
+        """入口座標を返します."""
+        return self._entry
+
+    @property
+    def exit(self) -> tuple[int, int]:
+        """出口座標を返します."""
+        return self._exit
+
+    @property
+    def seed(self) -> int | None:
+        """乱数シードを返します（不明ならNone）."""
+        return self._seed
+
+    def cell(self, x: int, y: int) -> int:
+        """座標 (x, y) のセルの壁ビットを返します.
+
+        Raises:
+            IndexError: 座標が迷路の範囲外の場合。
+        """
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            raise IndexError(f"Cell {x, y} is out of range")
+        i = y * self._width + x
+        byte = self._mm[HEADER.size + (i >> 1)]
+        return byte & 0x0F if i & 1 else byte >> 4
+
+    def __len__(self) -> int:
+        """迷路の行数を返します."""
+        return self._height
+
+    def __getitem__(self, y: int) -> bytes:  # type: ignore[override]
+        """y行目の壁ビットを1セル1バイトの bytes で返します."""
+        if y < 0:
+            y += self._height
+        if not 0 <= y < self._height:
+            raise IndexError("Maze row index out of range")
+        start = y * self._width
+        chunk = self._mm[HEADER.size + (start >> 1):
+                         HEADER.size + ((start + self._width + 1) >> 1)]
+        # 上位/下位4bitを交互に並べて1セル1バイトに戻す
+        cells = bytearray(2 * len(chunk))
+        cells[0::2] = chunk.translate(_HI_TABLE)
+        cells[1::2] = chunk.translate(_LO_TABLE)
+        head = start & 1
+        return bytes(cells[head:head + self._width])
+
+    def __iter__(self) -> Iterator[bytes]:
+        """各行の壁ビットを先頭から順に返します."""
+        for y in range(self._height):
+            yield self[y]
+
+    def way(self) -> str:
+        """ランレングスを展開した最短経路の方角文字列を返します.
+
+        Raises:
+            ValueError: 最短経路部が壊れている場合。
+        """
+        data = self._mm[self._way_offset:self._way_offset + self._way_size]
+        parts = []
+        i = 0
+        while i < len(data):
+            char = chr(data[i])
+            if char not in "NESW":
+                raise ValueError(f"Invalid direction {char!r} in way")
+            count, i = _read_varint(data, i + 1)
+            parts.append(char * count)
+        way = "".join(parts)
+        if len(way) != self._steps:
+            raise ValueError("Way length does not match the header")
+        return way
+
+    def close(self) -> None:
+        """メモリマップとファイルを閉じます."""
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "MazeFileReader":
+        """with文で使うために自身を返します."""
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None,
+                 exc: BaseException | None,
+                 tb: TracebackType | None) -> None:
+        """with文を抜けるときにファイルを閉じます."""
+        self.close()
+
+
+def _write_cells(f: BinaryIO,
+                 rows: Iterable[Sequence[int]]) -> tuple[int, int]:
+    """各行を2セル1バイトに詰めて書き込み、(幅, 高さ) を返します.
+
+    行の幅が奇数の場合、余った1セルは次の行の先頭と同じバイトに入る。
+
+    Raises:
+        ValueError: 行の幅がそろっていない場合。
+    """
+    width = -1
+    height = 0
+    carry = b""
+    for row in rows:
+        data = bytes(row)
+        if width == -1:
+            width = len(data)
+        elif len(data) != width:
+            raise ValueError(f"Row {height} has width {len(data)}, "
+                             f"expected {width}")
+        height += 1
+
+        data = carry + data
+        n = len(data) & ~1
+        # 偶数番目を上位4bit、奇数番目を下位4bitにしてまとめて論理和を取る
+        hi = int.from_bytes(data[0:n:2].translate(_SHL_TABLE), "big")
+        lo = int.from_bytes(data[1:n:2].translate(_LO_TABLE), "big")
+        f.write((hi | lo).to_bytes(n // 2, "big"))
+        carry = data[n:]
+
+    if carry:
+        f.write(bytes([(carry[0] << 4) & 0xF0]))
+    return max(width, 0), height
+
+
+def _write_trailer(f: BinaryIO, width: int, height: int,
+                   entry: tuple[int, int], exit: tuple[int, int],
+                   way: Iterable[str], seed: int | None) -> None:
+    """最短経路を書き込み、先頭に戻ってヘッダーを書き込みます."""
+    data = bytearray()
+    steps = 0
+    run_char = ""
+    run = 0
+    for char in way:
+        if char == run_char:
+            run += 1
+            continue
+        if run:
+            data += run_char.encode("ascii") + _varint(run)
+        if char not in ("N", "E", "S", "W"):
+            raise ValueError(f"Invalid direction {char!r} in way")
+        steps += run
+        run_char, run = char, 1
+    if run:
+        data += run_char.encode("ascii") + _varint(run)
+        steps += run
+    f.write(data)
+
+    flags = FLAG_SEED if seed is not None else 0
+    f.seek(0)
+    f.write(HEADER.pack(MAGIC, VERSION, flags, width, height,
+                        entry[0], entry[1], exit[0], exit[1],
+                        seed if seed is not None else 0, steps, len(data)))
+
+
+def _hex_rows(lines: Iterator[bytes]) -> Iterator[bytes]:
+    """テキスト形式の行を空行まで読み、各行の壁ビットを返します.
+
+    Raises:
+        ValueError: 16進数(0-F)以外の文字や、空行がない場合。
+    """
+    for num, line in enumerate(lines, 1):
+        if not line.endswith(b"\n"):
+            raise ValueError(f"Line {num}: missing blank line before ENTRY")
+        line = line[:-1]
+        if not line:
+            return
+        row = line.translate(UNHEX_TABLE)
+        if 0xFF in row:
+            raise ValueError(f"Line {num}: invalid hex row {line!r}")
+        yield row
+    raise ValueError("Missing blank line before ENTRY")
+
+
+def _varint(value: int) -> bytes:
+    """正の整数を LEB128 形式のバイト列に変換します."""
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _read_varint(data: bytes, i: int) -> tuple[int, int]:
+    """data[i]から LEB128 形式の整数を読み、(値, 次の位置) を返します.
+
+    Raises:
+        ValueError: データが途中で終わっている場合。
+    """
+    value = 0
+    shift = 0
+    while True:
+        if len(data) <= i:
+            raise ValueError("Truncated run length in way")
+        byte = data[i]
+        i += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, i
+        shift += 7
+
+
+if __name__ == "__main__":
+    pass
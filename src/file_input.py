@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""output_mazeで出力した迷路ファイルを読み込むためのモジュール."""
+
+from pathlib import Path
+from typing import Any
+from mazegen import MazeGenerator
+from mazegen.generator import MAX_SIZE
+
+# 16進数の文字(b'0'〜b'F')を壁ビットに変換する bytes.translate 用の表 (不正な文字は0xFF)
+UNHEX_TABLE = bytes(b"0123456789ABCDEF".find(bytes([i])) & 0xFF
+                    for i in range(256))
+
+# 壁ビットから開いている方角の数に変換する表
+_OPEN_TABLE = bytes(4 - bin(i & 0x0F).count("1") for i in range(256))
+
+
+def load_maze(input_file: Path,
+              confdict: dict[str, Any] | None = None,
+              use_way: bool = True) -> MazeGenerator:
+    """テキスト形式の迷路ファイルを読み込み、生成済みのMazeGeneratorを返します.
+
+    迷路部分は1文字ずつではなく、改行を除いたブロック全体を
+    bytes.translate で一度に壁ビットへ変換する。
+    WIDTH/HEIGHT/ENTRY/EXITはファイルから、PERFECTは通路の数から求める。
+
+    Args:
+        input_file (Path): output_maze で出力したファイル.
+        confdict (dict, optional): 上書きしたい設定値（SEEDなど）.
+        use_way (bool): Trueならファイルの最短経路を検証して使い、
+            FalseならBFSで求め直す。
+
+    Returns:
+        MazeGenerator: 読み込んだ迷路を保持するインスタンス。
+
+    Raises:
+        ValueError: ファイルのフォーマットが不正な場合や、
+            最短経路が迷路と矛盾する場合。
+    """
+    data = Path(input_file).read_bytes()
+
+    sep = data.find(b"\n\n")
+    if sep == -1:
+        raise ValueError("Missing blank line before ENTRY")
+    block = data[:sep]
+    trailer = data[sep + 2:].split(b"\n")
+    if len(trailer) != 3:
+        raise ValueError("Expected ENTRY, EXIT and way after the blank line")
+
+    # 全行が同じ幅で、改行が決まった位置にあるかを確認する
+    newline = block.find(b"\n")
+    width = newline if newline != -1 else len(block)
+    height = block.count(b"\n") + 1
+    if (len(block) != height * (width + 1) - 1
+            or block[width::width + 1] != b"\n" * (height - 1)):
+        raise ValueError("Maze rows must all have the same width")
+
+    cells = block.replace(b"\n", b"").translate(UNHEX_TABLE)
+    if 0xFF in cells:
+        raise ValueError("Maze rows must be hex digits (0-9, A-F)")
+
+    # 完全迷路（木）なら 通路の数 == 42以外のセルの数 - 1 になる
+    passages = sum(cells.translate(_OPEN_TABLE)) // 2
+    perfect = passages == len(cells) - cells.count(15) - 1
+
+    conf: dict[str, Any] = {
+        "WIDTH": width,
+        "HEIGHT": height,
+        "ENTRY": parse_xy(trailer[0]),
+        "EXIT": parse_xy(trailer[1]),
+        "OUTPUT_FILE": Path(input_file),
+        "PERFECT": perfect,
+        "LARGE": MAX_SIZE < width or MAX_SIZE < height,
+    }
+    conf.update(confdict or {})
+
+    generator = MazeGenerator(conf)
+    way = trailer[2].decode("ascii")
+    generator.load_maze(cells, way if use_way and way else None)
+    return generator
+
+
+def parse_xy(line: bytes) -> tuple[int, int]:
+    """'x,y' 形式の行を座標に変換します.
+
+    Raises:
+        ValueError: フォーマットが不正な場合。
+    """
+    text = line.decode("ascii").rstrip("\n")
+    try:
+        x, y = text.split(",")
+        return int(x), int(y)
+    except ValueError:
+        raise ValueError(f"Invalid coordinate line {text!r}")
+
+
+if __name__ == "__main__":
+    pass
@@ -1,10 +1,37 @@
 #!/usr/bin/env python3
 """迷路データをファイルに出力するためのモジュール."""
 
+import os
+import stat
+import tempfile
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import BinaryIO
 from mazegen import MazeGenerator
 
+# 壁ビット(0〜15)を16進数の文字(b'0'〜b'F')に変換する bytes.translate 用の表
+_HEX_TABLE = bytes(b"0123456789ABCDEF"[i % 16] for i in range(256))
 
-def output_maze(generator: MazeGenerator) -> None:
+# 書き込みバッファのサイズ
+_BUFFER_SIZE = 1 << 16
+
+
+def _read_umask() -> int:
+    """プロセスの umask を返します.
+
+    umask は設定し直さないと読めず、その間に他のスレッドが作ったファイルの
+    パーミッションが変わってしまうため、読み込み時に一度だけ呼ぶ。
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# 新しく作るファイルのパーミッション (open() と同じく 0o666 から umask を除く)
+_NEW_FILE_MODE = 0o666 & ~_read_umask()
+
+
+def output_maze(generator: MazeGenerator, atomic: bool = False) -> None:
     """迷路データを規定のフォーマットでテキストファイルに出力します.
 
     迷路の各セルを16進数（0-F）で表現し、以下の形式で保存します。
@@ -25,30 +52,86 @@ def output_maze(generator: MazeGenerator) -> None:
     Args:
         generator (MazeGenerator): 出力対象の迷路データを持つインスタンス.
             `maze`, `way`, `entry`, `exit`, `output_file` の属性が参照されます。
+        atomic (bool): Trueの場合、一時ファイルに書き込んでから置き換えます。
+    """
+    write_maze_rows(generator.maze, generator.entry, generator.exit,
+                    generator.way, generator.output_file, atomic=atomic)
+
+
+def write_maze_rows(rows: Iterable[Sequence[int]],
+                    entry: tuple[int, int],
+                    exit: tuple[int, int],
+                    way: Iterable[str],
+                    output_file: Path,
+                    atomic: bool = False) -> None:
+    """迷路を1行ずつ16進数に変換しながらファイルに書き出します.
+
+    フォーマットは output_maze と同じ。行は受け取った順にバッファ付きで
+    書き込むため、保持するのは1行分だけで済む（メモリ使用量は O(width)）。
+    入口/出口/最短経路は最後に書き込む。
+
+    Args:
+        rows (Iterable): 各行の壁ビット(0〜15)の並び。GridViewの行や
+            bytes、ジェネレータなど任意の反復可能オブジェクト.
+        entry (tuple): 入口座標 (x, y).
+        exit (tuple): 出口座標 (x, y).
+        way (Iterable[str]): 最短経路の方角（N, E, S, W）.
+        output_file (Path): 出力ファイルのパス.
+        atomic (bool): Trueの場合、同じディレクトリの一時ファイルに書き込み、
+            完了後に os.replace で置き換える。途中で失敗しても既存の
+            ファイルは壊れない。パーミッションは既存のファイルに合わせる
+            （新しく作る場合は atomic=False と同じく umask に従う）。
     """
-    lines = []
-    maze = generator.maze
-    # リスト内の文字をつなげて一つの文字列とする
-    way = "".join(c for c in generator.way)
-    ex, ey = generator.entry
-    gx, gy = generator.exit
-    output_file = generator.output_file
-
-    # 各cellを16進数文字列に
-    for row in maze:
-        str_row = "".join(f"{cell:X}" for cell in row)
-        lines.append(str_row)
+    output_file = Path(output_file)
+    if not atomic:
+        with open(output_file, 'wb', buffering=_BUFFER_SIZE) as f:
+            _write_body(f, rows, entry, exit, way)
+        return
+
+    fd, tmp_name = tempfile.mkstemp(dir=output_file.parent,
+                                    prefix=f".{output_file.name}.",
+                                    suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb', buffering=_BUFFER_SIZE) as f:
+            _write_body(f, rows, entry, exit, way)
+        # mkstemp は所有者だけが読める 0600 で作るため、置き換える前に戻す
+        os.chmod(tmp_name, _file_mode(output_file))
+        os.replace(tmp_name, output_file)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def _file_mode(path: Path) -> int:
+    """ファイルを置き換える時に使うパーミッションを返します.
+
+    既存のファイルがあればそのパーミッション、なければ open() で
+    新しく作った場合と同じ 0o666 から umask を除いたものを返す。
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return _NEW_FILE_MODE
+
+
+def _write_body(f: BinaryIO,
+                rows: Iterable[Sequence[int]],
+                entry: tuple[int, int],
+                exit: tuple[int, int],
+                way: Iterable[str]) -> None:
+    """開いたファイルに迷路のフォーマット全体を書き込みます."""
+    write = f.write
+    ex, ey = entry
+    gx, gy = exit
+
+    # ファイルフォーマットの1 (各cellを16進数文字に)
+    for row in rows:
+        write(bytes(row).translate(_HEX_TABLE))
+        write(b"\n")
 
     # ファイルフォーマットの2~5
-    lines.append("")
-    lines.append(f"{ex},{ey}")
-    lines.append(f"{gx},{gy}")
-    lines.append(way)
-    output = "\n".join(lines)
-
-    # ファイルに書き出し
-    with open(output_file, 'w') as f:
-        f.write(output)
+    write(f"\n{ex},{ey}\n{gx},{gy}\n".encode())
+    write("".join(way).encode())
 
 
 if __name__ == "__main__":
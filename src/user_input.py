@@ -2,7 +2,6 @@
 """ユーザー入力を処理し、アプリケーションのメインループを制御するモジュール."""
 
 import random
-import os
 from src import output_maze, MazeView
 from mazegen import MazeGenerator
 
@@ -12,13 +11,17 @@ choice_txt = """=== A-Maze-ing ===
 2. Show/Hide path from entry to exit
 3. Rotate maze random colors
 4. PERFECT flag switch
-5. Quit"""
+5. Animate maze generation (press any key to skip)
+6. Quit"""
+
+# アニメーションの再生にかける時間の目安（秒）
+ANIMATION_SECONDS = 5.0
 
 
 def user_input_choice(generator: MazeGenerator, view: MazeView) -> None:
     """ユーザーからの入力を受け付け、迷路の再生成や設定変更を行います.
 
-    この関数は無限ループで実行され、'5'が選択されるまで終了しません。
+    この関数は無限ループで実行され、'6'が選択されるまで終了しません。
 
     Args:
         generator (MazeGenerator): 操作対象の迷路生成インスタンス.
@@ -31,15 +34,14 @@ def user_input_choice(generator: MazeGenerator, view: MazeView) -> None:
     while True:
         try:
             # input()は文字列を返すのでintに変換
-            user_input = int(input("Choice? (1-5):"))
+            user_input = int(input("Choice? (1-6):"))
         except BaseException:
             # 数字以外が入力された場合にキャッチ
-            print("Please select from 1-5")
+            print("Please select from 1-6")
             continue
 
         # SEEDを変えて迷路の再生成
         if user_input == 1:
-            os.system('clear')
             generator.seed = random.randint(1, 1000)
             generator.generate()
             view.draw()
@@ -51,7 +53,6 @@ def user_input_choice(generator: MazeGenerator, view: MazeView) -> None:
 
         # 経路の表示/非表示
         elif user_input == 2:
-            os.system('clear')
             view.toggle_path()
             view.draw()
             print(generator.report)
@@ -61,7 +62,6 @@ def user_input_choice(generator: MazeGenerator, view: MazeView) -> None:
 
         # カラーコードの再選択
         elif user_input == 3:
-            os.system('clear')
             # .ランダムなANSIカラーコードを設定
             view.set_wall_color(random.randint(30, 39))
             view.draw()
@@ -72,7 +72,6 @@ def user_input_choice(generator: MazeGenerator, view: MazeView) -> None:
 
         # PERFECTフラグの有効/無効
         elif user_input == 4:
-            os.system('clear')
             generator.perfect = not generator.perfect
             generator.generate()
             view.draw()
@@ -82,10 +81,20 @@ def user_input_choice(generator: MazeGenerator, view: MazeView) -> None:
             print(choice_txt)
             continue
 
-        # プログラム終了
+        # 現在の設定で迷路の生成をアニメーション表示
         elif user_input == 5:
-            os.system('clear')
+            view.play(generator.generate_events(),
+                      duration=ANIMATION_SECONDS)
+            print(generator.report)
+            print()
+            output_maze(generator)
+            print(choice_txt)
+            continue
+
+        # プログラム終了
+        elif user_input == 6:
+            view.clear()
             break
 
         else:
-            print("Please select from 1-5")
+            print("Please select from 1-6")
@@ -1,8 +1,38 @@
 #!/usr/bin/env python3
 """迷路をASCIIとしてコンソールに表示するモジュール."""
 
+import math
+import os
+import select
+import shutil
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from itertools import islice
+from mazegen import MazeEvent, MazeGenerator
+from mazegen.storage import GridView
 
-from mazegen import MazeGenerator
+# 画面を消去してカーソルを左上に移動するANSIエスケープシーケンス
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+# 迷路の下に表示されるレポートやメニューのために空けておく行数
+FOOTER_LINES = 24
+# 正解ルート（足跡）を表すセルの値
+WALK_PATH = 4
+# 42ロゴを表すセルの値
+LOGO = 5
+# 全体図でブロック内の壁の少ない順に使う濃淡の文字
+SHADES = " ░▒▓"
+
+# generate_events が返すイベント数の、迷路のセル数に対するおおよその割合
+# (穴掘り ≒ セル数, 壁崩し + BFS ≒ セル数以下)
+EVENTS_PER_CELL = 2
+
+# 壁ビットから閉じている壁の数に変換する表
+_CLOSED_TABLE = bytes(bin(i & 0x0F).count("1") for i in range(256))
+
+# アニメーションの1フレーム（使う変換表と、BFSで探索済みのグリッド座標）
+Frame = tuple[tuple[str, ...], list[tuple[int, int]]]
 
 
 class MazeView:
@@ -20,13 +50,30 @@ class MazeView:
         _path (str): 通路（床）の表示文字.
         _walk_path (str): 正解ルート（足跡）の表示文字.
         _forty_two (str): '42'の文字部分を表す特別な表示文字.
+        _visit (str): アニメーション中、BFSで探索済みの通路を表す表示文字.
+        _diff (bool): 前回との差分だけを描画するかどうかのフラグ.
+        _last_frame (list | None): 前回描画したフレーム（差分描画用）.
+        _glyphs (tuple): セルの値(0〜5)から表示文字への変換表.
+        _row_grid (GridView | None): 行キャッシュの作成元のグリッド.
+        _row_glyphs (tuple): 行キャッシュの作成に使った変換表.
+        _rows (dict): 足跡を含まない行の表示文字リストのキャッシュ.
+        _lines (dict): _rowsを連結した文字列のキャッシュ.
+        _wall_color (int): 壁のANSIカラーコード.
+        _shades (tuple): 全体図で使う、壁の色の濃淡の表示文字.
+        _view_size (tuple | None): ビューポートの大きさ（グリッドのセル数）.
+            Noneの場合はビューポートを使わない.
+        _view_pos (tuple): ビューポートの左上のグリッド座標.
+        _block (int | None): 全体図の1文字が表すブロックの大きさ
+            （0は自動）. Noneの場合は全体図を使わない.
     """
 
-    def __init__(self, generate: MazeGenerator):
+    def __init__(self, generate: MazeGenerator, diff: bool | None = None):
         """MazeViewを初期化します.
 
         Args:
             generate (MazeGenerator): 描画対象となるMazeGeneratorインスタンス.
+            diff (bool, optional): 差分描画を行うかどうか。省略時は
+                標準出力が端末の場合のみ差分描画を行います。
         """
         self._gen = generate
         self._show_path = False
@@ -36,6 +83,20 @@ class MazeView:
         self._path = "  "
         self._walk_path = "・"
         self._forty_two = "\x1b[43m  \x1b[0m"
+        self._visit = "\x1b[46m  \x1b[0m"
+        self._diff = sys.stdout.isatty() if diff is None else diff
+        self._last_frame: list[list[str]] | None = None
+        self._glyphs: tuple[str, ...] = ()
+        self._row_grid: GridView | None = None
+        self._row_glyphs: tuple[str, ...] = ()
+        self._rows: dict[int, list[str]] = {}
+        self._lines: dict[int, str] = {}
+        self._wall_color = 0
+        self._shades: tuple[str, ...] = ()
+        self._view_size: tuple[int, int] | None = None
+        self._view_pos = (0, 0)
+        self._block: int | None = None
+        self._compile_glyphs()
 
     def set_wall_color(self, color: int) -> None:
         """壁の色を変更します.
@@ -45,46 +106,502 @@ class MazeView:
         Args:
             color (int): 設定したい色のANSIカラーコード（例: 31=赤, 32=緑）.
         """
+        self._wall_color = color
         self._wall = f"\x1b[{color}m██\x1b[0m"
+        self._compile_glyphs()
 
     def toggle_path(self) -> None:
         """正解ルートの表示/非表示を切り替えます."""
         self._show_path = not self._show_path
 
+    def _compile_glyphs(self) -> None:
+        """セルの値から表示文字への変換表を作り直します.
+
+        0: 通路, 1: 壁, 2: スタート, 3: ゴール, 4: 足跡, 5: 42ロゴ
+        変換表が新しいオブジェクトになるため、行キャッシュは次の描画で作り直される。
+        全体図の濃淡も壁と同じ色で作り直す。
+        """
+        self._glyphs = (self._path, self._wall, self._start, self._goal,
+                        self._walk_path, self._forty_two)
+        self._shades = tuple(f"\x1b[{self._wall_color}m{c * 2}\x1b[0m"
+                             for c in SHADES)
+
+    # --- Viewport ---
+
+    def set_viewport(self, cols: int | None = None,
+                     rows: int | None = None) -> None:
+        """ビューポート表示を有効にし、迷路の一部だけを描画するようにします.
+
+        描画時には表示範囲のグリッドだけを展開するため、
+        端末に収まらない大きな迷路でも描画量は範囲の大きさで決まります。
+
+        Args:
+            cols (int, optional): 表示範囲の幅（グリッドのセル数）。
+                省略時は端末の幅に合わせます。
+            rows (int, optional): 表示範囲の高さ（グリッドのセル数）。
+                省略時は端末の高さからメニューの分を除いた値にします。
+
+        Raises:
+            ValueError: 表示範囲の大きさが正の値でない場合。
+        """
+        term = shutil.get_terminal_size()
+        cols = term.columns // 2 if cols is None else cols
+        rows = max(term.lines - FOOTER_LINES, 1) if rows is None else rows
+        if cols < 1 or rows < 1:
+            raise ValueError("Viewport size must be positive")
+        self._view_size = (cols, rows)
+        self._block = None
+
+    def set_overview(self, block: int = 0) -> None:
+        """迷路全体を縮小した全体図を表示するようにします.
+
+        1文字（2桁分）が block x block マスのブロックを表し、
+        ブロック内の壁の多さを濃淡で描きます。
+
+        Args:
+            block (int): 1文字が表すブロックの一辺のマス数。
+                0の場合は端末に収まる最小の値を使います。
+
+        Raises:
+            ValueError: block が負の値の場合。
+        """
+        if block < 0:
+            raise ValueError("Overview block size must not be negative")
+        self._block = block
+        self._view_size = None
+
+    def reset_viewport(self) -> None:
+        """ビューポート/全体図をやめ、グリッド全体を描画する表示に戻します."""
+        self._view_size = None
+        self._block = None
+
+    def fit_to_terminal(self) -> bool:
+        """グリッド全体が端末に収まらない場合は全体図の表示に切り替えます.
+
+        Returns:
+            bool: 全体図に切り替えた場合はTrue。
+        """
+        maze = self._gen.maze
+        term = shutil.get_terminal_size()
+        if (2 * (2 * maze.width + 1) <= term.columns
+                and 2 * maze.height + 1 + FOOTER_LINES <= term.lines):
+            return False
+        self.set_overview()
+        return True
+
+    def pan(self, dx: int, dy: int) -> None:
+        """ビューポートの表示位置を移動します（範囲外にははみ出しません）.
+
+        Args:
+            dx (int): 横方向の移動量（グリッドのセル数）.
+            dy (int): 縦方向の移動量（グリッドのセル数）.
+        """
+        left, top = self._view_pos
+        self._view_pos = (left + dx, top + dy)
+
+    def center(self, x: int, y: int) -> None:
+        """指定したグリッド座標が中央に来るようにビューポートを移動します.
+
+        Args:
+            x (int): 中央に置くx座標（グリッド座標）.
+            y (int): 中央に置くy座標（グリッド座標）.
+        """
+        cols, rows = self._view_size or (0, 0)
+        self._view_pos = (x - cols // 2, y - rows // 2)
+
+    def follow_path(self, fps: float = 30.0, step: int = 1) -> int:
+        """正解ルートに沿ってビューポートを動かしながら描画します.
+
+        ビューポートが無効な場合は端末の大きさで有効にします。
+        描画が間に合わない場合は play と同じくフレームを飛ばします。
+
+        Args:
+            fps (float): 1秒あたりの目標フレーム数.
+            step (int): 1フレームで進む経路上のマスの数.
+
+        Returns:
+            int: 描画を飛ばしたフレームの数。
+
+        Raises:
+            ValueError: fps または step が正の値でない場合。
+        """
+        if step < 1:
+            raise ValueError("step must be positive")
+        if self._view_size is None:
+            self.set_viewport()
+        path = self._gen.path
+        glyphs = self._glyphs
+
+        def frames() -> Iterator[Frame]:
+            for x, y in path[::step]:
+                self.center(x, y)
+                yield glyphs, []
+
+        shown = self._show_path
+        self._show_path = True
+        try:
+            return self._animate(frames(), fps)
+        finally:
+            self._show_path = shown
+
+    def _window(self) -> tuple[int, int, int, int] | None:
+        """迷路の大きさに合わせて補正した表示範囲 (left, top, cols, rows) を返します."""
+        if self._view_size is None:
+            return None
+        maze = self._gen.maze
+        gw = 2 * maze.width + 1
+        gh = 2 * maze.height + 1
+        cols = min(self._view_size[0], gw)
+        rows = min(self._view_size[1], gh)
+        left = min(max(self._view_pos[0], 0), gw - cols)
+        top = min(max(self._view_pos[1], 0), gh - rows)
+        self._view_pos = (left, top)
+        return left, top, cols, rows
+
+    # --- Drawing ---
+
+    def clear(self) -> None:
+        """画面を消去し、差分描画用に記憶している前回のフレームを破棄します."""
+        self._last_frame = None
+        if sys.stdout.isatty():
+            sys.stdout.write(CLEAR_SCREEN)
+            sys.stdout.flush()
+
     def draw(self) -> None:
         """現在の迷路の状態をコンソールに出力します.
 
         _gen（MazeGenerator）が持つグリッドデータを読み込み、
         設定された文字（壁、床、スタート、ゴールなど）に変換して表示します。
         _show_pathフラグがTrueの場合は、正解ルートも重ねて描画します。
+        差分描画が有効な場合は、前回から変わったセルだけを書き換えます。
+        ビューポートや全体図が有効な場合は、その範囲だけを描画します。
+        """
+        self._write_frame(*self._render(self._glyphs))
+
+    def play(self, events: Iterable[MazeEvent], fps: float = 30.0,
+             per_frame: int = 1, duration: float | None = None) -> int:
+        """generate_events のイベントを受け取り、生成の様子をアニメーション表示します.
+
+        1フレームごとに per_frame 個のイベントを進めて描画し、
+        次のフレームの時刻まで待ちます。描画が間に合わずフレームの時刻を
+        過ぎてしまった場合は、そのフレームの描画を飛ばしてイベントだけ進めます。
+        穴掘り中はまだ掘られていないセルを壁として、BFS中は探索済みの
+        セルを色付きで描き、最後に完成した迷路を draw() で描画します。
+        再生中にキーを押すか Ctrl-C を押すと、残りは描画せずに迷路を
+        生成し、完成した迷路を描画します。
+
+        Args:
+            events (Iterable[MazeEvent]): MazeGenerator.generate_events の戻り値.
+            fps (float): 1秒あたりの目標フレーム数.
+            per_frame (int): 1フレームで進めるイベントの数.
+            duration (float, optional): 再生にかける時間の目安（秒）。指定すると
+                迷路の大きさから見積もったイベント数で per_frame を決めます。
+
+        Returns:
+            int: 描画を飛ばしたフレームの数。
+
+        Raises:
+            ValueError: fps, per_frame または duration が正の値でない場合。
+        """
+        if duration is not None:
+            if duration <= 0 or fps <= 0:
+                raise ValueError("fps and duration must be positive")
+            cells = self._gen.width * self._gen.height
+            per_frame = math.ceil(EVENTS_PER_CELL * cells / (fps * duration))
+        if per_frame < 1:
+            raise ValueError("per_frame must be positive")
+        # 未到達のセル(15)は42ロゴと区別できないため、穴掘り中は壁として描く
+        carving = self._glyphs[:LOGO] + (self._wall,)
+        it = iter(events)
+
+        def frames() -> Iterator[Frame]:
+            visits: list[tuple[int, int]] = []
+            while True:
+                batch = list(islice(it, per_frame))
+                if not batch:
+                    return
+                for e in batch:
+                    if e.kind == "expand":
+                        # セル間の通路と到達したセルをグリッド座標で記録
+                        visits.append((e.x + e.nx + 1, e.y + e.ny + 1))
+                        visits.append((2 * e.nx + 1, 2 * e.ny + 1))
+                if batch[-1].kind == "carve":
+                    yield carving, visits
+                else:
+                    yield self._glyphs, visits
+
+        dropped = 0
+        skipped = False
+        with _key_watcher() as pressed:
+            try:
+                dropped = self._animate(frames(), fps, pressed)
+                skipped = pressed()
+            except KeyboardInterrupt:
+                skipped = True
+        if skipped:
+            # 途中のイベントは描画せず、同じ迷路になる generate() で仕上げる
+            self._gen.generate()
+        self.draw()
+        return dropped
+
+    def _animate(self, frames: Iterable[Frame], fps: float,
+                 stop: Callable[[], bool] | None = None) -> int:
+        """フレームを目標のFPSで描画し、間に合わないフレームは飛ばします.
+
+        Args:
+            frames (Iterable): 描画に使う変換表と探索済みの座標の組.
+            fps (float): 1秒あたりの目標フレーム数.
+            stop (Callable, optional): Trueを返したら、そこで描画をやめる関数.
+
+        Returns:
+            int: 描画を飛ばしたフレームの数。
+
+        Raises:
+            ValueError: fps が正の値でない場合。
+        """
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        interval = 1 / fps
+        dropped = 0
+        deadline = time.perf_counter()
+
+        for glyphs, visits in frames:
+            if stop is not None and stop():
+                break
+            deadline += interval
+            # フレームの時刻を過ぎていれば、描画を飛ばして次のフレームへ
+            if deadline < time.perf_counter():
+                dropped += 1
+                continue
+            self._write_frame(*self._render(glyphs, visits))
+            delay = deadline - time.perf_counter()
+            if 0 < delay:
+                time.sleep(delay)
+        return dropped
+
+    def _write_frame(self, rows: list[list[str]], lines: list[str]) -> None:
+        """作成したフレームを出力します（差分描画が有効なら差分だけ）."""
+        if self._diff:
+            self._write_diff(rows, lines)
+            return
+        sys.stdout.write("\n".join(lines) + "\n\n")
+
+    def _render(self, glyphs: tuple[str, ...],
+                visits: Iterable[tuple[int, int]] = ()
+                ) -> tuple[list[list[str]], list[str]]:
+        """表示モード（全体/ビューポート/全体図）に応じたフレームを作成します."""
+        if self._block is not None:
+            return self._build_overview()
+        window = self._window()
+        if window is None:
+            return self._build_frame(self._gen.grid, glyphs, visits)
+        left, top, cols, rows = window
+        grid = self._gen.grid_window(left, top, cols, rows)
+        return self._build_frame(grid, glyphs, visits, left, top)
+
+    def _build_frame(self, grid: GridView, glyphs: tuple[str, ...],
+                     visits: Iterable[tuple[int, int]] = (),
+                     left: int = 0, top: int = 0
+                     ) -> tuple[list[list[str]], list[str]]:
+        """グリッドの各セルを表示文字に変換したフレームを作成します.
+
+        足跡などを含まない行は、グリッドと変換表が変わらない限り
+        前回作った行（表示文字のリストと連結済みの文字列）を使い回す。
+
+        Args:
+            grid (GridView): 描画するグリッド（全体または表示範囲）.
+            glyphs (tuple): セルの値から表示文字への変換表.
+            visits (Iterable): BFSで探索済みとして描く通路のグリッド座標.
+            left (int): grid の左端のグリッド座標.
+            top (int): grid の上端のグリッド座標.
+
+        Returns:
+            tuple: 各行の表示文字のリストと、各行を連結した文字列。
         """
-        grid = self._gen._grid
-        path = self._gen._path
+        if grid is not self._row_grid or glyphs is not self._row_glyphs:
+            self._row_grid = grid
+            self._row_glyphs = glyphs
+            self._rows.clear()
+            self._lines.clear()
+        cache_rows = self._rows
+        cache_lines = self._lines
+        cols = grid.width
+        rows_n = grid.height
+
+        # 重ねて描くセルを行ごとにまとめる（足跡は探索済みより優先）
+        marks: dict[int, list[tuple[int, str]]] = {}
+        overlays = [(visits, self._visit)]
+        if self._show_path:
+            overlays.append((self._gen.path, glyphs[WALK_PATH]))
+        for coords, glyph in overlays:
+            for x, y in coords:
+                x -= left
+                y -= top
+                if 0 <= x < cols and 0 <= y < rows_n and grid[y][x] == 0:
+                    marks.setdefault(y, []).append((x, glyph))
+
+        rows = []
+        lines = []
+        for y, cells in enumerate(grid):
+            row = cache_rows.get(y)
+            if row is None:
+                row = [glyphs[cell] for cell in cells]
+                cache_rows[y] = row
+                cache_lines[y] = "".join(row)
+            xs = marks.get(y)
+            if xs is None:
+                rows.append(row)
+                lines.append(cache_lines[y])
+                continue
+            row = row[:]
+            for x, glyph in xs:
+                row[x] = glyph
+            rows.append(row)
+            lines.append("".join(row))
+        return rows, lines
 
-        # グリッドをコピーして、描画用の一時データを作成
-        temp = [row[:] for row in grid]
+    def _build_overview(self) -> tuple[list[list[str]], list[str]]:
+        """1文字がブロック1つを表す、縮小した全体図のフレームを作成します.
+
+        描画用グリッドは作らず、迷路の壁ビットからブロックごとの
+        閉じた壁の数を数えて濃淡に変換する。すべて壁のブロックは42ロゴとして、
+        スタート/ゴールと（表示中なら）正解ルートを含むブロックは重ねて描く。
+
+        Returns:
+            tuple: 各行の表示文字のリストと、各行を連結した文字列。
+        """
+        maze = self._gen.maze
+        width = maze.width
+        height = maze.height
+        block = self._block or self._auto_block(width, height)
+        nbx = -(-width // block)
+        shades = self._shades
 
-        if self._show_path and path:
+        # ブロック単位で重ねて描く表示文字（後に書いたものが優先）
+        marks: dict[tuple[int, int], str] = {}
+        path = self._gen.path
+        if self._show_path:
             for x, y in path:
-                if temp[y][x] == 0:
-                    temp[y][x] = 4  # 足跡としてマーク
-        for row in temp:
-            line = ""
-            for cell in row:
-                if cell == 1:
-                    line += self._wall
-                elif cell == 0:
-                    line += self._path
-                elif cell == 2:
-                    line += self._start
-                elif cell == 3:
-                    line += self._goal
-                elif cell == 4:
-                    line += self._walk_path
-                elif cell == 5:
-                    line += self._forty_two
-            print(line)
-        print()
+                marks[(x // 2 // block, y // 2 // block)] = self._walk_path
+        if path:
+            (sx, sy), (gx, gy) = path[0], path[-1]
+            marks[(sx // 2 // block, sy // 2 // block)] = self._start
+            marks[(gx // 2 // block, gy // 2 // block)] = self._goal
+
+        rows = []
+        for by in range(0, height, block):
+            closed = [0] * nbx
+            for y in range(by, min(by + block, height)):
+                counts = maze[y].tobytes().translate(_CLOSED_TABLE)
+                for i in range(nbx):
+                    closed[i] += sum(counts[i * block:(i + 1) * block])
+            bh = min(block, height - by)
+            row = []
+            for i, c in enumerate(closed):
+                # ブロック内の壁の総数 (各マス4枚)
+                total = 4 * bh * (min(block, width - i * block))
+                glyph = marks.get((i, by // block))
+                if glyph is None:
+                    if c == total:
+                        glyph = self._forty_two
+                    else:
+                        glyph = shades[c * len(shades) // total]
+                row.append(glyph)
+            rows.append(row)
+        return rows, ["".join(row) for row in rows]
+
+    @staticmethod
+    def _auto_block(width: int, height: int) -> int:
+        """全体図が端末（メニューの分を除く）に収まる最小のブロックの大きさを返します."""
+        term = shutil.get_terminal_size()
+        cols = max(term.columns // 2, 1)
+        lines = max(term.lines - FOOTER_LINES, 1)
+        return max(-(-width // cols), -(-height // lines), 1)
+
+    def _write_diff(self, frame: list[list[str]], lines: list[str]) -> None:
+        """前回のフレームとの差分だけをANSIエスケープシーケンスで出力します.
+
+        迷路は画面の左上に固定して描画する。変化したセルが連続する部分は
+        1回のカーソル移動でまとめて書き換え、全体を1回の write で出力する。
+        前回のフレームがない場合、サイズが変わった場合、迷路とメニューが
+        画面に収まらずスクロールしてしまう場合、差分の方が長くなる場合は
+        全体を描き直す。
+        描画後はカーソルを迷路の下に移動し、それより下（レポートやメニュー）を消去する。
+
+        Args:
+            frame (list): 各行の表示文字のリスト.
+            lines (list): 各行を連結した文字列.
+        """
+        last = self._last_frame
+        height = len(frame)
+        width = len(frame[0]) if frame else 0
+        fits = height + FOOTER_LINES <= shutil.get_terminal_size().lines
+        full = CLEAR_SCREEN + "".join(line + "\n" for line in lines)
+        out = []
+
+        if (last is None or not fits or len(last) != height
+                or (last and len(last[0]) != width)):
+            out.append(full)
+        else:
+            for y, (row, old) in enumerate(zip(frame, last)):
+                if row is old or row == old:
+                    continue
+                x = 0
+                while x < width:
+                    if row[x] == old[x]:
+                        x += 1
+                        continue
+                    start = x
+                    while x < width and row[x] != old[x]:
+                        x += 1
+                    # 1セルは端末上で2桁分の幅を持つ
+                    out.append(f"\x1b[{y + 1};{2 * start + 1}H")
+                    out.append("".join(row[start:x]))
+            # 壁の色替えなどで差分の方が長くなる場合は全体を描き直す
+            if len(full) <= sum(len(part) for part in out):
+                out = [full]
+
+        out.append(f"\x1b[{height + 1};1H\x1b[J\n")
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+        # スクロールした場合は画面上の位置がずれるため、次回も全体を描き直す
+        self._last_frame = frame if fits else None
+
+
+@contextmanager
+def _key_watcher() -> Iterator[Callable[[], bool]]:
+    """Enterを待たずにキーが押されたかを調べる関数を返します.
+
+    その間は端末を cbreak モードにし、終わったら元に戻す。一度押されたら
+    以降は常にTrueを返す。標準入力が端末でない場合や、termios のない
+    環境では常にFalseを返す。
+    """
+    if not sys.stdin.isatty():
+        yield lambda: False
+        return
+    try:
+        import termios
+        import tty
+    except ImportError:
+        yield lambda: False
+        return
+
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+    state = [False]
+
+    def pressed() -> bool:
+        if not state[0] and select.select([fd], [], [], 0)[0]:
+            # 押されたキーはメニューの入力に残さないよう読み捨てる
+            os.read(fd, 1024)
+            state[0] = True
+        return state[0]
+
+    tty.setcbreak(fd)
+    try:
+        yield pressed
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
 
 
 if __name__ == "__main__":
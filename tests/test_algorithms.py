@@ -0,0 +1,73 @@
+"""迷路生成アルゴリズムのテスト."""
+
+from collections import deque
+from typing import Any
+import pytest
+from mazegen import MazeGenerator
+from mazegen.algorithms import ALGORITHMS, STREAMING, logo_mask, stream_rows
+from mazegen.stats import count_passages
+
+SEEDS = range(1, 11)
+SIZES = ((20, 15), (9, 7), (31, 4))
+
+
+def _confdict(width: int, height: int, seed: int,
+              algorithm: str) -> dict[str, Any]:
+    """出力ファイルを確認しない、完全迷路の設定値を返します."""
+    return {"WIDTH": width, "HEIGHT": height, "ENTRY": (0, 0),
+            "EXIT": (width - 1, height - 1), "SEED": seed,
+            "PERFECT": True, "ALGORITHM": algorithm,
+            "DEFER_FILE_CHECK": True, "OUTPUT_FILE": "test_maze.txt"}
+
+
+def _check_perfect(maze: bytes, width: int, height: int) -> None:
+    """ロゴを避けた完全迷路（外周が閉じた1本の木）であることを確かめます."""
+    mask = b"".join(logo_mask(width, height)(y) for y in range(height))
+    cells = [i for i in range(width * height) if not mask[i]]
+    for i in range(width * height):
+        if mask[i]:
+            assert maze[i] == 15
+    for x in range(width):
+        assert maze[x] & 1 and maze[(height - 1) * width + x] & 4
+    for y in range(height):
+        assert maze[y * width] & 8 and maze[y * width + width - 1] & 2
+    # 隣り合うセルの壁が両側で一致すること
+    for i in range(width * height):
+        x = i % width
+        if x + 1 < width:
+            assert bool(maze[i] & 2) == bool(maze[i + 1] & 8)
+        if i + width < width * height:
+            assert bool(maze[i] & 4) == bool(maze[i + width] & 1)
+    assert count_passages(maze) == len(cells) - 1
+    # 通路だけでロゴ以外のすべてのセルにたどり着けること
+    seen = {cells[0]}
+    queue = deque([cells[0]])
+    while queue:
+        i = queue.popleft()
+        for bit, step in ((1, -width), (2, 1), (4, width), (8, -1)):
+            if not maze[i] & bit and i + step not in seen:
+                seen.add(i + step)
+                queue.append(i + step)
+    assert len(seen) == len(cells)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("width,height", SIZES)
+def test_algorithm_carves_perfect_maze(algorithm: str, width: int,
+                                       height: int) -> None:
+    """どのアルゴリズムでも、ロゴを避けた完全迷路ができること."""
+    for seed in SEEDS:
+        generator = MazeGenerator(_confdict(width, height, seed, algorithm))
+        generator.generate()
+        _check_perfect(b"".join(generator.maze), width, height)
+        assert generator.path
+
+
+@pytest.mark.parametrize("algorithm", STREAMING)
+def test_stream_rows_matches_generator(algorithm: str) -> None:
+    """stream_rows の行が、同じ設定の MazeGenerator の迷路と一致すること."""
+    for seed in SEEDS:
+        generator = MazeGenerator(_confdict(20, 15, seed, algorithm))
+        generator.generate()
+        rows = b"".join(stream_rows(20, 15, seed, algorithm))
+        assert rows == b"".join(generator.maze)
@@ -0,0 +1,48 @@
+"""迷路の一括生成のテスト."""
+
+from pathlib import Path
+import pytest
+from src.batch import load_jobs, run_batch
+
+
+def _write_config(path: Path, output: Path, seed: int,
+                  entry: str = "0,0") -> None:
+    """テスト用の設定ファイルを書き込みます."""
+    path.write_text(f"WIDTH=20\nHEIGHT=15\nENTRY={entry}\nEXIT=19,14\n"
+                    f"OUTPUT_FILE={output}\nPERFECT=True\nSEED={seed}\n")
+
+
+def test_shared_output_file_is_reported(tmp_path: Path) -> None:
+    """出力ファイルが同じ設定は、上書きせずにエラーとして報告されること."""
+    configs = tmp_path / "configs"
+    configs.mkdir()
+    output = tmp_path / "maze.txt"
+    _write_config(configs / "a.txt", output, 1)
+    _write_config(configs / "b.txt", output, 2)
+    _write_config(configs / "c.txt", tmp_path / "other.txt", 3)
+
+    jobs = load_jobs(configs)
+    assert [job.error == "" for job in jobs] == [True, False, True]
+    assert "a.txt" in jobs[1].error
+
+    results = run_batch(jobs, workers=1)
+    assert [result.error == "" for result in results] == [True, False, True]
+    assert results[1].output_file is None
+    assert results[0].output_file == output and output.exists()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_logo_overlap_fails_only_its_job(tmp_path: Path,
+                                         workers: int) -> None:
+    """ENTRYが'42'と重なる設定はそのジョブだけがエラーになり、他は生成されること."""
+    configs = tmp_path / "configs"
+    configs.mkdir()
+    _write_config(configs / "a.txt", tmp_path / "a.txt", 1, entry="6,5")
+    _write_config(configs / "b.txt", tmp_path / "b.txt", 2)
+
+    results = run_batch(load_jobs(configs), workers=workers)
+    assert "42 and ENTRY (6, 5) overlap" in results[0].error
+    assert results[0].output_file is None
+    assert not (tmp_path / "a.txt").exists()
+    assert results[1].error == ""
+    assert (tmp_path / "b.txt").exists()
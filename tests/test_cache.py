@@ -0,0 +1,57 @@
+"""生成済み迷路のLRUキャッシュのテスト."""
+
+from mazegen import MazeCache, MazeGenerator
+from mazegen.cache import CacheEntry
+
+
+def _entry(n: int) -> CacheEntry:
+    """テスト用の小さな迷路を返します."""
+    return CacheEntry(bytes([n]) * 4, ((1, 1),), ("E",))
+
+
+def test_least_recently_used_is_evicted() -> None:
+    """上限を超えると、最も長く参照されていない迷路から破棄されること."""
+    cache = MazeCache(max_entries=2)
+    cache.put("a", _entry(1))
+    cache.put("b", _entry(2))
+    assert cache.get("a") == _entry(1)
+    cache.put("c", _entry(3))
+
+    assert cache.get("b") is None
+    assert cache.get("a") == _entry(1) and cache.get("c") == _entry(3)
+    assert (len(cache), cache.hits, cache.misses) == (2, 3, 1)
+
+
+def test_byte_limit() -> None:
+    """合計メモリ量の上限を超えないこと（1件で超える迷路は保存しない）."""
+    size = MazeCache()
+    size.put("a", _entry(1))
+    one = size.nbytes
+
+    cache = MazeCache(max_bytes=one * 2)
+    for key in "abc":
+        cache.put(key, _entry(1))
+    assert len(cache) == 2 and cache.nbytes <= one * 2
+
+    tiny = MazeCache(max_bytes=one - 1)
+    tiny.put("a", _entry(1))
+    assert len(tiny) == 0 and tiny.nbytes == 0
+
+
+def test_restored_maze_matches_generated() -> None:
+    """キャッシュから復元した迷路が、生成し直した迷路と同じこと."""
+    confdict = {"WIDTH": 20, "HEIGHT": 15, "EXIT": (19, 14), "SEED": 4,
+                "DEFER_FILE_CHECK": True, "OUTPUT_FILE": "test_maze.txt"}
+    generator = MazeGenerator(confdict, cache=MazeCache())
+    generator.generate()
+    first = (b"".join(generator.maze), generator.way)
+    generator.perfect = False
+    generator.generate()
+    generator.perfect = True
+    generator.generate()
+
+    assert generator.cache is not None and generator.cache.hits == 1
+    assert (b"".join(generator.maze), generator.way) == first
+    fresh = MazeGenerator(confdict)
+    fresh.generate()
+    assert (b"".join(fresh.maze), fresh.way) == first
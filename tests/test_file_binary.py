@@ -0,0 +1,51 @@
+"""バイナリ形式の迷路ファイルのテスト."""
+
+from pathlib import Path
+import pytest
+from mazegen import MazeGenerator
+from src.file_binary import MazeFileReader, binary_to_text, \
+    output_maze_binary, text_to_binary
+from src.file_output import output_maze
+
+
+def _maze(tmp_path: Path, width: int, height: int) -> MazeGenerator:
+    """テスト用の迷路を生成します."""
+    generator = MazeGenerator({"WIDTH": width, "HEIGHT": height,
+                               "EXIT": (width - 1, height - 1), "SEED": 6,
+                               "PERFECT": False, "LARGE": True,
+                               "DEFER_FILE_CHECK": True,
+                               "OUTPUT_FILE": tmp_path / "maze.txt"})
+    generator.generate()
+    return generator
+
+
+@pytest.mark.parametrize("size", [(2, 1), (20, 15), (57, 3)])
+def test_text_binary_round_trip(tmp_path: Path,
+                                size: tuple[int, int]) -> None:
+    """テキスト -> バイナリ -> テキストで、元のファイルに戻ること."""
+    generator = _maze(tmp_path, *size)
+    output_maze(generator)
+    text = tmp_path / "maze.txt"
+    binary = tmp_path / "maze.mzb"
+    back = tmp_path / "back.txt"
+
+    text_to_binary(text, binary)
+    binary_to_text(binary, back)
+    assert back.read_bytes() == text.read_bytes()
+
+
+def test_reader_matches_generator(tmp_path: Path) -> None:
+    """mmapで読んだセル・行・経路が、書き出した迷路と一致すること."""
+    generator = _maze(tmp_path, 20, 15)
+    path = output_maze_binary(generator)
+
+    with MazeFileReader(path) as reader:
+        assert (reader.width, reader.height) == (20, 15)
+        assert (reader.entry, reader.exit) == (generator.entry,
+                                               generator.exit)
+        assert reader.seed == generator.seed
+        assert reader.way() == "".join(generator.way)
+        assert list(reader) == [bytes(row) for row in generator.maze]
+        assert reader[-1] == bytes(generator.maze[-1])
+        assert all(reader.cell(x, y) == generator.maze[y][x]
+                   for y in range(15) for x in range(20))
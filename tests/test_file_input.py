@@ -0,0 +1,42 @@
+"""迷路ファイルの読み込みのテスト."""
+
+from pathlib import Path
+import pytest
+from mazegen import MazeGenerator
+from src.file_input import load_maze
+from src.file_output import output_maze
+
+
+@pytest.mark.parametrize("perfect", [True, False])
+def test_load_round_trip(tmp_path: Path, perfect: bool) -> None:
+    """出力したファイルを読み込むと、同じ迷路と最短経路に戻ること."""
+    output = tmp_path / "maze.txt"
+    generator = MazeGenerator({"WIDTH": 20, "HEIGHT": 15, "ENTRY": (2, 1),
+                               "EXIT": (19, 14), "SEED": 8,
+                               "PERFECT": perfect, "DEFER_FILE_CHECK": True,
+                               "OUTPUT_FILE": output})
+    generator.generate()
+    output_maze(generator)
+
+    for use_way in (True, False):
+        loaded = load_maze(output, use_way=use_way)
+        assert b"".join(loaded.maze) == b"".join(generator.maze)
+        assert (loaded.entry, loaded.exit) == (generator.entry,
+                                               generator.exit)
+        assert loaded.perfect == perfect
+        assert loaded.way == generator.way
+        assert loaded.path == generator.path
+
+
+@pytest.mark.parametrize("text", [
+    "F\n\n0,0\n0,0",             # 空行の後の行が足りない
+    "FF\nF\n\n0,0\n1,0\n",       # 行の幅がそろっていない
+    "FG\n\n0,0\n1,0\n",          # 16進数ではない
+    "D7\n\n0,0\n1,0\nS",         # 最短経路が壁を通る
+])
+def test_load_rejects_malformed_files(tmp_path: Path, text: str) -> None:
+    """フォーマットが不正なファイルは ValueError になること."""
+    path = tmp_path / "bad.txt"
+    path.write_text(text)
+    with pytest.raises(ValueError):
+        load_maze(path)
@@ -0,0 +1,34 @@
+"""迷路ファイルの出力のテスト."""
+
+import os
+import stat
+from pathlib import Path
+from src.file_output import write_maze_rows
+
+ROWS = [b"\x09\x03", b"\x0c\x06"]
+
+
+def _mode(path: Path) -> int:
+    """ファイルのパーミッションを返します."""
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_atomic_write_uses_same_mode_as_plain_write(tmp_path: Path) -> None:
+    """atomic=True で新しく作ったファイルも、通常の書き込みと同じ権限になること."""
+    plain = tmp_path / "plain.txt"
+    atomic = tmp_path / "atomic.txt"
+    write_maze_rows(ROWS, (0, 0), (1, 1), "ES", plain)
+    write_maze_rows(ROWS, (0, 0), (1, 1), "ES", atomic, atomic=True)
+
+    assert _mode(atomic) == _mode(plain)
+    assert atomic.read_bytes() == plain.read_bytes()
+
+
+def test_atomic_write_keeps_existing_mode(tmp_path: Path) -> None:
+    """atomic=True で置き換えても、既存のファイルの権限を保つこと."""
+    output = tmp_path / "maze.txt"
+    output.write_text("old")
+    os.chmod(output, 0o640)
+    write_maze_rows(ROWS, (0, 0), (1, 1), "ES", output, atomic=True)
+
+    assert _mode(output) == 0o640
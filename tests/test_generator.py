@@ -0,0 +1,184 @@
+"""MazeGenerator のテスト."""
+
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+import pytest
+from mazegen import MazeGenerator
+from mazegen.algorithms import ALGORITHMS
+from mazegen.generator import MazeConfig
+
+SEEDS = range(1, 61)
+
+
+def _confdict(seed: int = 42, **values: Any) -> dict[str, Any]:
+    """出力ファイルを確認しない、テスト用の設定値を返します."""
+    return {"WIDTH": 20, "HEIGHT": 15, "ENTRY": (0, 0), "EXIT": (19, 14),
+            "SEED": seed, "PERFECT": False, "DEFER_FILE_CHECK": True,
+            "OUTPUT_FILE": "test_maze.txt", **values}
+
+
+def _generate(generator: MazeGenerator) -> tuple[bytes, list[str]]:
+    """迷路を生成し、壁データと最短経路の方角を返します."""
+    generator.generate()
+    return b"".join(generator.maze), list(generator.way)
+
+
+def test_parallel_generation_matches_serial() -> None:
+    """スレッドで並列に生成しても、順に生成した迷路と一致すること.
+
+    並列に生成している間、別のスレッドがモジュール共通の random を
+    初期化し直し続けても結果は変わらない。
+    """
+    serial = {seed: _generate(MazeGenerator(_confdict(seed)))
+              for seed in SEEDS}
+
+    def job(seed: int) -> tuple[bytes, list[str]]:
+        if seed % 2:
+            return _generate(MazeGenerator(_confdict(seed)))
+        conf = MazeConfig(**_confdict(seed))
+        return _generate(MazeGenerator.from_config(conf))
+
+    stop = threading.Event()
+
+    def reseed() -> None:
+        while not stop.is_set():
+            random.seed(0)
+            random.random()
+
+    noise = threading.Thread(target=reseed)
+    noise.start()
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            parallel = dict(zip(SEEDS, executor.map(job, SEEDS)))
+    finally:
+        stop.set()
+        noise.join()
+
+    assert parallel == serial
+
+
+def test_incremental_base_rebuilt_after_full_generate() -> None:
+    """INCREMENTALを切って生成した後で戻しても、古い土台を使わないこと."""
+    generator = MazeGenerator(_confdict(7, PERFECT=True, INCREMENTAL=True))
+    generator.generate()
+    base = _generate(generator)
+
+    generator.incremental = False
+    generator.perfect = False
+    generator.generate()
+    generator.incremental = True
+    generator.perfect = True
+    assert _generate(generator) == base
+
+    fresh = MazeGenerator(_confdict(7, PERFECT=True, INCREMENTAL=True))
+    assert _generate(fresh) == base
+
+
+@pytest.mark.parametrize("perfect", [True, False])
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_generate_events_matches_generate(algorithm: str,
+                                          perfect: bool) -> None:
+    """generate_events() を最後まで進めると、generate() と同じ迷路になること."""
+    confdict = _confdict(3, ALGORITHM=algorithm, PERFECT=perfect)
+    expected = _generate(MazeGenerator(confdict))
+
+    generator = MazeGenerator(confdict)
+    for _ in generator.generate_events():
+        pass
+    assert (b"".join(generator.maze), list(generator.way)) == expected
+
+
+def test_resize_after_generate_keeps_current_maze() -> None:
+    """生成後にWIDTH/HEIGHTを変えても、次の生成までは今の迷路を使うこと."""
+    expected = _generate(MazeGenerator(_confdict(5)))
+
+    generator = MazeGenerator(_confdict(5))
+    generator.generate()
+    generator.width = 25
+    generator.height = 20
+    assert (b"".join(generator.maze), list(generator.way)) == expected
+    assert generator.distance((0, 0), (19, 14)) == len(expected[1])
+    assert generator.shortest_path((0, 0), (19, 14))[-1] == (19, 14)
+
+    generator.exit = (24, 19)
+    generator.generate()
+    assert generator.maze.width == 25 and generator.maze.height == 20
+    assert generator.path[-1] == (49, 39)
+
+
+@pytest.mark.parametrize("solver", ["bfs", "bidirectional", "astar"])
+def test_stats_record_stages_for_each_solver(solver: str) -> None:
+    """計測結果の段階と件数が、実際に使った探索方法に合っていること."""
+    generator = MazeGenerator(_confdict(9, SOLVER=solver))
+    generator.enable_stats(profile=True)
+    generator.generate()
+    stats = generator.stats
+
+    assert stats is not None
+    assert list(stats.stages) == ["seed", "init", "carve", "break",
+                                  "solve", "report"]
+    assert stats.expanded == generator.expanded > 0
+    if solver == "bfs":
+        assert stats.bfs_queue_peak is not None and stats.bfs_queue_peak > 0
+        assert "BFS_QUEUE_PEAK" in generator.report
+    else:
+        assert stats.bfs_queue_peak is None
+        assert "BFS_QUEUE_PEAK" not in generator.report
+    assert "_generate" in stats.profile_report()
+
+    generator.disable_stats()
+    generator.generate()
+    assert generator.stats is None
+    assert "Generation stats" not in generator.report
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_generate_tiled_ignores_algorithm_and_resets_stats(
+        algorithm: str) -> None:
+    """generate_tiled は ALGORITHM によらず同じ迷路を作り、前回の計測を残さないこと."""
+    expected = MazeGenerator(_confdict(7, PERFECT=True))
+    expected.generate_tiled(tile=6, workers=1)
+
+    generator = MazeGenerator(_confdict(7, PERFECT=True, ALGORITHM=algorithm))
+    generator.enable_stats()
+    generator.generate()
+    assert generator.stats is not None and generator.expanded > 0
+
+    generator.generate_tiled(tile=6, workers=1)
+    assert generator.stats is None
+    assert generator.expanded == 0
+    assert b"".join(generator.maze) == b"".join(expected.maze)
+    assert "Generation stats" not in generator.report
+
+
+def test_incremental_stats_count_this_generate() -> None:
+    """INCREMENTALでも、件数が前回の generate() でなく今回の処理を表すこと."""
+    generator = MazeGenerator(_confdict(11, PERFECT=True, INCREMENTAL=True))
+    generator.enable_stats()
+
+    # 土台を作る: 通路はすべて穴掘り、BFSは届くセルをすべて展開する
+    generator.generate()
+    stats = generator.stats
+    assert stats is not None and list(stats.stages)[0] == "incremental"
+    cells = 20 * 15 - b"".join(generator.maze).count(15)
+    assert (stats.carved, stats.broken, stats.expanded) == (cells - 1, 0,
+                                                            cells)
+
+    # 壁崩しの層を適用する: 土台はそのままで、経路更新の分だけ展開する
+    generator.perfect = False
+    generator.generate()
+    stats = generator.stats
+    assert stats is not None
+    assert stats.carved == cells - 1 and stats.broken > 0
+    assert 0 < stats.expanded < cells
+    assert f"BROKEN: {stats.broken}" in generator.report
+
+    # 層を外すだけなら探索はしない
+    generator.perfect = True
+    generator.generate()
+    stats = generator.stats
+    assert stats is not None
+    assert (stats.carved, stats.broken, stats.expanded) == (cells - 1, 0, 0)
+    assert generator.expanded == 0
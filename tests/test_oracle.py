@@ -0,0 +1,75 @@
+"""DistanceOracle のテスト."""
+
+import random
+from collections import deque
+import pytest
+from mazegen import MazeGenerator
+from mazegen.oracle import DistanceOracle
+
+WIDTH = 20
+HEIGHT = 15
+# 方角ごとの (壁ビット, インデックス差分)
+STEPS = ((1, -WIDTH), (2, 1), (4, WIDTH), (8, -1))
+
+
+def _maze(seed: int, perfect: bool) -> bytes:
+    """テスト用の迷路の壁データを返します."""
+    generator = MazeGenerator({
+        "WIDTH": WIDTH, "HEIGHT": HEIGHT, "ENTRY": (0, 0),
+        "EXIT": (WIDTH - 1, HEIGHT - 1), "SEED": seed, "PERFECT": perfect,
+        "DEFER_FILE_CHECK": True, "OUTPUT_FILE": "test_maze.txt"})
+    generator.generate()
+    return b"".join(generator.maze)
+
+
+def _bfs(maze: bytes, source: int) -> list[int]:
+    """source から各セルへの距離を求めます（届かないセルは-1）."""
+    dist = [-1] * len(maze)
+    dist[source] = 0
+    queue = deque([source])
+    while queue:
+        cur = queue.popleft()
+        for wall, step in STEPS:
+            nxt = cur + step
+            if not maze[cur] & wall and dist[nxt] == -1:
+                dist[nxt] = dist[cur] + 1
+                queue.append(nxt)
+    return dist
+
+
+@pytest.mark.parametrize("perfect", [True, False])
+def test_distance_and_path_match_bfs(perfect: bool) -> None:
+    """距離がBFSと一致し、経路が壁を通らずその距離の長さになること."""
+    rng = random.Random(0)
+    for seed in range(1, 6):
+        maze = _maze(seed, perfect)
+        oracle = DistanceOracle(maze, WIDTH, HEIGHT, max_sources=4)
+        assert oracle.is_tree == perfect
+
+        cells = [i for i in range(len(maze)) if maze[i] != 15]
+        for a in rng.sample(cells, 12):
+            expected = _bfs(maze, a)
+            for b in rng.sample(cells, 12) + [a]:
+                assert oracle.distance(a, b) == expected[b]
+                assert oracle.distance(b, a) == expected[b]
+                path = oracle.path(a, b)
+                assert path[0] == a and path[-1] == b
+                assert len(path) == expected[b] + 1
+                for cur, nxt in zip(path, path[1:]):
+                    assert any(cur + step == nxt and not maze[cur] & wall
+                               for wall, step in STEPS)
+
+
+@pytest.mark.parametrize("perfect", [True, False])
+def test_logo_cell_is_unreachable_in_both_modes(perfect: bool) -> None:
+    """'42'のセルは、自分自身への距離でも到達できないとされること."""
+    maze = _maze(1, perfect)
+    oracle = DistanceOracle(maze, WIDTH, HEIGHT)
+    logo = maze.index(15)
+    for a, b in ((logo, logo), (logo, 0), (0, logo)):
+        with pytest.raises(ValueError):
+            oracle.distance(a, b)
+        with pytest.raises(ValueError):
+            oracle.path(a, b)
+    with pytest.raises(ValueError):
+        oracle.distance(0, len(maze))
@@ -0,0 +1,51 @@
+"""最短経路の探索方法（SOLVER）のテスト."""
+
+from typing import Any
+import pytest
+from mazegen import MazeGenerator
+
+SEEDS = range(1, 31)
+# 方角ごとの (壁ビット, dx, dy)
+STEPS = {"N": (1, 0, -1), "E": (2, 1, 0), "S": (4, 0, 1), "W": (8, -1, 0)}
+
+
+def _confdict(seed: int, perfect: bool, solver: str) -> dict[str, Any]:
+    """出力ファイルを確認しない、テスト用の設定値を返します."""
+    return {"WIDTH": 20, "HEIGHT": 15, "ENTRY": (0, 0), "EXIT": (19, 14),
+            "SEED": seed, "PERFECT": perfect, "SOLVER": solver,
+            "DEFER_FILE_CHECK": True, "OUTPUT_FILE": "test_maze.txt"}
+
+
+def _walk(maze: bytes, width: int, way: list[str]) -> tuple[int, int]:
+    """ENTRYから壁を通らずに way をたどり、着いたセルを返します."""
+    x = y = 0
+    for direction in way:
+        wall, dx, dy = STEPS[direction]
+        assert not maze[y * width + x] & wall
+        x, y = x + dx, y + dy
+    return x, y
+
+
+@pytest.mark.parametrize("perfect", [True, False])
+@pytest.mark.parametrize("solver", ["bidirectional", "astar"])
+def test_solver_matches_bfs(solver: str, perfect: bool) -> None:
+    """BFS以外の探索方法でも、壁を通らない同じ長さの最短経路になること.
+
+    完全迷路では経路が1本しかないため、経路そのものも一致する。
+    """
+    for seed in SEEDS:
+        bfs = MazeGenerator(_confdict(seed, perfect, "bfs"))
+        bfs.generate()
+        generator = MazeGenerator(_confdict(seed, perfect, solver))
+        generator.generate()
+        maze = b"".join(generator.maze)
+        assert maze == b"".join(bfs.maze)
+
+        way = list(generator.way)
+        assert len(way) == len(bfs.way)
+        assert _walk(maze, 20, way) == (19, 14)
+        assert generator.path[0] == bfs.path[0]
+        assert generator.path[-1] == bfs.path[-1]
+        if perfect:
+            assert way == list(bfs.way)
+            assert generator.path == bfs.path
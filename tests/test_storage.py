@@ -0,0 +1,52 @@
+"""一次元バッファの迷路データ（GridView, グリッド展開）のテスト."""
+
+import pytest
+from mazegen import MazeGenerator
+from mazegen.storage import HAS_NUMPY, GridView, expand_grid, \
+    expand_window, _expand_grid_numpy, _expand_grid_python
+
+
+def _maze(seed: int = 1) -> MazeGenerator:
+    """テスト用の迷路を生成します."""
+    generator = MazeGenerator({"WIDTH": 20, "HEIGHT": 15, "EXIT": (19, 14),
+                               "SEED": seed, "PERFECT": False,
+                               "DEFER_FILE_CHECK": True,
+                               "OUTPUT_FILE": "test_maze.txt"})
+    generator.generate()
+    return generator
+
+
+def test_grid_view_matches_buffer() -> None:
+    """GridView の行と要素が、行優先のバッファと一致すること."""
+    buf = bytearray(range(12))
+    view = GridView(buf, 4, 3)
+
+    assert view.tolist() == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 10, 11]]
+    assert view[-1][0] == 8 and len(view) == 3
+    rows = [bytes(row) for row in view[1:]]
+    assert rows == [bytes(buf[4:8]), bytes(buf[8:])]
+    with pytest.raises(TypeError):
+        view[0][0] = 1
+    with pytest.raises(ValueError):
+        GridView(buf, 5, 3)
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="NumPy is not installed")
+def test_numpy_expansion_matches_python() -> None:
+    """NumPy版のグリッド展開が、純Python版と同じ結果になること."""
+    for seed in (1, 2, 3):
+        maze = bytearray(b"".join(_maze(seed).maze))
+        assert _expand_grid_numpy(maze, 20, 15) == \
+            _expand_grid_python(maze, 20, 15)
+
+
+def test_window_matches_full_grid() -> None:
+    """範囲だけを展開したグリッドが、全体を展開して切り取った結果と同じこと."""
+    maze = bytearray(b"".join(_maze().maze))
+    grid = expand_grid(maze, 20, 15)
+    gw = 41
+    for left, top, cols, rows in ((0, 0, 41, 31), (3, 5, 10, 7),
+                                  (40, 30, 1, 1), (17, 0, 24, 2)):
+        expected = b"".join(grid[y * gw + left:y * gw + left + cols]
+                            for y in range(top, top + rows))
+        assert expand_window(maze, 20, 15, left, top, cols, rows) == expected
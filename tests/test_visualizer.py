@@ -0,0 +1,198 @@
+"""迷路の描画（MazeView）のテスト."""
+
+import os
+import re
+import shutil
+from collections.abc import Iterator
+import pytest
+from mazegen import MazeEvent, MazeGenerator
+from src import visualizer_ascii
+from src.visualizer_ascii import MazeView
+
+# カーソル移動, 画面の消去, 以降の消去
+_ESCAPE = re.compile(r"\x1b\[(?:(\d+);(\d+)H|H\x1b\[2J|J)")
+
+
+class _Terminal:
+    """差分描画が使うエスケープシーケンスだけを解釈する、簡易的な端末."""
+
+    def __init__(self) -> None:
+        """空の画面を作ります."""
+        self.lines: list[list[str]] = []
+        self._row = 0
+        self._col = 0
+
+    def feed(self, text: str) -> None:
+        """出力を画面に反映します."""
+        pos = 0
+        for match in _ESCAPE.finditer(text):
+            self._write(text[pos:match.start()])
+            pos = match.end()
+            if match.group(1):
+                self._row = int(match.group(1)) - 1
+                self._col = int(match.group(2)) - 1
+            elif match.group(0) == "\x1b[J":
+                del self.lines[self._row + 1:]
+                if self._row < len(self.lines):
+                    del self.lines[self._row][self._col:]
+            else:
+                self.lines = []
+                self._row = self._col = 0
+        self._write(text[pos:])
+
+    def _write(self, text: str) -> None:
+        """カーソルの位置から文字を書き込みます."""
+        for char in text:
+            if char == "\n":
+                self._row += 1
+                self._col = 0
+                continue
+            while len(self.lines) <= self._row:
+                self.lines.append([])
+            line = self.lines[self._row]
+            line.extend(" " * (self._col + 1 - len(line)))
+            line[self._col] = char
+            self._col += 1
+
+    def screen(self) -> list[str]:
+        """空行を除いた画面の各行を返します."""
+        return [text for text in ("".join(line) for line in self.lines)
+                if text.strip()]
+
+
+def _view(generator: MazeGenerator, diff: bool) -> MazeView:
+    """エスケープシーケンスを含まない2文字の表示文字で描く MazeView を返します."""
+    view = MazeView(generator, diff=diff)
+    view._wall = "##"
+    view._start = "SS"
+    view._goal = "GG"
+    view._walk_path = ".."
+    view._forty_two = "42"
+    view._compile_glyphs()
+    return view
+
+
+def _generator(seed: int, width: int = 20,
+               height: int = 15) -> MazeGenerator:
+    """テスト用の迷路を生成します."""
+    generator = MazeGenerator({"WIDTH": width, "HEIGHT": height,
+                               "EXIT": (width - 1, height - 1),
+                               "SEED": seed, "PERFECT": False,
+                               "DEFER_FILE_CHECK": True,
+                               "OUTPUT_FILE": "test_maze.txt"})
+    generator.generate()
+    return generator
+
+
+@pytest.fixture(autouse=True)
+def _large_terminal(monkeypatch: pytest.MonkeyPatch) -> None:
+    """迷路とメニューが収まる大きさの端末として描画させます."""
+    monkeypatch.setattr(shutil, "get_terminal_size",
+                        lambda *args: os.terminal_size((200, 120)))
+
+
+def _full_screen(view: MazeView,
+                 capsys: pytest.CaptureFixture[str]) -> list[str]:
+    """差分描画を使わずに描いた画面を返します."""
+    fresh = _view(view._gen, diff=False)
+    fresh._show_path = view._show_path
+    fresh.draw()
+    return capsys.readouterr().out.splitlines()
+
+
+def test_diff_draw_matches_full_redraw(
+        capsys: pytest.CaptureFixture[str]) -> None:
+    """差分描画を重ねた画面が、毎回全体を描き直した画面と同じこと."""
+    generator = _generator(3)
+    view = _view(generator, diff=True)
+    terminal = _Terminal()
+    capsys.readouterr()
+
+    def keep() -> None:
+        pass
+
+    def regenerate() -> None:
+        generator.seed = 5
+        generator.generate()
+
+    redraws = 0
+    for change in (keep, view.toggle_path, keep, regenerate,
+                   view.toggle_path, view.toggle_path):
+        change()
+        capsys.readouterr()
+        view.draw()
+        out = capsys.readouterr().out
+        redraws += visualizer_ascii.CLEAR_SCREEN in out
+        terminal.feed(out)
+        assert terminal.screen() == [line for line in
+                                     _full_screen(view, capsys) if line]
+    # 最初の描画と、迷路全体が変わる再生成の時以外は差分だけで描いている
+    assert redraws <= 2
+
+
+def test_play_duration_limits_frames(monkeypatch: pytest.MonkeyPatch,
+                                     capsys: pytest.CaptureFixture[str]
+                                     ) -> None:
+    """duration を指定すると、fps x duration 程度のフレーム数で再生すること."""
+    generator = _generator(2, 42, 42)
+    expected = (b"".join(generator.maze), generator.way)
+    view = _view(generator, diff=False)
+    frames: list[int] = []
+    write_frame = view._write_frame
+
+    def count(rows: list[list[str]], lines: list[str]) -> None:
+        frames.append(len(lines))
+        write_frame(rows, lines)
+
+    monkeypatch.setattr(view, "_write_frame", count)
+    view.play(generator.generate_events(), fps=1000, duration=0.05)
+    capsys.readouterr()
+
+    # 50フレーム + 最後の draw() まで（間に合わないフレームは飛ばす）
+    assert 0 < len(frames) <= 51
+    assert (b"".join(generator.maze), generator.way) == expected
+
+
+def test_play_interrupt_finishes_maze(
+        capsys: pytest.CaptureFixture[str]) -> None:
+    """再生中に Ctrl-C を押しても、完成した迷路を描いて戻ること."""
+    generator = _generator(4)
+    expected = (b"".join(generator.maze), generator.way)
+    view = _view(generator, diff=False)
+
+    def interrupted() -> Iterator[MazeEvent]:
+        for i, event in enumerate(generator.generate_events()):
+            if i == 100:
+                raise KeyboardInterrupt
+            yield event
+
+    view.play(interrupted(), fps=1000)
+    last = capsys.readouterr().out.split("\n\n")[-2]
+
+    assert (b"".join(generator.maze), generator.way) == expected
+    assert last.splitlines() == _full_screen(view, capsys)[:-1]
+
+
+@pytest.mark.parametrize("show_path", [False, True])
+def test_viewport_matches_full_frame(capsys: pytest.CaptureFixture[str],
+                                     show_path: bool) -> None:
+    """ビューポートの描画が、全体の描画から同じ範囲を切り取った結果と同じこと."""
+    generator = _generator(6)
+    view = _view(generator, diff=False)
+    view._show_path = show_path
+    capsys.readouterr()
+    full = _full_screen(view, capsys)
+
+    for (cols, rows), (dx, dy) in (((10, 6), (3, 4)), ((41, 31), (0, 0)),
+                                   ((7, 5), (100, 100)), ((1, 1), (5, 0))):
+        view = _view(generator, diff=False)
+        view._show_path = show_path
+        view.set_viewport(cols, rows)
+        view.pan(dx, dy)
+        view.draw()
+        lines = capsys.readouterr().out.splitlines()[:-1]
+        # 範囲は迷路の中に収まるように補正される
+        left = min(dx, 41 - cols)
+        top = min(dy, 31 - rows)
+        assert lines == [line[2 * left:2 * (left + cols)]
+                         for line in full[top:top + rows]]